@@ -1,6 +1,7 @@
 # run_critique.py
 # import asyncio # No longer needed
 import os
+import sys
 import logging
 import json
 import datetime
@@ -32,6 +33,10 @@ def setup_logging():
                         filename=system_log_file,
                         filemode='w',
                         encoding='utf-8')
+    # LaTeX compilation progress is also shown on the console
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+    logging.getLogger('src.latex.utils.latex_compiler').addHandler(console_handler)
     logging.info("Root logging configured. System logs in logs/system.log")
 # -------------------------
 
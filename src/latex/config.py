@@ -49,7 +49,13 @@ DEFAULT_CONFIG = {
     "latex_engine": "pdflatex",
     "latex_args": ["-interaction=nonstopmode", "-halt-on-error"],
     "bibtex_run": True,
-    "latex_runs": 2,  # Number of LaTeX compilation passes
+    "latex_runs": 2,  # Number of LaTeX compilation passes (when not using latexmk)
+    "use_latexmk": True,  # Use latexmk when available to run only the passes needed
+    "pdf_cache": True,  # Reuse the PDF of an identical earlier build
+    "pdf_cache_dir": "",  # Defaults to ~/.cache/critique_council/latex
+    "pdf_cache_max_size_mb": 500,  # Oldest cached PDFs are removed beyond this size
+    "precompiled_format": "",  # Format file from LatexCompiler.precompile_preamble
+    "latex_memory": {},  # texmf.cnf memory parameters, e.g. {"extra_mem_top": 5000000}
     
     # MiKTeX configuration (Windows-specific)
     "miktex": {
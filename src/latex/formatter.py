@@ -9,6 +9,7 @@ import os
 import re
 import logging
 import datetime
+import functools
 from typing import Dict, Any, Optional, List, Union, Tuple
 
 # Import the global configuration loader
@@ -30,6 +31,12 @@ from .utils import FileManager, LatexCompiler
 
 logger = logging.getLogger(__name__)
 
+# Review content used when no peer review is available
+_NO_REVIEW_SENTINEL = "No peer review available for this analysis."
+
+# Runs of text separated by blank lines, matching the chunks of str.split('\n\n')
+_PARAGRAPH_RE = re.compile(r'(?:(?!\n\n).)+', re.DOTALL)
+
 
 class LatexFormatter:
     """
@@ -80,23 +87,10 @@ class LatexFormatter:
             'output_dir': output_dir
         })
         
-        # Initialize converters
-        self.markdown_converter = MarkdownToLatexConverter({
-            'katex_compatibility': self.config.get('katex_compatibility', True)
-        })
-        
-        self.math_formatter = MathFormatter({
-            'katex_compatibility': self.config.get('katex_compatibility', True)
-        })
-        
-        # Initialize processors
-        self.jargon_processor = JargonProcessor(
-            objectivity_level=self.config.get('scientific_objectivity_level', 'high')
-        )
-        
-        self.citation_processor = CitationProcessor(
-            output_dir=output_dir
-        )
+        # Converters and processors are created on first use, see the
+        # properties below, so that formatters that never format a document
+        # do not pay for their construction
+        self._output_dir = output_dir
         
         # Initialize LaTeX compiler if needed - pass the whole config
         # so that compiler can access MiKTeX specific settings
@@ -108,6 +102,54 @@ class LatexFormatter:
             logger.info("PDF compilation disabled")
             self.latex_compiler = None
     
+    @functools.cached_property
+    def markdown_converter(self) -> MarkdownToLatexConverter:
+        """
+        Get the markdown converter, creating it on first use.
+        
+        Returns:
+            The markdown converter instance for this formatter.
+        """
+        return MarkdownToLatexConverter({
+            'katex_compatibility': self.config.get('katex_compatibility', True)
+        })
+    
+    @functools.cached_property
+    def math_formatter(self) -> MathFormatter:
+        """
+        Get the math formatter, creating it on first use.
+        
+        Returns:
+            The math formatter instance for this formatter.
+        """
+        return MathFormatter({
+            'katex_compatibility': self.config.get('katex_compatibility', True)
+        })
+    
+    @functools.cached_property
+    def jargon_processor(self) -> JargonProcessor:
+        """
+        Get the jargon processor, creating it on first use.
+        
+        Returns:
+            The jargon processor instance for this formatter.
+        """
+        return JargonProcessor(
+            objectivity_level=self.config.get('scientific_objectivity_level', 'high')
+        )
+    
+    @functools.cached_property
+    def citation_processor(self) -> CitationProcessor:
+        """
+        Get the citation processor, creating it on first use.
+        
+        Returns:
+            The citation processor instance for this formatter.
+        """
+        return CitationProcessor(
+            output_dir=self._output_dir
+        )
+    
     def format_document(
         self, 
         original_content: str, 
@@ -177,18 +219,11 @@ class LatexFormatter:
             if 'review_content' in context:
                 context['review_content'] = self._process_content(context['review_content'])
             
-            # Read main template
+            # Render main template with context straight to the output file
             template_name = self.config.get('main_template')
-            logger.debug(f"Reading main template: {template_name}")
-            template_content = self.file_manager.read_template(template_name)
-            
-            # Render template with context
-            logger.debug("Rendering template with context.")
-            rendered_content = self.file_manager.render_template(template_content, context)
-            
-            # Write the output file
             output_filename = f"{output_filename_base}_{timestamp}.tex"
-            tex_file_path = self.file_manager.write_output_file(output_filename, rendered_content)
+            logger.debug(f"Rendering main template with context: {template_name}")
+            tex_file_path = self.file_manager.render_to_file(template_name, context, output_filename)
             
             # Copy required template files to output directory
             required_templates = ['preamble.tex']
@@ -261,10 +296,11 @@ class LatexFormatter:
         else:
             keywords = 'philosophical critique, analysis, peer review'
         
-        # Process original content
+        # Process original content, truncating before escaping so that only the
+        # retained excerpt is scanned and no escape sequence is cut in half
+        if len(original_content) > 1000:
+            original_content = original_content[:997] + '...'
         processed_original = self._escape_latex_chars(original_content)
-        if len(processed_original) > 1000:
-            processed_original = processed_original[:997] + '...'
         
         # Create context dictionary with template variables
         # If peer review is available, prioritize it as the main content
@@ -289,7 +325,7 @@ class LatexFormatter:
                 'abstract': abstract,
                 'original_content': processed_original,
                 'analysis_content': critique_report,
-                'review_content': "No peer review available for this analysis.",
+                'review_content': _NO_REVIEW_SENTINEL,
                 'include_bibliography': self.config.get('include_bibliography', True),
                 'keywords': keywords,
                 'using_peer_review': False  # Flag to indicate we're using critique report
@@ -317,10 +353,11 @@ class LatexFormatter:
         if abstract_match:
             return abstract_match.group(1).strip()
         
-        # If no explicit abstract, use the first paragraph (up to 500 chars)
-        paragraphs = [p for p in content.split('\n\n') if p.strip()]
-        if paragraphs:
-            first_para = paragraphs[0].strip()
+        # If no explicit abstract, use the first paragraph (up to 500 chars).
+        # Paragraphs are scanned lazily so only the leading ones are visited.
+        first_para = next((m.group(0) for m in _PARAGRAPH_RE.finditer(content) if m.group(0).strip()), None)
+        if first_para is not None:
+            first_para = first_para.strip()
             # Remove any headings
             first_para = re.sub(r'^#+ .*\n', '', first_para)
             # Truncate if too long
@@ -371,6 +408,10 @@ from multiple methodological perspectives.
         Returns:
             The processed content.
         """
+        # Nothing to transform for empty content or the no-review placeholder
+        if not content or content == _NO_REVIEW_SENTINEL:
+            return content
+        
         # Apply jargon processor to make content more scientific
         content = self.jargon_processor.process(content)
         
@@ -7,10 +7,57 @@ content, generating proper LaTeX citations and a BibTeX bibliography.
 
 import re
 import os
+import shutil
 import datetime
-from typing import Dict, Any, Optional, List, Set, Tuple
+import functools
+from typing import Dict, Any, Optional, List, Set, Tuple, Match
 from .content_processor import ContentProcessor
 
+# Path to the template bibliography file (assuming standard project structure).
+# The template ships with the package, so its presence is checked once.
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'templates')
+_TEMPLATE_BIBTEX_FILE = os.path.join(_TEMPLATE_DIR, 'bibliography.bib')
+_TEMPLATE_BIBTEX_EXISTS = os.path.exists(_TEMPLATE_BIBTEX_FILE)
+
+# Author names used when rewriting in-text citations: a run of letters and
+# whitespace, as in CITATION_PATTERNS.
+_AUTHOR_NAME = r'[A-Za-z\s]+'
+_YEAR = r'\d{4}[a-z]?'
+
+# In-text citations rewritten in a single pass: APA style (Author, Year) or
+# Author (Year). The two forms cannot overlap, so one alternation gives the
+# same result as substituting them one after the other.
+#
+# An Author (Year) match takes the whole run of letters and whitespace before
+# the year, so it can only start where such a run starts; the lookbehind stops
+# the engine from rescanning a run from every position inside it. The author
+# is always followed by exactly one whitespace character, since the greedy
+# author group leaves only the last one, so a single \s replaces \s+ and
+# avoids backtracking through runs of spaces.
+_CITATION_SUB_RE = re.compile(
+    r'\((?P<apa_author>' + _AUTHOR_NAME + r'),\s+(?P<apa_year>' + _YEAR + r')\)'
+    r'|(?<![A-Za-z\s])(?P<author>' + _AUTHOR_NAME + r')\s\((?P<year>' + _YEAR + r')\)'
+)
+
+# Heading consisting of just "References" that ends the body of the document
+_REFERENCES_HEADER_RE = re.compile(r'^#{1,3}[^\S\n]*References[^\S\n]*$', re.MULTILINE | re.IGNORECASE)
+
+# Lines after which bibliography entries are parsed: a separator or a References heading
+_BIBLIOGRAPHY_START_RE = re.compile(r'^-{3,}$|^#{1,3}[^\S\n]+References', re.MULTILINE | re.IGNORECASE)
+
+# Single line of content, used to walk lines without building a list of them
+_LINE_RE = re.compile(r'^[^\n]*$', re.MULTILINE)
+
+# Bibliography entries: "Last, First. (Year). Title. Publication." and "Author. (Year). Title"
+_APA_ENTRY_RE = re.compile(r'([A-Za-z\s-]+),\s+([A-Za-z\s-]+)\.\s+\((\d{4}[a-z]?)\)\.\s+([^\.]+)\.(?:\s+([^\.]+))?')
+_SIMPLE_ENTRY_RE = re.compile(r'([A-Za-z\s]+)\.\s+\((\d{4}[a-z]?)\)\.\s+([^\.]+)')
+
+# Publication names that mark an entry as an article rather than a book
+_ARTICLE_VENUE_RE = re.compile(r'journal|proceedings', re.IGNORECASE)
+
+# Characters stripped from last names when building citation keys
+_NON_WORD_RE = re.compile(r'[^\w]')
+
 
 class CitationProcessor(ContentProcessor):
     """
@@ -24,9 +71,7 @@ class CitationProcessor(ContentProcessor):
     CITATION_PATTERNS = [
         # APA style in-text citations
         r'\(([A-Za-z\s]+),\s+(\d{4}[a-z]?)\)',
-        # Author year format
-        r'([A-Za-z\s]+)\s+\((\d{4}[a-z]?)\)',
-        # References in the format: Author (Year)
+        # Author year format, also covers references written as Author (Year)
         r'([A-Za-z\s]+)\s+\((\d{4}[a-z]?)\)',
         # Formal bibliography entries
         r'([A-Za-z\s-]+)\.\s+\((\d{4}[a-z]?)\)\.\s+([^\.]+)\.'
@@ -42,6 +87,9 @@ class CitationProcessor(ContentProcessor):
         'misc': '@misc'
     }
     
+    # Optional BibTeX fields written after the required ones, in this order
+    OPTIONAL_BIBTEX_FIELDS = ('publisher', 'journal', 'volume', 'number', 'pages', 'url')
+    
     def __init__(self, output_dir: str = "latex_output"):
         """
         Initialize the CitationProcessor.
@@ -51,7 +99,6 @@ class CitationProcessor(ContentProcessor):
         """
         self._output_dir = output_dir
         self._citations = {}  # Dictionary to store extracted citations
-        self._compiled_patterns = [re.compile(pattern) for pattern in self.CITATION_PATTERNS]
         
     def process(self, content: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -88,22 +135,29 @@ class CitationProcessor(ContentProcessor):
         Args:
             content: The input content to extract citations from.
         """
-        lines = content.split('\n')
+        # First pass: extract formal bibliography entries from the lines that
+        # follow the first separator or References heading
+        bibliography_match = _BIBLIOGRAPHY_START_RE.search(content)
+        if bibliography_match:
+            line_end = content.find('\n', bibliography_match.end())
+            lines = _LINE_RE.finditer(content, line_end + 1) if line_end != -1 else ()
+            for line_match in lines:
+                line = line_match.group(0)
+                if _BIBLIOGRAPHY_START_RE.match(line):
+                    continue
+                    
+                if line.strip():
+                    # Try to parse as a bibliography entry
+                    self._parse_bibliography_entry(line)
         
-        # First pass: extract formal bibliography entries
-        references_section = False
-        for line in lines:
-            if re.search(r'^-{3,}$', line) or re.search(r'^#{1,3}\s+References', line, re.IGNORECASE):
-                references_section = True
-                continue
-                
-            if references_section and line.strip():
-                # Try to parse as a bibliography entry
-                self._parse_bibliography_entry(line)
+        # Only scan the body for in-text citations; the References section was
+        # parsed above and would otherwise yield spurious keys
+        references_match = _REFERENCES_HEADER_RE.search(content)
+        body = content[:references_match.start()] if references_match else content
         
         # Second pass: extract in-text citations
-        for pattern in self._compiled_patterns:
-            matches = pattern.findall(content)
+        for pattern in _COMPILED_CITATION_PATTERNS:
+            matches = pattern.findall(body)
             for match in matches:
                 if len(match) >= 2:
                     author, year = match[0], match[1]
@@ -126,7 +180,7 @@ class CitationProcessor(ContentProcessor):
             line: The bibliography entry line to parse.
         """
         # Check for APA style reference line
-        apa_match = re.search(r'([A-Za-z\s-]+),\s+([A-Za-z\s-]+)\.\s+\((\d{4}[a-z]?)\)\.\s+([^\.]+)\.(?:\s+([^\.]+))?', line)
+        apa_match = _APA_ENTRY_RE.search(line)
         if apa_match:
             last_name = apa_match.group(1).strip()
             first_name = apa_match.group(2).strip()
@@ -135,7 +189,7 @@ class CitationProcessor(ContentProcessor):
             publication = apa_match.group(5).strip() if apa_match.group(5) else ""
             
             # Determine type based on content
-            ref_type = 'article' if re.search(r'journal|proceedings', publication, re.IGNORECASE) else 'book'
+            ref_type = 'article' if _ARTICLE_VENUE_RE.search(publication) else 'book'
             
             cite_key = self._generate_cite_key(f"{last_name}", year)
             self._citations[cite_key] = {
@@ -148,7 +202,7 @@ class CitationProcessor(ContentProcessor):
             return
             
         # Check for simple author (year) entry
-        simple_match = re.search(r'([A-Za-z\s]+)\.\s+\((\d{4}[a-z]?)\)\.\s+([^\.]+)', line)
+        simple_match = _SIMPLE_ENTRY_RE.search(line)
         if simple_match:
             author = simple_match.group(1).strip()
             year = simple_match.group(2)
@@ -162,10 +216,15 @@ class CitationProcessor(ContentProcessor):
                 'type': 'misc'
             }
             
-    def _generate_cite_key(self, author: str, year: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_cite_key(author: str, year: str) -> str:
         """
         Generate a citation key from author and year.
         
+        Results are memoized since the same citation usually appears several
+        times in a document.
+        
         Args:
             author: The author of the citation.
             year: The publication year.
@@ -176,7 +235,7 @@ class CitationProcessor(ContentProcessor):
         # Extract last name from author
         author = author.strip()
         last_name = author.split(',')[0] if ',' in author else author.split()[-1]
-        last_name = re.sub(r'[^\w]', '', last_name)
+        last_name = _NON_WORD_RE.sub('', last_name)
         
         return f"{last_name.lower()}{year}"
     
@@ -190,24 +249,24 @@ class CitationProcessor(ContentProcessor):
         Returns:
             The processed content with LaTeX cite commands.
         """
-        processed_content = content
-        
-        # Replace APA style citations: (Author, Year)
-        processed_content = re.sub(
-            r'\(([A-Za-z\s]+),\s+(\d{4}[a-z]?)\)',
-            lambda m: r'\cite{' + self._generate_cite_key(m.group(1), m.group(2)) + '}',
-            processed_content
-        )
+        return _CITATION_SUB_RE.sub(self._replace_citation, content)
+    
+    def _replace_citation(self, match: Match) -> str:
+        """
+        Build the LaTeX cite command for a single in-text citation match.
         
-        # Replace Author (Year) citations
-        processed_content = re.sub(
-            r'([A-Za-z\s]+)\s+\((\d{4}[a-z]?)\)',
-            lambda m: r'\citeauthor{' + self._generate_cite_key(m.group(1), m.group(2)) + '} ' + 
-                     r'(\citeyear{' + self._generate_cite_key(m.group(1), m.group(2)) + '})',
-            processed_content
-        )
+        Args:
+            match: A match of the combined in-text citation pattern.
+            
+        Returns:
+            \\cite for APA style citations, \\citeauthor and \\citeyear for
+            Author (Year) citations.
+        """
+        if match.group('apa_author') is not None:
+            return r'\cite{' + self._generate_cite_key(match.group('apa_author'), match.group('apa_year')) + '}'
         
-        return processed_content
+        cite_key = self._generate_cite_key(match.group('author'), match.group('year'))
+        return r'\citeauthor{' + cite_key + '} ' + r'(\citeyear{' + cite_key + '})'
     
     def _generate_bibtex_file(self, output_dir: str) -> None:
         """
@@ -222,21 +281,18 @@ class CitationProcessor(ContentProcessor):
         os.makedirs(output_dir, exist_ok=True)
         output_bibtex_file = os.path.join(output_dir, 'bibliography.bib')
         
-        # Path to the template bibliography file (assuming standard project structure)
-        template_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates')
-        template_bibtex_file = os.path.join(template_dir, 'bibliography.bib')
+        template_bibtex_file = _TEMPLATE_BIBTEX_FILE
         
         # Check if template file exists
-        if os.path.exists(template_bibtex_file):
+        if _TEMPLATE_BIBTEX_EXISTS:
             # Copy the template bibliography file to the output directory
             try:
-                with open(template_bibtex_file, 'r', encoding='utf-8') as source_file:
-                    template_content = source_file.read()
-                
-                with open(output_bibtex_file, 'w', encoding='utf-8') as target_file:
+                with open(output_bibtex_file, 'wb') as target_file:
                     # Add a timestamp comment at the top
-                    target_file.write(f"% Bibliography file copied from template on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                    target_file.write(template_content)
+                    target_file.write(f"% Bibliography file copied from template on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n".encode('utf-8'))
+                    # Stream the template bytes without decoding them
+                    with open(template_bibtex_file, 'rb') as source_file:
+                        shutil.copyfileobj(source_file, target_file, 1 << 20)
                 
                 print(f"Bibliography copied from template to {output_bibtex_file}")
                 return
@@ -245,33 +301,28 @@ class CitationProcessor(ContentProcessor):
         
         # Fallback to the old method if template file doesn't exist or copying fails
         print("Bibliography template not found or copy failed. Generating bibliography from extracted citations.")
-        with open(output_bibtex_file, 'w', encoding='utf-8') as f:
-            f.write(f"% Bibliography file generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        parts = [f"% Bibliography file generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"]
+        
+        for cite_key, citation in self._citations.items():
+            entry_type = self.REFERENCE_TYPES.get(citation.get('type', 'misc'), '@misc')
             
-            for cite_key, citation in self._citations.items():
-                entry_type = self.REFERENCE_TYPES.get(citation.get('type', 'misc'), '@misc')
-                f.write(f"{entry_type}{{{cite_key},\n")
-                
-                # Write required fields
-                f.write(f"  author = {{{citation['author']}}},\n")
-                f.write(f"  year = {{{citation['year']}}},\n")
-                f.write(f"  title = {{{citation['title']}}},\n")
-                
-                # Write optional fields if available
-                if 'publisher' in citation:
-                    f.write(f"  publisher = {{{citation['publisher']}}},\n")
-                if 'journal' in citation:
-                    f.write(f"  journal = {{{citation['journal']}}},\n")
-                if 'volume' in citation:
-                    f.write(f"  volume = {{{citation['volume']}}},\n")
-                if 'number' in citation:
-                    f.write(f"  number = {{{citation['number']}}},\n")
-                if 'pages' in citation:
-                    f.write(f"  pages = {{{citation['pages']}}},\n")
-                if 'url' in citation:
-                    f.write(f"  url = {{{citation['url']}}},\n")
-                
-                f.write("}\n\n")
+            # Required fields
+            parts.append(
+                f"{entry_type}{{{cite_key},\n"
+                f"  author = {{{citation['author']}}},\n"
+                f"  year = {{{citation['year']}}},\n"
+                f"  title = {{{citation['title']}}},\n"
+            )
+            
+            # Optional fields if available
+            for field in self.OPTIONAL_BIBTEX_FIELDS:
+                if field in citation:
+                    parts.append(f"  {field} = {{{citation[field]}}},\n")
+            
+            parts.append("}\n\n")
+        
+        with open(output_bibtex_file, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            f.write(''.join(parts))
     
     @property
     def name(self) -> str:
@@ -292,3 +343,7 @@ class CitationProcessor(ContentProcessor):
             The processor description.
         """
         return "Handles citations and generates a BibTeX bibliography"
+
+
+# In-text citation patterns, compiled once at import rather than per instance
+_COMPILED_CITATION_PATTERNS = tuple(re.compile(pattern) for pattern in CitationProcessor.CITATION_PATTERNS)
@@ -6,9 +6,147 @@ language into more objective, scientific terminology.
 """
 
 import re
-from typing import Dict, Any, Optional, List, Tuple, Pattern
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Set, Tuple, Pattern, Union, Mapping
 from .content_processor import ContentProcessor
 
+# Characters that IGNORECASE matching equates with an ASCII letter but that
+# str.lower() does not map to it (dotted/dotless i and long s). Dotted capital
+# I is also the only character whose lowercase form is longer than itself.
+_CASELESS_SPECIAL_CHARS = ("\u0130", "\u0131", "\u017f")
+
+# Escape sequences in a regex pattern, which must keep their case
+_REGEX_ESCAPE_RE = re.compile(r'(\\.)')
+
+# Regex metacharacters ending the literal prefix of a pattern
+_REGEX_META_CHARS = set("\\()[]{}.*+?|^$")
+
+
+def _alternation_options(pattern: str) -> Optional[List[str]]:
+    """
+    Split a pattern starting with a flat non-capturing alternation into its options.
+    
+    Args:
+        pattern: The regex pattern to split.
+        
+    Returns:
+        The options of the leading alternation, with the rest of the pattern
+        dropped, [pattern] for a pattern without one, or None if the
+        alternation is not flat.
+    """
+    if not pattern.startswith('(?:'):
+        return [pattern]
+    end = pattern.find(')')
+    body = pattern[3:end]
+    if end == -1 or '(' in body:
+        return None
+    return body.split('|')
+
+
+def _leading_chars(pattern: str) -> Optional[Set[str]]:
+    """
+    Get the lowercase characters a replacement pattern can start with.
+    
+    Only handles patterns starting with a letter or with a flat non-capturing
+    alternation of words, which covers the JargonProcessor replacement tables.
+    
+    Args:
+        pattern: The regex pattern to inspect.
+        
+    Returns:
+        The set of possible leading characters, or None if they cannot be determined.
+    """
+    options = _alternation_options(pattern)
+    if options is None:
+        return None
+    
+    chars = set()
+    for option in options:
+        if not option or not option[0].isalpha():
+            return None
+        chars.add(option[0].lower())
+    return chars
+
+
+def _literal_prefixes(pattern: str) -> Optional[List[str]]:
+    """
+    Get the lowercase literal text every match of a replacement pattern starts with.
+    
+    Like _leading_chars, only handles patterns starting with a letter or with a
+    flat non-capturing alternation of words, after an optional word boundary.
+    
+    Args:
+        pattern: The regex pattern to inspect.
+        
+    Returns:
+        The possible literal prefixes, or None if they cannot be determined.
+    """
+    if pattern.startswith(r'\b'):
+        pattern = pattern[2:]
+    options = _alternation_options(pattern)
+    if options is None:
+        return None
+    
+    prefixes = []
+    for option in options:
+        end = next((i for i, char in enumerate(option) if char in _REGEX_META_CHARS), len(option))
+        if end == 0 or not option[0].isalpha():
+            return None
+        prefixes.append(option[:end].lower())
+    return prefixes
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """
+    Lowercase the literal text of a regex pattern, leaving escapes untouched.
+    
+    Args:
+        pattern: The regex pattern to lowercase.
+        
+    Returns:
+        A pattern matching the lowercased form of what the original matched
+        case-insensitively.
+    """
+    return ''.join(
+        part if i % 2 else part.lower()
+        for i, part in enumerate(_REGEX_ESCAPE_RE.split(pattern))
+    )
+
+
+def _fuse_group(group_names: List[str], patterns: List[str]) -> str:
+    """
+    Combine one kind of replacement patterns into a guarded alternation.
+    
+    A word boundary shared by every pattern is hoisted out of the alternation,
+    and when the possible leading characters are known the alternation is
+    preceded by a lookahead on them, so the regex engine only tries the
+    individual entries at positions where one of them can start.
+    
+    Args:
+        group_names: Names of the capturing groups wrapping each pattern.
+        patterns: The regex patterns, in order of precedence.
+        
+    Returns:
+        The combined regex source.
+    """
+    prefix = ''
+    if all(pattern.startswith(r'\b') for pattern in patterns):
+        prefix = r'\b'
+        patterns = [pattern[2:] for pattern in patterns]
+    
+    leading = set()
+    for pattern in patterns:
+        chars = _leading_chars(pattern)
+        if chars is None:
+            leading = None
+            break
+        leading |= chars
+    if leading:
+        prefix += f"(?=[{''.join(sorted(leading))}])"
+    
+    return prefix + "(?:" + "|".join(f"(?P<{name}>{pattern})" for name, pattern in zip(group_names, patterns)) + ")"
+
 
 class JargonProcessor(ContentProcessor):
     """
@@ -102,39 +240,10 @@ class JargonProcessor(ContentProcessor):
                               Options: "low", "medium", "high"
         """
         self._objectivity_level = objectivity_level
-        self._compiled_patterns = self._compile_patterns()
-        self._compiled_perspective_patterns = [(re.compile(pattern, re.IGNORECASE), replacement) 
-                                             for pattern, replacement in self.PERSPECTIVE_REPLACEMENTS]
-        self._compiled_section_patterns = {re.compile(pattern, re.IGNORECASE): replacement 
-                                         for pattern, replacement in self.SECTION_REPLACEMENTS.items()}
-    
-    def _compile_patterns(self) -> Dict[Pattern, str]:
-        """
-        Compile regex patterns for jargon replacement.
         
-        Returns:
-            Dictionary of compiled patterns to replacement strings.
-        """
-        patterns = {}
-        
-        # Only include a subset of replacements for lower objectivity levels
-        if self._objectivity_level == "low":
-            # Just replace the most obvious philosophical jargon
-            subset = {k: v for k, v in self.JARGON_REPLACEMENTS.items() 
-                     if any(term in k for term in ["teleology", "noumena", "synthetic", "efficient cause"])}
-        elif self._objectivity_level == "medium":
-            # Replace philosophical jargon and some perspective language
-            subset = {k: v for k, v in self.JARGON_REPLACEMENTS.items() 
-                     if "would" not in k and "I " not in k}
-        else:
-            # High objectivity - use all replacements
-            subset = self.JARGON_REPLACEMENTS
-            
-        # Compile all the patterns
-        for pattern, replacement in subset.items():
-            patterns[re.compile(pattern, re.IGNORECASE)] = replacement
-            
-        return patterns
+        self._fused_passes = _FUSED_PASSES.get(objectivity_level) or _get_fused_passes(
+            objectivity_level, _includes_perspective(objectivity_level)
+        )
     
     def process(self, content: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -147,25 +256,39 @@ class JargonProcessor(ContentProcessor):
         Returns:
             The processed content with philosophical jargon replaced.
         """
-        processed_content = content
+        # Replace section titles, then jargon and, for medium and high
+        # objectivity, first-person perspective with third-person scientific
+        # voice. An objectivity level provided in context selects both the
+        # jargon subset and the perspective replacements.
+        fused_passes = self._fused_passes
+        if context:
+            objectivity_level = context.get("scientific_objectivity_level", self._objectivity_level)
+            if objectivity_level != self._objectivity_level:
+                fused_passes = _get_fused_passes(
+                    objectivity_level, _includes_perspective(objectivity_level)
+                )
         
-        # Override objectivity level if provided in context
-        objectivity_level = context.get("scientific_objectivity_level", self._objectivity_level) if context else self._objectivity_level
+        # Lowercasing these would not line up with IGNORECASE matching
+        if any(char in content for char in _CASELESS_SPECIAL_CHARS):
+            for fused, _, replacements, _ in fused_passes:
+                content = _rewrite(content, content, fused, replacements)
+            return content
         
-        # Replace section titles
-        for pattern, replacement in self._compiled_section_patterns.items():
-            processed_content = pattern.sub(replacement, processed_content)
-        
-        # Replace jargon with scientific terminology
-        for pattern, replacement in self._compiled_patterns.items():
-            processed_content = pattern.sub(replacement, processed_content)
+        lowered = content.lower()
+        for _, lowercase_fused, replacements, triggers in fused_passes:
+            # Most documents contain no jargon at all; a few substring scans over
+            # the lowercased content rule that out far faster than the regex can
+            if triggers is not None and not any(trigger in lowered for trigger in triggers):
+                continue
             
-        # Replace first-person perspective with third-person scientific voice
-        if objectivity_level in ["medium", "high"]:
-            for pattern, replacement in self._compiled_perspective_patterns:
-                processed_content = pattern.sub(replacement, processed_content)
+            # Matching the lowercased content case-sensitively is cheaper than
+            # IGNORECASE matching; replacements are spliced into the original
+            processed = _rewrite(content, lowered, lowercase_fused, replacements)
+            if processed != content:
+                content = processed
+                lowered = content.lower()
         
-        return processed_content
+        return content
     
     @property
     def name(self) -> str:
@@ -186,3 +309,184 @@ class JargonProcessor(ContentProcessor):
             The processor description.
         """
         return "Replaces philosophical jargon with scientific terminology"
+
+
+def _rewrite(content: str, lowered: str, fused: Pattern, replacements: Mapping[str, Union[str, Tuple[Union[str, int], ...]]]) -> str:
+    """
+    Apply the replacements found by matching a fused pattern.
+    
+    Matches are searched for in the lowered text, which must have the same
+    length as the content, while unmatched and captured text is taken from
+    the content so its case is preserved.
+    
+    Args:
+        content: The content to process.
+        lowered: The text to match against, the content itself or its lowercase form.
+        fused: The fused pattern to match with.
+        replacements: Mapping of group names to replacements.
+        
+    Returns:
+        The content with replacements applied.
+    """
+    parts = []
+    last = 0
+    for match in fused.finditer(lowered):
+        start, end = match.span()
+        parts.append(content[last:start])
+        replacement = replacements[match.lastgroup]
+        if isinstance(replacement, str):
+            parts.append(replacement)
+        else:
+            # Captured text is rewritten as well, as it would have been had
+            # the replacements been applied one after the other
+            for part in replacement:
+                if isinstance(part, str):
+                    parts.append(part)
+                else:
+                    group_start, group_end = match.span(part)
+                    parts.append(_rewrite(
+                        content[group_start:group_end], lowered[group_start:group_end], fused, replacements
+                    ))
+        last = end
+    parts.append(content[last:])
+    return ''.join(parts)
+
+
+def _includes_perspective(objectivity_level: str) -> bool:
+    """
+    Check whether an objectivity level rewrites first-person perspective.
+    
+    Args:
+        objectivity_level: Level of scientific objectivity to apply.
+        
+    Returns:
+        True for medium and high objectivity, False otherwise.
+    """
+    return objectivity_level in ["medium", "high"]
+
+
+def _fuse_pass(groups: List[List[Tuple[str, str]]]) -> Tuple[Pattern, Pattern, Mapping[str, Union[str, Tuple[Union[str, int], ...]]], Optional[Tuple[str, ...]]]:
+    """
+    Compile groups of replacements into a single alternation.
+    
+    Each replacement is wrapped in its own named group so the content is
+    rewritten in one pass, with the matched group selecting the replacement.
+    Entries keep the order in which the replacements used to be applied, so
+    earlier ones take precedence where alternatives match at the same
+    position. Each group of replacements is guarded as a whole (see
+    _fuse_group) so that most positions in the document are rejected without
+    trying every entry.
+    
+    A case-sensitive variant of the alternation is compiled from the
+    lowercased patterns, for matching against lowercased content.
+    
+    The literal text that any match must start with is collected as well, so
+    content without any of it can be skipped without running the regex.
+    
+    Args:
+        groups: Lists of (pattern, replacement) pairs, in order of precedence.
+    
+    Returns:
+        Tuple of (compiled alternation, lowercase alternation, read-only
+        mapping of group names to replacements, lowercase trigger substrings
+        or None if they cannot be determined).
+    """
+    entries = []
+    alternatives = []
+    lowercase_alternatives = []
+    for group in groups:
+        if not group:
+            continue
+        group_names = [f"r{len(entries) + i}" for i in range(len(group))]
+        entries.extend(zip(group_names, group))
+        patterns = [pattern for pattern, _ in group]
+        alternatives.append(_fuse_group(group_names, patterns))
+        lowercase_alternatives.append(_fuse_group(group_names, [_lowercase_pattern(pattern) for pattern in patterns]))
+    
+    fused = re.compile("|".join(alternatives), re.IGNORECASE)
+    lowercase_fused = re.compile("|".join(lowercase_alternatives))
+    
+    # Backreferences in a replacement refer to the groups of its own pattern,
+    # which follow the wrapping named group in the fused pattern. Replacements
+    # with backreferences are stored as a tuple alternating literal text and
+    # absolute group numbers; plain replacements are stored as strings.
+    replacements = {}
+    for name, (_, replacement) in entries:
+        parts = re.split(r'\\(\d+)', replacement)
+        if len(parts) == 1:
+            replacements[name] = replacement
+            continue
+        offset = fused.groupindex[name]
+        replacements[name] = tuple(
+            part if i % 2 == 0 else offset + int(part)
+            for i, part in enumerate(parts)
+        )
+    
+    triggers = set()
+    for _, (pattern, _) in entries:
+        prefixes = _literal_prefixes(pattern)
+        if prefixes is None:
+            triggers = None
+            break
+        triggers.update(prefixes)
+    if triggers is not None:
+        # A trigger containing a shorter one is implied by it
+        triggers = tuple(sorted(
+            trigger for trigger in triggers
+            if not any(other != trigger and other in trigger for other in triggers)
+        ))
+    
+    return fused, lowercase_fused, MappingProxyType(replacements), triggers
+
+
+@functools.lru_cache(maxsize=None)
+def _get_fused_passes(objectivity_level: str, include_perspective: bool) -> Tuple[Tuple[Pattern, Pattern, Mapping[str, Union[str, Tuple[Union[str, int], ...]]], Optional[Tuple[str, ...]]], ...]:
+    """
+    Compile the replacements for an objectivity level into fused passes.
+    
+    Section titles are replaced in a pass of their own, before jargon and
+    (optionally) perspective replacements, which share a second pass. A
+    jargon entry starting earlier in the text would otherwise win over an
+    overlapping section title, e.g. "Kantian Perspective-Specific
+    Contributions", which the section title replacement rewrites first.
+    
+    Results are cached and shared by all JargonProcessor instances, so the
+    returned mappings are read-only.
+    
+    Args:
+        objectivity_level: Level of scientific objectivity to apply.
+        include_perspective: Whether to include the first-person perspective
+                             replacements.
+    
+    Returns:
+        The passes to apply in order, each as returned by _fuse_pass.
+    """
+    # Only include a subset of replacements for lower objectivity levels
+    if objectivity_level == "low":
+        # Just replace the most obvious philosophical jargon
+        subset = {k: v for k, v in JargonProcessor.JARGON_REPLACEMENTS.items() 
+                 if any(term in k for term in ["teleology", "noumena", "synthetic", "efficient cause"])}
+    elif objectivity_level == "medium":
+        # Replace philosophical jargon and some perspective language
+        subset = {k: v for k, v in JargonProcessor.JARGON_REPLACEMENTS.items() 
+                 if "would" not in k and "I " not in k}
+    else:
+        # High objectivity - use all replacements
+        subset = JargonProcessor.JARGON_REPLACEMENTS
+    
+    groups = [list(subset.items())]
+    if include_perspective:
+        groups.append(JargonProcessor.PERSPECTIVE_REPLACEMENTS)
+    
+    return (
+        _fuse_pass([list(JargonProcessor.SECTION_REPLACEMENTS.items())]),
+        _fuse_pass(groups),
+    )
+
+
+# Fused patterns for the known objectivity levels, compiled once at import so
+# constructing a JargonProcessor does no regex compilation
+_FUSED_PASSES = MappingProxyType({
+    objectivity_level: _get_fused_passes(objectivity_level, _includes_perspective(objectivity_level))
+    for objectivity_level in ("low", "medium", "high")
+})
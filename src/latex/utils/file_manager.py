@@ -5,13 +5,121 @@ This module provides file handling utilities for reading templates and writing
 output files for LaTeX document generation.
 """
 
+import io
 import os
+import re
 import shutil
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Union, TextIO
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=32)
+def _get_template_re(keys: frozenset) -> re.Pattern:
+    """
+    Compile the pattern matching the placeholders and conditional sections of a context.
+    
+    Only the keys of the context are matched, as $key$ placeholders and as
+    $if(key)$...$endif(key)$ sections; anything else in a template is left as
+    is. Renders against the same set of keys reuse the compiled pattern.
+    
+    Args:
+        keys: The keys of the rendering context.
+        
+    Returns:
+        The compiled template pattern.
+    """
+    alternation = "|".join(re.escape(key) for key in sorted(keys))
+    return re.compile(
+        rf'\$if\((?P<condition>{alternation})\)\$(?P<body>.*?)\$endif\((?P=condition)\)\$'
+        rf'|\$(?P<key>{alternation})\$',
+        re.DOTALL
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _read_template_file(template_path: str, mtime_ns: int) -> str:
+    """
+    Read and cache the content of a template file.
+    
+    Templates do not change between documents, so batch runs only pay for the
+    open/read once per template. The modification time is part of the cache
+    key, so a template edited on disk is read again.
+    
+    Args:
+        template_path: The full path to the template file.
+        mtime_ns: The modification time of the file in nanoseconds.
+        
+    Returns:
+        The content of the template file.
+    """
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _render_to(template_re: re.Pattern, template_content: str, context: Dict[str, Any], sink: TextIO) -> None:
+    """
+    Write a template rendered with a compiled template pattern to a sink.
+    
+    Args:
+        template_re: The pattern from _get_template_re for the context keys.
+        template_content: The template content to render.
+        context: The context dictionary with values to replace placeholders.
+        sink: The text stream to write the rendered template to.
+    """
+    last = 0
+    for match in template_re.finditer(template_content):
+        sink.write(template_content[last:match.start()])
+        key = match.group('key')
+        if key is not None:
+            # Simple placeholder replacement
+            sink.write(str(context[key]))
+        elif context[match.group('condition')]:
+            # Conditional section: kept blocks are rendered, others dropped
+            _render_to(template_re, match.group('body'), context, sink)
+        last = match.end()
+    sink.write(template_content[last:])
+
+
+def _same_contents(source_path: str, dest_path: str) -> bool:
+    """
+    Check whether a destination file holds exactly the bytes of a source file.
+    
+    Args:
+        source_path: The path to the source file.
+        dest_path: The path to the destination file.
+        
+    Returns:
+        True if both files exist with equal contents.
+    """
+    try:
+        if os.stat(source_path).st_size != os.stat(dest_path).st_size:
+            return False
+        with open(source_path, 'rb') as source_file, open(dest_path, 'rb') as dest_file:
+            return source_file.read() == dest_file.read()
+    except FileNotFoundError:
+        return False
+
+
+def _copy_file(source_path: str, dest_path: str, preserve_metadata: bool) -> None:
+    """
+    Copy a file, with or without its metadata.
+    
+    shutil.copyfile uses os.copy_file_range/sendfile where available, while
+    shutil.copy2 additionally copies permissions and timestamps.
+    
+    Args:
+        source_path: The path to the source file.
+        dest_path: The path to the destination file.
+        preserve_metadata: Whether to copy permissions and timestamps as well.
+    """
+    if preserve_metadata:
+        shutil.copy2(source_path, dest_path)
+    else:
+        shutil.copyfile(source_path, dest_path)
+
 
 class FileManager:
     """
@@ -32,6 +140,10 @@ class FileManager:
         self.template_dir = self.config.get('template_dir', os.path.join(os.path.dirname(os.path.dirname(__file__)), 'templates'))
         self.output_dir = self.config.get('output_dir', 'latex_output')
         
+        # Directory prefixes resolved once, so per-file paths are a concatenation
+        self._template_prefix = os.path.join(os.fspath(self.template_dir), '')
+        self._output_prefix = os.path.join(os.fspath(self.output_dir), '')
+        
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
     
@@ -48,19 +160,29 @@ class FileManager:
         Raises:
             FileNotFoundError: If the template file doesn't exist.
         """
-        template_path = os.path.join(self.template_dir, template_name)
+        template_path = self._template_prefix + template_name
         
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return _read_template_file(template_path, os.stat(template_path).st_mtime_ns)
         except FileNotFoundError:
             logger.error(f"Template file not found: {template_path}")
             raise FileNotFoundError(f"Template file not found: {template_path}")
     
+    @staticmethod
+    def invalidate_template_cache() -> None:
+        """
+        Clear the cache of template contents shared by all file managers.
+        """
+        _read_template_file.cache_clear()
+    
     def write_output_file(self, file_name: str, content: str) -> str:
         """
         Write content to an output file in the output directory.
         
+        The content is encoded to UTF-8 once and written in binary mode, so
+        newlines are written as-is (LF, the norm for LaTeX sources) rather
+        than translated to the platform convention.
+        
         Args:
             file_name: The name of the output file.
             content: The content to write to the file.
@@ -68,11 +190,12 @@ class FileManager:
         Returns:
             The path to the output file.
         """
-        output_path = os.path.join(self.output_dir, file_name)
+        output_path = self._output_prefix + file_name
         
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            data = content.encode('utf-8')
+            with open(output_path, 'wb') as f:
+                f.write(data)
                 
             logger.info(f"Output file written: {output_path}")
             return output_path
@@ -80,7 +203,7 @@ class FileManager:
             logger.error(f"Failed to write output file: {output_path}. Error: {e}")
             raise
     
-    def copy_resource(self, source_path: str, dest_name: Optional[str] = None) -> str:
+    def copy_resource(self, source_path: str, dest_name: Optional[str] = None, preserve_metadata: bool = False) -> str:
         """
         Copy a resource file to the output directory.
         
@@ -88,6 +211,9 @@ class FileManager:
             source_path: The path to the source file.
             dest_name: Optional name for the destination file. If not provided,
                        the basename of the source file is used.
+            preserve_metadata: Whether to also copy permissions and timestamps.
+                               Plain content copies can use the kernel's
+                               zero-copy path.
             
         Returns:
             The path to the copied resource in the output directory.
@@ -95,51 +221,80 @@ class FileManager:
         Raises:
             FileNotFoundError: If the source file doesn't exist.
         """
-        if not os.path.exists(source_path):
-            logger.error(f"Resource file not found: {source_path}")
-            raise FileNotFoundError(f"Resource file not found: {source_path}")
-        
         dest_name = dest_name or os.path.basename(source_path)
-        dest_path = os.path.join(self.output_dir, dest_name)
+        dest_path = self._output_prefix + dest_name
         
         try:
-            shutil.copy2(source_path, dest_path)
+            _copy_file(source_path, dest_path, preserve_metadata)
             logger.info(f"Resource copied: {source_path} -> {dest_path}")
             return dest_path
+        except FileNotFoundError as e:
+            if e.filename != source_path:
+                logger.error(f"Failed to copy resource: {source_path} -> {dest_path}. Error: {e}")
+                raise
+            logger.error(f"Resource file not found: {source_path}")
+            raise FileNotFoundError(f"Resource file not found: {source_path}")
         except Exception as e:
             logger.error(f"Failed to copy resource: {source_path} -> {dest_path}. Error: {e}")
             raise
     
-    def copy_templates_to_output(self, template_names: List[str]) -> List[str]:
+    def copy_templates_to_output(self, template_names: List[str], preserve_metadata: bool = False) -> List[str]:
         """
         Copy template files to the output directory.
         
         Args:
             template_names: List of template file names to copy.
+            preserve_metadata: Whether to also copy permissions and timestamps.
             
         Returns:
             List of paths to the copied templates in the output directory.
         """
-        copied_paths = []
+        if len(template_names) <= 1:
+            results = [self._copy_one_template(name, preserve_metadata) for name in template_names]
+        else:
+            # Copies are independent and I/O bound, so overlap them
+            with ThreadPoolExecutor(max_workers=min(8, len(template_names))) as executor:
+                results = list(executor.map(
+                    lambda name: self._copy_one_template(name, preserve_metadata),
+                    template_names
+                ))
         
-        for template_name in template_names:
-            template_path = os.path.join(self.template_dir, template_name)
+        return [path for path in results if path is not None]
+    
+    def _copy_one_template(self, template_name: str, preserve_metadata: bool) -> Optional[str]:
+        """
+        Copy a single template file to the output directory.
+        
+        Args:
+            template_name: The name of the template file to copy.
+            preserve_metadata: Whether to also copy permissions and timestamps.
             
-            if not os.path.exists(template_path):
-                logger.warning(f"Template file not found: {template_path}, skipping")
-                continue
-                
-            dest_path = os.path.join(self.output_dir, template_name)
+        Returns:
+            The path to the template in the output directory, or None if it
+            could not be copied.
+        """
+        template_path = self._template_prefix + template_name
+        
+        if not os.path.exists(template_path):
+            logger.warning(f"Template file not found: {template_path}, skipping")
+            return None
             
-            try:
-                shutil.copy2(template_path, dest_path)
-                logger.info(f"Template copied: {template_path} -> {dest_path}")
-                copied_paths.append(dest_path)
-            except Exception as e:
-                logger.error(f"Failed to copy template: {template_path} -> {dest_path}. Error: {e}")
-                continue
-                
-        return copied_paths
+        dest_path = self._output_prefix + template_name
+        
+        # Skip the copy if the destination already holds the template's contents.
+        # Its modification time says nothing about where it was copied from, or
+        # whether something else has written to it since.
+        if _same_contents(template_path, dest_path):
+            logger.debug(f"Template up to date, skipping copy: {dest_path}")
+            return dest_path
+        
+        try:
+            _copy_file(template_path, dest_path, preserve_metadata)
+            logger.info(f"Template copied: {template_path} -> {dest_path}")
+            return dest_path
+        except Exception as e:
+            logger.error(f"Failed to copy template: {template_path} -> {dest_path}. Error: {e}")
+            return None
     
     def render_template(self, template_content: str, context: Dict[str, Any]) -> str:
         """
@@ -155,37 +310,57 @@ class FileManager:
         Returns:
             The rendered template.
         """
-        rendered = template_content
+        sink = io.StringIO()
+        self.render_template_to(template_content, context, sink)
+        return sink.getvalue()
+    
+    def render_template_to(self, template_content: str, context: Dict[str, Any], sink: TextIO) -> None:
+        """
+        Render a template with the given context, writing it to a text stream.
+        
+        The rendered document is written piece by piece as it is produced, so
+        it never has to be held in memory as a whole.
+        
+        Args:
+            template_content: The template content to render.
+            context: The context dictionary with values to replace placeholders.
+            sink: The text stream to write the rendered template to.
+        """
+        if not context:
+            sink.write(template_content)
+            return
         
-        # Simple placeholder replacement
-        for key, value in context.items():
-            placeholder = f"${key}$"
-            rendered = rendered.replace(placeholder, str(value))
+        _render_to(_get_template_re(frozenset(context)), template_content, context, sink)
+    
+    def render_to_file(self, template_name: str, context: Dict[str, Any], file_name: str) -> str:
+        """
+        Render a template from the template directory straight to an output file.
+        
+        Like write_output_file, the file is written as UTF-8 with LF newlines.
+        
+        Args:
+            template_name: The name of the template file to render.
+            context: The context dictionary with values to replace placeholders.
+            file_name: The name of the output file.
             
-        # Handle conditional sections
-        for key, value in context.items():
-            if_start = f"$if({key})$"
-            if_end = f"$endif({key})$"
+        Returns:
+            The path to the output file.
             
-            if if_start in rendered:
-                # Find the if block
-                if_pos = rendered.find(if_start)
-                endif_pos = rendered.find(if_end)
+        Raises:
+            FileNotFoundError: If the template file doesn't exist.
+        """
+        template_content = self.read_template(template_name)
+        output_path = self._output_prefix + file_name
+        
+        try:
+            with open(output_path, 'w', encoding='utf-8', newline='\n') as f:
+                self.render_template_to(template_content, context, f)
                 
-                if endif_pos > if_pos:
-                    # Extract the block content
-                    block_start = if_pos + len(if_start)
-                    block_content = rendered[block_start:endif_pos]
-                    
-                    # Replace the entire block
-                    if value:
-                        # Keep the content
-                        rendered = rendered[:if_pos] + block_content + rendered[endif_pos + len(if_end):]
-                    else:
-                        # Remove the content
-                        rendered = rendered[:if_pos] + rendered[endif_pos + len(if_end):]
-        
-        return rendered
+            logger.info(f"Output file written: {output_path}")
+            return output_path
+        except Exception as e:
+            logger.error(f"Failed to write output file: {output_path}. Error: {e}")
+            raise
 
     def clean_output_directory(self) -> None:
         """
@@ -195,16 +370,16 @@ class FileManager:
         directory itself.
         """
         if os.path.exists(self.output_dir):
-            for item in os.listdir(self.output_dir):
-                item_path = os.path.join(self.output_dir, item)
-                
-                try:
-                    if os.path.isfile(item_path):
-                        os.remove(item_path)
-                    elif os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-                except Exception as e:
-                    logger.error(f"Failed to remove item: {item_path}. Error: {e}")
+            # Directory entries carry their file type, so no extra stat per item
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False) or entry.is_symlink():
+                            os.unlink(entry.path)
+                        elif entry.is_dir(follow_symlinks=False):
+                            shutil.rmtree(entry.path)
+                    except Exception as e:
+                        logger.error(f"Failed to remove item: {entry.path}. Error: {e}")
                     
             logger.info(f"Output directory cleaned: {self.output_dir}")
         else:
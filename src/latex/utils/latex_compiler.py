@@ -6,10 +6,18 @@ This module provides utilities for compiling LaTeX documents to PDF.
 
 import os
 import re
+import json
+import shutil
+import mmap
+import hashlib
+import functools
 import subprocess
 import logging
 import platform
-from typing import Dict, Any, Optional, List, Tuple
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Tuple, Callable
 
 try:
     from src.config_loader import config_loader
@@ -22,6 +30,179 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Per-user cache directory for compiled PDFs and LaTeX installation probes
+_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'critique_council')
+
+# Engine executables found working, validated by size and modification time
+_ENGINE_CACHE_FILE = os.path.join(_CACHE_DIR, 'latex_engine.json')
+
+# Serializes updates of the on-disk engine cache by concurrent probes
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+# Results of engine probes in this process, keyed on (engine, PATH): the
+# engine's version line if it is available, None otherwise
+_ENGINE_PROBES: Dict[Tuple[str, str], Optional[str]] = {}
+
+# Results of common location searches in this process, keyed on (engine,
+# custom path, additional search paths): (engine path, version line) or None
+_LOCATION_PROBES: Dict[Tuple[str, str, Tuple[str, ...]], Optional[Tuple[str, str]]] = {}
+
+# Error messages in LaTeX log files, matched against the raw log bytes
+_LOG_ERROR_RE = re.compile(rb'(?:fatal error:?[ \t]*|error:[ \t]*|! )(.+?)(?=\n)', re.IGNORECASE)
+
+# latexmk options selecting the PDF-producing rule for each LaTeX engine
+_LATEXMK_ENGINE_OPTIONS = {
+    'pdflatex': '-pdf',
+    'xelatex': '-xelatex',
+    'lualatex': '-lualatex',
+    'latex': '-pdfdvi',
+}
+
+# Whether we are running on Windows, where MiKTeX may be installed off PATH
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# Extra subprocess options: on Windows, start console tools without creating
+# a console window
+_POPEN_KW: Dict[str, Any] = {'creationflags': subprocess.CREATE_NO_WINDOW} if _IS_WINDOWS else {}
+
+# Common MiKTeX and TeX Live installation paths on Windows, with the user's
+# name as the {username} placeholder
+_COMMON_WINDOWS_PATHS = (
+    # MiKTeX 25.x paths
+    "C:\\Users\\{username}\\AppData\\Local\\Programs\\MiKTeX 25.3\\miktex\\bin\\x64",
+    "C:\\Program Files\\MiKTeX 25.3\\miktex\\bin\\x64",
+    # Older MiKTeX paths
+    "C:\\Users\\{username}\\AppData\\Local\\Programs\\MiKTeX\\miktex\\bin\\x64",
+    "C:\\Users\\{username}\\AppData\\Local\\MiKTeX\\miktex\\bin\\x64",
+    "C:\\Program Files\\MiKTeX\\miktex\\bin\\x64",
+    "C:\\Program Files (x86)\\MiKTeX\\miktex\\bin",
+    # TeX Live installation paths
+    "C:\\texlive\\2023\\bin\\win32",
+    "C:\\texlive\\2024\\bin\\win32",
+    "C:\\texlive\\2023\\bin\\x64",
+    "C:\\texlive\\2024\\bin\\x64",
+)
+
+# Suffixes of the intermediate files a build leaves next to the LaTeX source
+_INTERMEDIATE_EXTENSIONS = ('.aux', '.log', '.out', '.toc', '.lof', '.lot', '.bbl', '.blg', '.dvi', '.fls', '.fdb_latexmk')
+
+# Files a LaTeX pass reads back from the previous one; when a pass leaves
+# them unchanged, another pass would produce the same output
+_PASS_STATE_EXTENSIONS = ('.aux', '.toc', '.lof', '.lot', '.out', '.bbl')
+
+# Lines of LaTeX output kept from an error message
+_MAX_ERROR_LINES = 10
+
+# Warnings in LaTeX log files asking for another pass
+_RERUN_RE = re.compile(rb'Rerun to get')
+
+# Bibliography databases named in an .aux file by \bibliography
+_AUX_BIBDATA_RE = re.compile(r'\\bibdata\{([^}]*)\}')
+
+
+def _read_engine_cache() -> Dict[str, Any]:
+    """
+    Read the on-disk cache of working LaTeX engines.
+    
+    Returns:
+        Mapping of engine executable paths to their size, modification time
+        and version line; empty if the cache is missing or unreadable.
+    """
+    try:
+        with open(_ENGINE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _replace_file(path: str, data: bytes) -> None:
+    """
+    Write a file atomically, so readers never see a partial file.
+    
+    The data goes to a uniquely named temporary file in the same directory,
+    which then replaces the target. Concurrent writers, including threads of
+    the same process, never share a temporary file.
+    
+    Args:
+        path: The file to write.
+        data: The new contents.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_engine_cache(data: Dict[str, Any]) -> None:
+    """
+    Write the on-disk cache of working LaTeX engines.
+    
+    Args:
+        data: Mapping of engine executable paths to their size, modification time and version line.
+    """
+    try:
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        _replace_file(_ENGINE_CACHE_FILE, json.dumps(data, indent=2).encode('utf-8'))
+    except OSError as e:
+        logger.debug(f"Failed to write LaTeX engine cache: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def _query_miktex_registry() -> Tuple[str, ...]:
+    """
+    Find the binary directories of MiKTeX installations recorded in the Windows registry.
+    
+    MiKTeX records its common (all users) and user installation roots under
+    SOFTWARE\\MiKTeX.org\\MiKTeX\\<version>\\Core in the machine and user hives.
+    
+    Returns:
+        The existing miktex\\bin directories of the recorded installations, empty
+        if there are none or the registry is not available.
+    """
+    try:
+        import winreg
+    except ImportError:
+        return ()
+    
+    bin_dirs = []
+    for hive in (winreg.HKEY_LOCAL_MACHINE, winreg.HKEY_CURRENT_USER):
+        try:
+            miktex_key = winreg.OpenKey(hive, r'SOFTWARE\MiKTeX.org\MiKTeX')
+        except OSError:
+            continue
+        with miktex_key:
+            index = 0
+            while True:
+                try:
+                    version = winreg.EnumKey(miktex_key, index)
+                except OSError:
+                    break
+                index += 1
+                try:
+                    core_key = winreg.OpenKey(miktex_key, f"{version}\\Core")
+                except OSError:
+                    continue
+                with core_key:
+                    for value_name in ('CommonInstall', 'UserInstall'):
+                        try:
+                            install_root, _ = winreg.QueryValueEx(core_key, value_name)
+                        except OSError:
+                            continue
+                        for bin_dir in (os.path.join(install_root, 'miktex', 'bin', 'x64'),
+                                        os.path.join(install_root, 'miktex', 'bin')):
+                            if bin_dir not in bin_dirs and os.path.isdir(bin_dir):
+                                bin_dirs.append(bin_dir)
+    
+    return tuple(bin_dirs)
+
 
 class LatexCompiler:
     """
@@ -51,19 +232,62 @@ class LatexCompiler:
         self.bibtex_run = self.config.get('bibtex_run', True)
         self.latex_runs = self.config.get('latex_runs', 2)
         self.keep_intermediates = self.config.get('keep_intermediates', False)
+        self.use_latexmk = self.config.get('use_latexmk', True)
+        self.pdf_cache = self.config.get('pdf_cache', True)
+        self.pdf_cache_dir = self.config.get('pdf_cache_dir') or os.path.join(_CACHE_DIR, 'latex')
+        self.pdf_cache_max_size_mb = self.config.get('pdf_cache_max_size_mb', 500)
+        self.precompiled_format = self.config.get('precompiled_format', '')
         
         # Get MiKTeX specific configuration
         self.miktex_config = self.config.get('miktex', {})
         self.custom_miktex_path = self.miktex_config.get('custom_path', '')
         self.additional_search_paths = self.miktex_config.get('additional_search_paths', [])
         
+        # First line of the --version output of each engine found, by engine name
+        self._engine_versions: Dict[str, str] = {}
+        
+        # Files in the directories searched for LaTeX engines, by directory
+        self._directory_listings: Dict[str, Optional[Dict[str, str]]] = {}
+        
+        # Common Windows installation paths resolved for the current user
+        self._common_paths: Optional[List[str]] = None
+    
+    @functools.cached_property
+    def latex_available(self) -> bool:
+        """
+        Whether a LaTeX engine is available.
+        
+        The engine is looked for on first access rather than on construction,
+        so creating a compiler that is never used costs nothing. If the
+        configured engine is not available, latex_engine is switched to the
+        alternative found.
+        """
         # Check if the LaTeX engine is available, try alternatives if not
-        self.latex_available, self.latex_engine = self._find_available_latex_engine()
+        available, self.latex_engine = self._find_available_latex_engine()
         
-        if self.latex_available:
+        if available:
             logger.info(f"LaTeX compiler initialized successfully with engine: {self.latex_engine}")
         else:
             logger.warning(f"Failed to initialize LaTeX compiler. No LaTeX engine found.")
+        return available
+    
+    @functools.cached_property
+    def latexmk_available(self) -> bool:
+        """
+        Whether compilation is driven by latexmk.
+        
+        latexmk is preferred as it reruns LaTeX and BibTeX only as often as needed.
+        """
+        available = bool(
+            self.latex_available
+            and self.use_latexmk
+            and self.latex_engine in _LATEXMK_ENGINE_OPTIONS
+            and not getattr(self, '_engine_path', None)
+            and self._check_engine_available('latexmk')
+        )
+        if available:
+            logger.info("Using latexmk to drive LaTeX compilation")
+        return available
     
     def _find_available_latex_engine(self) -> Tuple[bool, str]:
         """
@@ -87,97 +311,123 @@ class LatexCompiler:
         if self.latex_engine in alternatives:
             alternatives.remove(self.latex_engine)
             
-        # Try each alternative
-        for engine in alternatives:
-            if self._check_engine_available(engine):
-                print(f"Using alternative LaTeX engine: {engine}")
-                return True, engine
+        # Try the alternatives concurrently, keeping their order of preference
+        engine, _ = self._probe_concurrently(alternatives, self._check_engine_available)
+        if engine is not None:
+            logger.info(f"Using alternative LaTeX engine: {engine}")
+            return True, engine
                 
         # On Windows, try to find MiKTeX or TeX Live in common installation locations
-        if platform.system() == 'Windows':
-            print("Checking for LaTeX engines in common Windows installation locations...")
+        if _IS_WINDOWS:
+            logger.info("Checking for LaTeX engines in common Windows installation locations...")
             engine_path = self._find_latex_in_common_locations(self.latex_engine)
             if engine_path:
-                print(f"Found LaTeX engine at {engine_path}")
+                logger.info(f"Found LaTeX engine at {engine_path}")
                 # Store the full path to the engine for later use
                 self._engine_path = engine_path
                 return True, self.latex_engine
                 
             # Try alternatives in common locations
-            for engine in alternatives:
-                engine_path = self._find_latex_in_common_locations(engine)
-                if engine_path:
-                    print(f"Found alternative LaTeX engine '{engine}' at {engine_path}")
-                    # Store the full path to the engine for later use
-                    self._engine_path = engine_path
-                    return True, engine
+            engine, engine_path = self._probe_concurrently(alternatives, self._find_latex_in_common_locations)
+            if engine is not None:
+                logger.info(f"Found alternative LaTeX engine '{engine}' at {engine_path}")
+                # Store the full path to the engine for later use
+                self._engine_path = engine_path
+                return True, engine
         
         # No LaTeX engine found
-        print("No LaTeX engine found on the system")
+        logger.warning("No LaTeX engine found on the system")
         self._engine_path = None
         return False, self.latex_engine
         
+    def _probe_concurrently(self, engines: List[str], probe: Callable[[str], Any]) -> Tuple[Optional[str], Any]:
+        """
+        Probe several LaTeX engines at once.
+        
+        Probes mostly wait on subprocesses, so running them in threads makes
+        the search take as long as the slowest probe rather than their sum.
+        
+        Args:
+            engines: The engines to probe, in order of preference.
+            probe: Function probing an engine, returning a truthy value if it is available.
+            
+        Returns:
+            A tuple of (engine, probe result) for the first engine in order of
+            preference found available, or (None, None) if there is none.
+        """
+        if not engines:
+            return None, None
+        
+        executor = ThreadPoolExecutor(max_workers=len(engines))
+        try:
+            futures = [executor.submit(probe, engine) for engine in engines]
+            for engine, future in zip(engines, futures):
+                result = future.result()
+                if result:
+                    return engine, result
+            return None, None
+        finally:
+            # Probes of less preferred engines still running are not waited for
+            executor.shutdown(wait=False, cancel_futures=True)
+    
     def _find_latex_in_common_locations(self, engine: str) -> Optional[str]:
         """
         Look for LaTeX engine in common installation locations on Windows.
         
+        Results are remembered for the rest of the process, so further
+        compiler instances with the same search paths do not search again.
+        
         Args:
             engine: The LaTeX engine to look for.
             
         Returns:
             The full path to the engine executable if found, None otherwise.
         """
-        if platform.system() != 'Windows':
+        if not _IS_WINDOWS:
             return None
-            
-        # Get current username
-        username = os.environ.get('USERNAME', '')
         
+        key = (engine, self.custom_miktex_path, tuple(self.additional_search_paths))
+        if key not in _LOCATION_PROBES:
+            engine_path = self._search_common_locations(engine)
+            _LOCATION_PROBES[key] = (engine_path, self._engine_versions[engine]) if engine_path else None
+        
+        if _LOCATION_PROBES[key] is None:
+            return None
+        engine_path, self._engine_versions[engine] = _LOCATION_PROBES[key]
+        return engine_path
+    
+    def _search_common_locations(self, engine: str) -> Optional[str]:
+        """
+        Search common installation locations on Windows for a working LaTeX engine.
+        
+        Args:
+            engine: The LaTeX engine to look for.
+            
+        Returns:
+            The full path to the engine executable if found, None otherwise.
+        """
         # Check custom MiKTeX path first if specified
         if self.custom_miktex_path:
             logger.info(f"Checking custom MiKTeX path: {self.custom_miktex_path}")
-            if os.path.exists(self.custom_miktex_path):
-                engine_path = os.path.join(self.custom_miktex_path, f"{engine}.exe")
-                if os.path.exists(engine_path) and os.path.isfile(engine_path):
+            executables = self._list_executables(self.custom_miktex_path)
+            if executables is not None:
+                engine_path = executables.get(f"{engine}.exe".lower())
+                if engine_path:
                     logger.info(f"Found LaTeX engine '{engine}' at custom path: {engine_path}")
-                    # Test if the engine works
-                    try:
-                        startupinfo = subprocess.STARTUPINFO()
-                        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                        result = subprocess.run(
-                            [engine_path, '--version'],
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            startupinfo=startupinfo,
-                            check=False,
-                            text=True
-                        )
-                        if result.returncode == 0:
-                            version_info = result.stdout.strip().split('\n')[0] if result.stdout else "Unknown version"
-                            print(f"Successfully tested LaTeX engine: {version_info}")
-                            return engine_path
-                    except Exception as e:
-                        print(f"Error testing LaTeX engine at {engine_path}: {e}")
-                        return None
+                    version_info = self._test_engine_executable(engine_path)
+                    if version_info is not None:
+                        self._engine_versions[engine] = version_info
+                        return engine_path
             else:
                 logger.warning(f"Custom MiKTeX path doesn't exist: {self.custom_miktex_path}")
                 
-        # Common MiKTeX installation paths
-        common_paths = [
-            # MiKTeX 25.x paths
-            f"C:\\Users\\{username}\\AppData\\Local\\Programs\\MiKTeX 25.3\\miktex\\bin\\x64",
-            f"C:\\Program Files\\MiKTeX 25.3\\miktex\\bin\\x64",
-            # Older MiKTeX paths
-            f"C:\\Users\\{username}\\AppData\\Local\\Programs\\MiKTeX\\miktex\\bin\\x64",
-            f"C:\\Users\\{username}\\AppData\\Local\\MiKTeX\\miktex\\bin\\x64",
-            f"C:\\Program Files\\MiKTeX\\miktex\\bin\\x64",
-            f"C:\\Program Files (x86)\\MiKTeX\\miktex\\bin",
-            # TeX Live installation paths
-            "C:\\texlive\\2023\\bin\\win32",
-            "C:\\texlive\\2024\\bin\\win32",
-            "C:\\texlive\\2023\\bin\\x64",
-            "C:\\texlive\\2024\\bin\\x64"
-        ]
+        # MiKTeX installations recorded in the registry are authoritative, the
+        # common installation paths are only guessed when there are none
+        common_paths = list(_query_miktex_registry())
+        if common_paths:
+            logger.info(f"Found {len(common_paths)} MiKTeX installation paths in the registry")
+        else:
+            common_paths = list(self._guess_common_paths())
         
         # Add any additional search paths from configuration
         if self.additional_search_paths:
@@ -186,73 +436,201 @@ class LatexCompiler:
         
         # Check each path for the engine
         for base_path in common_paths:
-            engine_path = os.path.join(base_path, f"{engine}.exe")
-            if os.path.exists(engine_path) and os.path.isfile(engine_path):
-                print(f"Found LaTeX engine '{engine}' at {engine_path}")
-                try:
-                    # Test if the engine actually works
-                    startupinfo = subprocess.STARTUPINFO()
-                    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                    result = subprocess.run(
-                        [engine_path, '--version'],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        startupinfo=startupinfo,
-                        check=False,
-                        text=True
-                    )
-                    if result.returncode == 0:
-                        version_info = result.stdout.strip().split('\n')[0] if result.stdout else "Unknown version"
-                        print(f"Successfully tested LaTeX engine: {version_info}")
-                        return engine_path
-                except Exception as e:
-                    print(f"Error testing LaTeX engine at {engine_path}: {e}")
-                    continue
+            engine_path = (self._list_executables(base_path) or {}).get(f"{engine}.exe".lower())
+            if engine_path:
+                logger.info(f"Found LaTeX engine '{engine}' at {engine_path}")
+                version_info = self._test_engine_executable(engine_path)
+                if version_info is not None:
+                    self._engine_versions[engine] = version_info
+                    return engine_path
+        
+        return None
+    
+    def _guess_common_paths(self) -> List[str]:
+        """
+        Get the common MiKTeX and TeX Live installation paths on Windows.
+        
+        The paths are resolved for the current user on first use.
+        
+        Returns:
+            The directories that may contain LaTeX engine executables.
+        """
+        if self._common_paths is None:
+            username = os.environ.get('USERNAME', '')
+            self._common_paths = [path.format(username=username) for path in _COMMON_WINDOWS_PATHS]
+        return self._common_paths
+    
+    def _test_engine_executable(self, engine_path: str) -> Optional[str]:
+        """
+        Test whether a LaTeX engine executable found on disk works.
+        
+        Executables recorded as working with the same size and modification
+        time are not run again. MiKTeX engines are run with their package
+        installer disabled, so the test never waits on an installation prompt.
+        
+        Args:
+            engine_path: The full path to the engine executable.
+            
+        Returns:
+            The first line of the engine's --version output if it works, None otherwise.
+        """
+        version_info = self._lookup_known_executable(engine_path)
+        if version_info is not None:
+            logger.info(f"Using previously tested LaTeX engine: {version_info}")
+            return version_info
+        
+        cmd = [engine_path, '--version']
+        if 'miktex' in engine_path.lower():
+            cmd.insert(1, '--disable-installer')
+        
+        try:
+            # Test if the engine actually works
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=False,
+                text=True,
+                **_POPEN_KW
+            )
+            if result.returncode == 0:
+                version_info = result.stdout.strip().split('\n')[0] if result.stdout else "Unknown version"
+                logger.info(f"Successfully tested LaTeX engine: {version_info}")
+                self._remember_executable(engine_path, version_info)
+                return version_info
+        except Exception as e:
+            logger.warning(f"Error testing LaTeX engine at {engine_path}: {e}")
         
         return None
         
+    def _list_executables(self, base_path: str) -> Optional[Dict[str, str]]:
+        """
+        List the files in a directory searched for LaTeX engines.
+        
+        Each directory is read once with a single scandir call and the
+        listing is reused for every engine looked up in it.
+        
+        Args:
+            base_path: The directory to list.
+            
+        Returns:
+            Mapping of lowercase file names to their paths, or None if the
+            directory doesn't exist or can't be read.
+        """
+        if base_path not in self._directory_listings:
+            try:
+                with os.scandir(base_path) as entries:
+                    listing = {entry.name.lower(): entry.path for entry in entries if entry.is_file()}
+            except OSError:
+                listing = None
+            self._directory_listings[base_path] = listing
+        return self._directory_listings[base_path]
+    
     def _check_engine_available(self, engine: str) -> bool:
         """
         Check if a specific LaTeX engine is available on the system.
         
+        Results are remembered for the rest of the process, keyed on the
+        PATH they were found with. Engines found working are also recorded on
+        disk, so later runs only have to check that the executable found on
+        the PATH is unchanged instead of running it.
+        
         Args:
             engine: The LaTeX engine to check.
             
         Returns:
             True if the engine is available, False otherwise.
         """
+        key = (engine, os.environ.get('PATH', ''))
+        if key not in _ENGINE_PROBES:
+            engine_path = shutil.which(engine)
+            version_info = self._lookup_known_executable(engine_path) if engine_path else None
+            if version_info is None:
+                version_info = self._probe_engine(engine)
+                if version_info is not None and engine_path:
+                    self._remember_executable(engine_path, version_info)
+            _ENGINE_PROBES[key] = version_info
+        
+        version_info = _ENGINE_PROBES[key]
+        if version_info is None:
+            return False
+        self._engine_versions[engine] = version_info
+        return True
+    
+    def _lookup_known_executable(self, engine_path: str) -> Optional[str]:
+        """
+        Look up an engine executable in the on-disk cache of working engines.
+        
+        Args:
+            engine_path: The full path to the engine executable.
+            
+        Returns:
+            The cached version line if the executable was recorded and its
+            size and modification time are unchanged since; None otherwise.
+        """
+        entry = _read_engine_cache().get(engine_path)
+        if not isinstance(entry, dict):
+            return None
         try:
-            print(f"Checking if LaTeX engine '{engine}' is available...")
-            if platform.system() == 'Windows':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                result = subprocess.run(
-                    [engine, '--version'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    startupinfo=startupinfo,
-                    check=False,
-                    text=True
-                )
-            else:
-                result = subprocess.run(
-                    [engine, '--version'],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    check=False,
-                    text=True
-                )
+            stat = os.stat(engine_path)
+        except OSError:
+            return None
+        if stat.st_size != entry.get('size') or stat.st_mtime != entry.get('mtime'):
+            return None
+        
+        logger.debug(f"Using cached probe of LaTeX engine at {engine_path}")
+        return entry.get('version')
+    
+    def _remember_executable(self, engine_path: str, version_info: str) -> None:
+        """
+        Record a working engine executable in the on-disk cache.
+        
+        Args:
+            engine_path: The full path to the engine executable.
+            version_info: The first line of its --version output.
+        """
+        try:
+            stat = os.stat(engine_path)
+        except OSError:
+            return
+        
+        with _ENGINE_CACHE_LOCK:
+            data = _read_engine_cache()
+            data[engine_path] = {'size': stat.st_size, 'mtime': stat.st_mtime, 'version': version_info}
+            _write_engine_cache(data)
+    
+    def _probe_engine(self, engine: str) -> Optional[str]:
+        """
+        Run a LaTeX engine to check that it is available.
+        
+        Args:
+            engine: The LaTeX engine to check.
+            
+        Returns:
+            The first line of the engine's --version output if it is
+            available, None otherwise.
+        """
+        try:
+            logger.info(f"Checking if LaTeX engine '{engine}' is available...")
+            result = subprocess.run(
+                [engine, '--version'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=False,
+                text=True,
+                **_POPEN_KW
+            )
             
             if result.returncode == 0:
                 version_info = result.stdout.strip().split('\n')[0] if result.stdout else "Unknown version"
-                print(f"Found LaTeX engine: {version_info}")
-                return True
+                logger.info(f"Found LaTeX engine: {version_info}")
+                return version_info
             else:
-                print(f"LaTeX engine '{engine}' not found. Error: {result.stderr}")
-                return False
+                logger.warning(f"LaTeX engine '{engine}' not found. Error: {result.stderr}")
+                return None
         except (subprocess.SubprocessError, FileNotFoundError) as e:
-            print(f"LaTeX engine '{engine}' not found on the system: {str(e)}")
-            return False
+            logger.warning(f"LaTeX engine '{engine}' not found on the system: {str(e)}")
+            return None
     
     def compile_document(self, tex_path: str) -> Tuple[bool, str]:
         """
@@ -266,13 +644,13 @@ class LatexCompiler:
             indicating whether compilation was successful, and output_pdf_path
             is the path to the generated PDF file (or an error message if compilation failed).
         """
-        print(f"Attempting to compile LaTeX document: {tex_path}")
+        logger.info(f"Attempting to compile LaTeX document: {tex_path}")
         if not self.latex_available:
-            print(f"Error: LaTeX engine '{self.latex_engine}' is not available on the system")
+            logger.error(f"LaTeX engine '{self.latex_engine}' is not available on the system")
             return False, "LaTeX engine not available on the system"
         
         if not os.path.exists(tex_path):
-            print(f"Error: LaTeX source file not found: {tex_path}")
+            logger.error(f"LaTeX source file not found: {tex_path}")
             return False, f"LaTeX source file not found: {tex_path}"
         
         # Get the directory and filename
@@ -280,52 +658,497 @@ class LatexCompiler:
         tex_file = os.path.basename(tex_path)
         tex_name = os.path.splitext(tex_file)[0]
         
-        # Change to the directory containing the LaTeX file
-        original_dir = os.getcwd()
-        os.chdir(tex_dir)
+        # Reuse the PDF of an identical earlier build
+        cache_key = self._cache_key(tex_path) if self.pdf_cache else None
+        if cache_key is not None:
+            pdf_path = os.path.join(tex_dir, f"{tex_name}.pdf")
+            if self._cache_lookup(cache_key, tex_dir, pdf_path):
+                logger.info(f"Using cached PDF: {pdf_path}")
+                return True, pdf_path
+        
+        # Tools run in the directory containing the LaTeX file, so relative
+        # \input paths resolve. It is passed to each subprocess rather than
+        # changing the process-wide working directory, so documents can be
+        # compiled concurrently from several threads.
+        work_dir = tex_dir or None
         
         try:
-            # First LaTeX run
-            result = self._run_latex(tex_file)
-            if not result:
-                os.chdir(original_dir)
-                return False, f"LaTeX compilation failed for {tex_path}"
-            
-            # BibTeX run if enabled
-            if self.bibtex_run and os.path.exists(f"{tex_name}.aux"):
-                result = self._run_bibtex(tex_name)
-                if not result:
-                    os.chdir(original_dir)
-                    return False, f"BibTeX compilation failed for {tex_path}"
-            
-            # Additional LaTeX runs to resolve references
-            for _ in range(1, self.latex_runs):
-                result = self._run_latex(tex_file)
+            if self.latexmk_available:
+                # latexmk runs LaTeX and BibTeX until the output converges
+                if not self._run_latexmk(tex_file, work_dir):
+                    return False, f"LaTeX compilation failed for {tex_path}"
+            else:
+                # First LaTeX run
+                state = self._pass_state(tex_dir, tex_name)
+                result = self._run_latex(tex_file, work_dir)
                 if not result:
-                    os.chdir(original_dir)
-                    return False, f"LaTeX compilation failed for {tex_path} (pass {_ + 1})"
+                    return False, f"LaTeX compilation failed for {tex_path}"
+                
+                # BibTeX run if enabled
+                if self.bibtex_run and os.path.exists(os.path.join(tex_dir, f"{tex_name}.aux")):
+                    result = self._run_bibtex(tex_name, work_dir)
+                    if not result:
+                        return False, f"BibTeX compilation failed for {tex_path}"
+                
+                # Additional LaTeX runs to resolve references, until the
+                # output has converged
+                for _ in range(1, self.latex_runs):
+                    new_state = self._pass_state(tex_dir, tex_name)
+                    if new_state == state and not self._needs_rerun(tex_dir, tex_name):
+                        logger.info("LaTeX output has converged, skipping the remaining passes")
+                        break
+                    state = new_state
+                    result = self._run_latex(tex_file, work_dir)
+                    if not result:
+                        return False, f"LaTeX compilation failed for {tex_path} (pass {_ + 1})"
             
             # Check if the PDF was generated
             pdf_path = os.path.join(tex_dir, f"{tex_name}.pdf")
             if not os.path.exists(pdf_path):
-                print(f"Error: PDF file not generated for {tex_path}")
-                print("Checking for error logs...")
+                logger.error(f"PDF file not generated for {tex_path}")
+                logger.info("Checking for error logs...")
                 self._check_error_logs(tex_dir, tex_name)
-                os.chdir(original_dir)
                 return False, f"PDF file not generated for {tex_path}"
             
+            if cache_key is not None:
+                self._cache_store(cache_key, tex_dir, tex_name, pdf_path)
+            
             # Clean up intermediate files if not keeping them
             if not self.keep_intermediates:
                 self._clean_intermediates(tex_dir, tex_name)
             
-            print(f"Successfully generated PDF: {pdf_path}")
-            os.chdir(original_dir)
+            logger.info(f"Successfully generated PDF: {pdf_path}")
             return True, pdf_path
         except Exception as e:
-            os.chdir(original_dir)
             logger.error(f"Exception during LaTeX compilation: {e}")
             return False, f"Exception during LaTeX compilation: {e}"
     
+    def compile_batch(self, tex_paths: List[str], max_workers: Optional[int] = None) -> List[Tuple[bool, str]]:
+        """
+        Compile several LaTeX documents concurrently.
+        
+        Each document is compiled as by compile_document, with the LaTeX runs
+        of different documents overlapping.
+        
+        Args:
+            tex_paths: Paths to the LaTeX source files.
+            max_workers: Maximum number of documents compiled at the same time;
+                         defaults to the number of CPUs.
+            
+        Returns:
+            The result of compile_document for each document, in order.
+        """
+        if not tex_paths:
+            return []
+        
+        # Look for the engine once, before the workers need it
+        if self.latex_available:
+            self.latexmk_available
+        
+        workers = max_workers or min(len(tex_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.compile_document, tex_paths))
+    
+    def precompile_preamble(self, tex_path: str) -> Optional[str]:
+        """
+        Dump the preamble of a LaTeX document into a format file.
+        
+        The document is read with the mylatexformat package up to
+        \\endofdump, or \\begin{document} if there is none, and the state
+        reached is saved as <name>_fmt.fmt next to it. The build runs under
+        that job name, so its log does not replace the document's own.
+        Documents sharing the preamble can then be compiled with the format
+        set as precompiled_format, which skips loading the class and packages.
+        
+        Args:
+            tex_path: Path to a LaTeX document with the preamble to precompile.
+            
+        Returns:
+            The path to the format file, or None if it could not be created.
+        """
+        if not self.latex_available:
+            logger.error(f"LaTeX engine '{self.latex_engine}' is not available on the system")
+            return None
+        
+        tex_dir = os.path.dirname(tex_path)
+        tex_file = os.path.basename(tex_path)
+        fmt_name = f"{os.path.splitext(tex_file)[0]}_fmt"
+        
+        engine = getattr(self, '_engine_path', None) or self.latex_engine
+        cmd = [
+            engine,
+            '-ini',
+            '-interaction=nonstopmode',
+            '-halt-on-error',
+            f"-jobname={fmt_name}",
+        ]
+        memory_args, env = self._memory_settings()
+        cmd.extend(memory_args)
+        cmd.extend([f"&{self.latex_engine}", 'mylatexformat.ltx', tex_file])
+        
+        try:
+            logger.info(f"Precompiling the preamble of {tex_file}")
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=tex_dir or None,
+                env=env,
+                check=False,
+                **_POPEN_KW
+            )
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.error(f"Exception while precompiling the preamble: {e}")
+            return None
+        
+        fmt_path = os.path.join(tex_dir, f"{fmt_name}.fmt")
+        if result.returncode != 0 or not os.path.exists(fmt_path):
+            logger.error(f"Preamble precompilation failed with return code {result.returncode}")
+            if result.stderr:
+                logger.error(f"Error output: {result.stderr}")
+            self._check_error_logs(tex_dir, fmt_name)
+            return None
+        
+        logger.info(f"Precompiled preamble saved to {fmt_path}")
+        return fmt_path
+    
+    def _format_args(self) -> List[str]:
+        """
+        Get the LaTeX engine options loading the precompiled format, if any.
+        
+        Returns:
+            The -fmt option for the configured precompiled format, or an empty list.
+        """
+        if not self.precompiled_format:
+            return []
+        # Engines look the format up by name, without the .fmt suffix; the
+        # path is made absolute as LaTeX runs in the document directory
+        fmt_name = os.path.splitext(os.path.abspath(self.precompiled_format))[0]
+        return [f"-fmt={fmt_name}"]
+    
+    def _memory_settings(self) -> Tuple[List[str], Optional[Dict[str, str]]]:
+        """
+        Get the engine options and environment applying the latex_memory settings.
+        
+        The settings are texmf.cnf memory parameters such as extra_mem_top or
+        pool_size. MiKTeX takes them as command line options, while TeX Live
+        reads them from the environment, where they override texmf.cnf.
+        
+        Returns:
+            The extra engine options, and the environment to run the engine
+            in or None for the current one.
+        """
+        memory = self.config.get('latex_memory') or {}
+        if not memory:
+            return [], None
+        
+        version = self._engine_versions.get(self.latex_engine, '')
+        engine = getattr(self, '_engine_path', None) or ''
+        if 'miktex' in f"{version} {engine}".lower():
+            return [f"--{name.replace('_', '-')}={value}" for name, value in memory.items()], None
+        
+        env = dict(os.environ)
+        env.update((name, str(value)) for name, value in memory.items())
+        return [], env
+    
+    def _cache_key(self, tex_path: str) -> Optional[str]:
+        """
+        Compute the PDF cache key of a LaTeX source file.
+        
+        The key covers the source bytes together with the engine, its version,
+        the options affecting the output and the contents of the precompiled
+        format, which may live outside the document directory and be
+        regenerated under the same name.
+        
+        Args:
+            tex_path: Path to the LaTeX source file.
+            
+        Returns:
+            The hex digest identifying the source and build settings, or None if
+            the source could not be read.
+        """
+        settings = {
+            'engine': self.latex_engine,
+            'version': self._engine_versions.get(self.latex_engine, ''),
+            'latex_args': self.config.get('latex_args', []),
+            'bibtex_run': self.bibtex_run,
+            'precompiled_format': self.precompiled_format,
+            'latex_memory': self.config.get('latex_memory') or {},
+        }
+        if self.precompiled_format:
+            fmt_path = os.path.splitext(os.path.abspath(self.precompiled_format))[0] + '.fmt'
+            try:
+                with open(fmt_path, 'rb') as f:
+                    settings['precompiled_format_sha256'] = hashlib.sha256(f.read()).hexdigest()
+            except OSError as e:
+                logger.warning(f"Failed to read precompiled format {fmt_path} for the PDF cache: {e}")
+                return None
+        digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode('utf-8'))
+        try:
+            with open(tex_path, 'rb') as f:
+                digest.update(f.read())
+        except OSError as e:
+            logger.warning(f"Failed to read {tex_path} for the PDF cache: {e}")
+            return None
+        return digest.hexdigest()
+    
+    def _cache_lookup(self, cache_key: str, tex_dir: str, pdf_path: str) -> bool:
+        """
+        Copy a cached PDF to the output location if there is one.
+        
+        The files the cached build read are looked up in the manifest stored
+        with it, and must still have the same contents.
+        
+        Args:
+            cache_key: The cache key of the build.
+            tex_dir: The directory containing the LaTeX file.
+            pdf_path: Where the PDF should be placed.
+            
+        Returns:
+            True if a cached PDF was found and copied, False otherwise.
+        """
+        manifest_path = os.path.join(self.pdf_cache_dir, f"{cache_key}.json")
+        try:
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                dependencies = json.load(f)['dependencies']
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to read PDF cache manifest {manifest_path}: {e}")
+            return False
+        
+        build_key = self._dependency_key(cache_key, tex_dir, dependencies)
+        if build_key is None:
+            return False
+        
+        cached_path = os.path.join(self.pdf_cache_dir, f"{build_key}.pdf")
+        try:
+            shutil.copyfile(cached_path, pdf_path)
+        except FileNotFoundError:
+            return False
+        except OSError as e:
+            logger.warning(f"Failed to use cached PDF {cached_path}: {e}")
+            return False
+        
+        # Mark the entry as recently used, so pruning removes it last
+        try:
+            os.utime(cached_path)
+            os.utime(manifest_path)
+        except OSError:
+            pass
+        
+        logger.info(f"PDF cache hit for {pdf_path}")
+        return True
+    
+    def _cache_store(self, cache_key: str, tex_dir: str, tex_name: str, pdf_path: str) -> None:
+        """
+        Store a freshly compiled PDF in the cache.
+        
+        The PDF is stored together with a manifest of the files the build
+        read, taken from the LaTeX recorder output. Builds without recorder
+        output are not cached, as their dependencies are unknown.
+        
+        Args:
+            cache_key: The cache key of the build.
+            tex_dir: The directory containing the LaTeX file.
+            tex_name: The base name of the LaTeX file (without extension).
+            pdf_path: Path to the compiled PDF.
+        """
+        dependencies = self._recorded_dependencies(tex_dir, tex_name)
+        if dependencies is None:
+            return
+        build_key = self._dependency_key(cache_key, tex_dir, dependencies)
+        if build_key is None:
+            return
+        
+        cached_path = os.path.join(self.pdf_cache_dir, f"{build_key}.pdf")
+        manifest_path = os.path.join(self.pdf_cache_dir, f"{cache_key}.json")
+        try:
+            os.makedirs(self.pdf_cache_dir, exist_ok=True)
+            # Write the PDF before the manifest pointing at it
+            with open(pdf_path, 'rb') as f:
+                _replace_file(cached_path, f.read())
+            _replace_file(manifest_path, json.dumps({'dependencies': dependencies}).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Failed to store {pdf_path} in the PDF cache: {e}")
+            return
+        
+        if self.pdf_cache_max_size_mb is not None:
+            self.prune_pdf_cache(int(self.pdf_cache_max_size_mb * 1024 * 1024))
+    
+    def prune_pdf_cache(self, max_bytes: int = 0) -> int:
+        """
+        Shrink the PDF cache directory to at most max_bytes.
+        
+        Cached PDFs and manifests are removed least recently used first, by
+        modification time, which a cache hit refreshes. A manifest whose PDF
+        was removed simply misses on lookup. With the default of 0 the whole
+        cache is cleared.
+        
+        Args:
+            max_bytes: The size the cache may keep, in bytes.
+            
+        Returns:
+            The number of files removed.
+        """
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.pdf_cache_dir) as listing:
+                for entry in listing:
+                    if not entry.name.endswith(('.pdf', '.json')):
+                        continue
+                    try:
+                        stat = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            logger.warning(f"Failed to list the PDF cache {self.pdf_cache_dir}: {e}")
+            return 0
+        
+        removed = 0
+        entries.sort()
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove {path} from the PDF cache: {e}")
+                continue
+            total -= size
+            removed += 1
+        
+        if removed:
+            logger.info(f"Pruned {removed} files from the PDF cache {self.pdf_cache_dir}")
+        return removed
+    
+    def _recorded_dependencies(self, tex_dir: str, tex_name: str) -> Optional[List[str]]:
+        """
+        List the files next to a LaTeX document that its build read.
+        
+        The input files are taken from the .fls file written by the LaTeX
+        recorder, and the bibliography databases from the .aux file. Only
+        files under the document directory are listed; the files of the TeX
+        distribution are covered by the engine version in the cache key.
+        
+        Args:
+            tex_dir: The directory containing the LaTeX file.
+            tex_name: The base name of the LaTeX file (without extension).
+            
+        Returns:
+            Sorted paths relative to the document directory, or None if the
+            recorder output could not be read.
+        """
+        base_dir = os.path.abspath(tex_dir)
+        try:
+            with open(os.path.join(base_dir, f"{tex_name}.fls"), 'r', encoding='utf-8', errors='replace') as f:
+                recorded = f.read().splitlines()
+        except OSError:
+            logger.info(f"No recorder output for {tex_name}, not caching the PDF")
+            return None
+        
+        # The source itself is already part of the cache key, and the build's
+        # own intermediates are outputs rather than dependencies
+        excluded = {f"{tex_name}{ext}" for ext in _INTERMEDIATE_EXTENSIONS}
+        excluded.update((f"{tex_name}.tex", f"{tex_name}.pdf"))
+        
+        inputs = []
+        pwd = base_dir
+        for line in recorded:
+            if line.startswith('PWD '):
+                pwd = line[4:]
+            elif line.startswith('INPUT '):
+                inputs.append(os.path.join(pwd, line[6:]))
+        
+        try:
+            with open(os.path.join(base_dir, f"{tex_name}.aux"), 'r', encoding='utf-8', errors='replace') as f:
+                for match in _AUX_BIBDATA_RE.finditer(f.read()):
+                    for name in match.group(1).split(','):
+                        name = name.strip()
+                        if name:
+                            inputs.append(os.path.join(base_dir, name if name.endswith('.bib') else f"{name}.bib"))
+        except OSError:
+            pass
+        
+        dependencies = set()
+        for path in inputs:
+            relative = os.path.relpath(os.path.normpath(path), base_dir)
+            if relative.startswith(os.pardir) or os.path.isabs(relative) or relative in excluded:
+                continue
+            dependencies.add(relative)
+        return sorted(dependencies)
+    
+    def _dependency_key(self, cache_key: str, tex_dir: str, dependencies: List[str]) -> Optional[str]:
+        """
+        Extend a cache key with the contents of a build's dependencies.
+        
+        Contents are hashed rather than compared by modification time, as the
+        templates are copied into the output directory for every document.
+        
+        Args:
+            cache_key: The cache key of the build.
+            tex_dir: The directory containing the LaTeX file.
+            dependencies: Paths of the dependencies relative to tex_dir.
+            
+        Returns:
+            The hex digest identifying the build, or None if a dependency
+            could not be read.
+        """
+        digest = hashlib.sha256(cache_key.encode('ascii'))
+        for relative in dependencies:
+            digest.update(relative.encode('utf-8') + b'\0')
+            try:
+                with open(os.path.join(tex_dir, relative), 'rb') as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+            except OSError:
+                return None
+        return digest.hexdigest()
+    
+    def _pass_state(self, tex_dir: str, tex_name: str) -> bytes:
+        """
+        Compute a checksum of the files a LaTeX pass reads back.
+        
+        Args:
+            tex_dir: The directory containing the LaTeX file.
+            tex_name: The base name of the LaTeX file (without extension).
+            
+        Returns:
+            The SHA-1 digest of the auxiliary files, missing ones included.
+        """
+        digest = hashlib.sha1()
+        for ext in _PASS_STATE_EXTENSIONS:
+            try:
+                with open(os.path.join(tex_dir, f"{tex_name}{ext}"), 'rb') as f:
+                    digest.update(hashlib.sha1(f.read()).digest())
+            except OSError:
+                digest.update(b'missing')
+        return digest.digest()
+    
+    def _needs_rerun(self, tex_dir: str, tex_name: str) -> bool:
+        """
+        Check whether the log of the last LaTeX pass asks for another pass.
+        
+        Args:
+            tex_dir: The directory containing the LaTeX file.
+            tex_name: The base name of the LaTeX file (without extension).
+            
+        Returns:
+            True if the log has a rerun warning or could not be read, False otherwise.
+        """
+        try:
+            with open(os.path.join(tex_dir, f"{tex_name}.log"), 'rb') as f:
+                return _RERUN_RE.search(f.read()) is not None
+        except OSError:
+            return True
+    
     def _check_error_logs(self, tex_dir: str, tex_name: str) -> None:
         """
         Check LaTeX log files for errors.
@@ -337,36 +1160,30 @@ class LatexCompiler:
         log_file = os.path.join(tex_dir, f"{tex_name}.log")
         if os.path.exists(log_file):
             try:
-                with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    log_content = f.read()
-                    
-                # Look for error patterns in the log
-                error_patterns = [
-                    r'(?i)error:[ \t]*(.+?)(?=\n)',
-                    r'(?i)! (.+?)(?=\n)',
-                    r'(?i)fatal error[ \t]*(.+?)(?=\n)'
-                ]
-                
                 errors_found = False
-                print("LaTeX log errors:")
-                for pattern in error_patterns:
-                    for match in re.finditer(pattern, log_content, re.MULTILINE):
-                        errors_found = True
-                        print(f"  - {match.group(1).strip()}")
+                logger.error("LaTeX log errors:")
+                # Map the log instead of reading it, and find all kinds of
+                # error messages in a single pass
+                if os.path.getsize(log_file) > 0:
+                    with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as log_content:
+                        for match in _LOG_ERROR_RE.finditer(log_content):
+                            errors_found = True
+                            logger.error(f"  - {match.group(1).decode('utf-8', errors='ignore').strip()}")
                 
                 if not errors_found:
-                    print("  No specific errors found in log, but compilation still failed.")
+                    logger.warning("  No specific errors found in log, but compilation still failed.")
             except Exception as e:
-                print(f"  Error reading log file: {e}")
+                logger.warning(f"  Error reading log file: {e}")
         else:
-            print(f"  No log file found at {log_file}")
+            logger.warning(f"  No log file found at {log_file}")
     
-    def _run_latex(self, tex_file: str) -> bool:
+    def _run_latex(self, tex_file: str, cwd: Optional[str] = None) -> bool:
         """
         Run the LaTeX engine on a source file.
         
         Args:
             tex_file: The LaTeX source file to compile.
+            cwd: The directory to run the engine in, the current directory if not given.
             
         Returns:
             True if compilation was successful, False otherwise.
@@ -375,7 +1192,6 @@ class LatexCompiler:
             # Use the full path if we found the engine in a common location
             engine = getattr(self, '_engine_path', None) or self.latex_engine
             
-            print(f"Running {engine} on {tex_file}")
             logger.info(f"Running {engine} on {tex_file}")
             
             # Build the command
@@ -383,56 +1199,122 @@ class LatexCompiler:
                 engine,
                 '-interaction=nonstopmode',
                 '-halt-on-error',
-                tex_file
+                '-recorder',
             ]
+            cmd.extend(self._format_args())
+            memory_args, env = self._memory_settings()
+            cmd.extend(memory_args)
+            cmd.append(tex_file)
             
             # Add any additional arguments from config
             additional_args = self.config.get('latex_args', [])
             if additional_args:
                 cmd.extend(additional_args)
             
+            # Run the command, scanning its output as it is produced rather
+            # than buffering all of it. Only the error message is kept, and
+            # the engine is stopped once it is complete: the pass has failed.
+            errors = []
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding='utf-8',
+                errors='replace',
+                bufsize=1,
+                cwd=cwd,
+                env=env,
+                **_POPEN_KW
+            ) as process:
+                for line in process.stdout:
+                    if errors or line.startswith('!'):
+                        errors.append(line.rstrip())
+                        # TeX error messages end with the offending input line
+                        if line.startswith('l.') or len(errors) >= _MAX_ERROR_LINES:
+                            process.kill()
+                            break
+                returncode = process.wait()
+            
+            if returncode != 0 or errors:
+                logger.error(f"LaTeX compilation failed with return code {returncode}")
+                if errors:
+                    logger.error("Error output: " + "\n".join(errors))
+                return False
+            
+            logger.info(f"LaTeX compilation successful for {tex_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Exception during LaTeX compilation: {e}")
+            return False
+    
+    def _run_latexmk(self, tex_file: str, cwd: Optional[str] = None) -> bool:
+        """
+        Run latexmk on a source file.
+        
+        latexmk reads the LaTeX log to decide whether another pass is needed
+        and runs BibTeX when the bibliography changed, so documents that
+        converge early are not compiled more often than necessary. The number
+        of passes is bounded by latexmk's max_repeat setting.
+        
+        Args:
+            tex_file: The LaTeX source file to compile.
+            cwd: The directory to run latexmk in, the current directory if not given.
+            
+        Returns:
+            True if compilation was successful, False otherwise.
+        """
+        try:
+            logger.info(f"Running latexmk ({self.latex_engine}) on {tex_file}")
+            
+            # Build the command
+            cmd = [
+                'latexmk',
+                _LATEXMK_ENGINE_OPTIONS[self.latex_engine],
+                '-interaction=nonstopmode',
+                '-halt-on-error',
+                '-recorder',
+            ]
+            if not self.bibtex_run:
+                cmd.append('-bibtex-')
+            memory_args, env = self._memory_settings()
+            cmd.extend(f"-latexoption={arg}" for arg in self._format_args() + memory_args)
+            
+            # Pass any additional arguments from config on to the LaTeX engine
+            additional_args = self.config.get('latex_args', [])
+            cmd.extend(f"-latexoption={arg}" for arg in additional_args if arg not in cmd)
+            cmd.append(tex_file)
+            
             # Run the command
-            if platform.system() == 'Windows':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    startupinfo=startupinfo,
-                    check=False
-                )
-            else:
-                result = subprocess.run(
-                    cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False
-                )
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=cwd,
+                env=env,
+                check=False,
+                **_POPEN_KW
+            )
             
             if result.returncode != 0:
-                print(f"LaTeX compilation failed with return code {result.returncode}")
+                logger.error(f"latexmk failed with return code {result.returncode}")
                 if result.stderr:
-                    print(f"Error output: {result.stderr}")
-                logger.error(f"LaTeX compilation failed: {result.stderr}")
+                    logger.error(f"Error output: {result.stderr}")
                 return False
             
-            print(f"LaTeX compilation successful for {tex_file}")
             logger.info(f"LaTeX compilation successful for {tex_file}")
             return True
         except Exception as e:
-            print(f"Exception during LaTeX compilation: {e}")
             logger.error(f"Exception during LaTeX compilation: {e}")
             return False
     
-    def _run_bibtex(self, tex_name: str) -> bool:
+    def _run_bibtex(self, tex_name: str, cwd: Optional[str] = None) -> bool:
         """
         Run BibTeX on the auxiliary file.
         
         Args:
             tex_name: The base name of the LaTeX file (without extension).
+            cwd: The directory to run BibTeX in, the current directory if not given.
             
         Returns:
             True if compilation was successful, False otherwise.
@@ -445,7 +1327,7 @@ class LatexCompiler:
             
             # If we're using a full path for the LaTeX engine, we should also look for BibTeX
             # in the same directory on Windows
-            if platform.system() == 'Windows' and hasattr(self, '_engine_path') and self._engine_path:
+            if _IS_WINDOWS and hasattr(self, '_engine_path') and self._engine_path:
                 # Get the directory containing the LaTeX engine
                 engine_dir = os.path.dirname(self._engine_path)
                 bibtex_path = os.path.join(engine_dir, 'bibtex.exe')
@@ -453,28 +1335,18 @@ class LatexCompiler:
                 # Check if BibTeX exists in the same directory
                 if os.path.exists(bibtex_path) and os.path.isfile(bibtex_path):
                     bibtex_cmd = bibtex_path
-                    print(f"Using BibTeX from {bibtex_path}")
+                    logger.info(f"Using BibTeX from {bibtex_path}")
             
             # Run the command
-            if platform.system() == 'Windows':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                result = subprocess.run(
-                    [bibtex_cmd, tex_name],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    startupinfo=startupinfo,
-                    check=False
-                )
-            else:
-                result = subprocess.run(
-                    [bibtex_cmd, tex_name],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    check=False
-                )
+            result = subprocess.run(
+                [bibtex_cmd, tex_name],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=cwd,
+                check=False,
+                **_POPEN_KW
+            )
             
             if result.returncode != 0:
                 logger.error(f"BibTeX compilation failed: {result.stderr}")
@@ -494,13 +1366,20 @@ class LatexCompiler:
             tex_dir: The directory containing the LaTeX file.
             tex_name: The base name of the LaTeX file (without extension).
         """
-        # List of extensions for intermediate files
-        extensions = ['.aux', '.log', '.out', '.toc', '.lof', '.lot', '.bbl', '.blg', '.dvi']
+        targets = {f"{tex_name}{ext}" for ext in _INTERMEDIATE_EXTENSIONS}
         
-        for ext in extensions:
-            file_path = os.path.join(tex_dir, f"{tex_name}{ext}")
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except Exception as e:
-                    logger.warning(f"Failed to remove intermediate file {file_path}: {e}")
+        # One directory read instead of a stat per possible intermediate
+        try:
+            with os.scandir(tex_dir or '.') as entries:
+                paths = [entry.path for entry in entries if entry.name in targets]
+        except OSError as e:
+            logger.warning(f"Failed to list intermediate files in {tex_dir}: {e}")
+            return
+        
+        for file_path in paths:
+            try:
+                os.unlink(file_path)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Failed to remove intermediate file {file_path}: {e}")
@@ -4,13 +4,34 @@
 Main entry point for the Reasoning Council Critique Module.
 """
 from typing import Dict, Any
+import importlib
 import logging # Import logging
+import sys
 
-# Component Imports
-from .input_reader import read_file_content
-# import asyncio # No longer needed
-from .council_orchestrator import run_critique_council # Now synchronous
-from .output_formatter import format_critique_output
+# Component imports, deferred until first use: the council and formatter pull
+# in the LLM provider clients and the LaTeX toolchain
+_COMPONENTS = {
+    'read_file_content': ('.input_reader', 'read_file_content'),
+    'run_critique_council': ('.council_orchestrator', 'run_critique_council'), # Now synchronous
+    'format_critique_output': ('.output_formatter', 'format_critique_output'),
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a pipeline component the first time it is accessed.
+    
+    Args:
+        name: Name of the module attribute being looked up
+        
+    Returns:
+        The component function
+    """
+    if name not in _COMPONENTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _COMPONENTS[name]
+    value = getattr(importlib.import_module(module_name, __package__), attribute)
+    globals()[name] = value
+    return value
 
 # Make synchronous
 def critique_goal_document(
@@ -32,15 +53,17 @@ def critique_goal_document(
         Formatted critique output as a string
     """
     logger = logging.getLogger(__name__) # Get logger
+    # Look the components up on the module so they are imported on first use
+    components = sys.modules[__name__]
 
     try:
         logger.debug("Step 1: Reading input...")
-        content = read_file_content(file_path)
+        content = components.read_file_content(file_path)
         logger.debug("Input read successfully.")
 
         logger.debug(f"Step 2: Running critique council... (Peer Review: {peer_review}, Scientific Mode: {scientific_mode})")
         # Call synchronous council function with all parameters
-        critique_data = run_critique_council(
+        critique_data = components.run_critique_council(
             content, 
             config, 
             peer_review=peer_review,
@@ -50,7 +73,7 @@ def critique_goal_document(
 
         logger.debug(f"Step 3: Formatting output... (Peer Review: {peer_review})")
         # Pass original content, config, and peer_review flag needed for Judge summary
-        formatted_output = format_critique_output(critique_data, content, config, peer_review=peer_review)
+        formatted_output = components.format_critique_output(critique_data, content, config, peer_review=peer_review)
         logger.debug("Output formatted.")
 
         logger.info("Critique process completed successfully.")
@@ -67,79 +90,37 @@ def critique_goal_document(
         # Re-raise a generic exception for the runner script to catch
         raise Exception(f"Critique module failed unexpectedly in main: {e}") from e
 
-# Keep direct execution block, but make it synchronous
+# Direct execution: python -m src.main [input_file]
 if __name__ == '__main__':
-    import sys
+    import json
     import os
 
     # Setup basic logging for direct execution test
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
 
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    src_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-    if project_root not in sys.path: sys.path.insert(0, project_root)
-    if src_root not in sys.path: sys.path.insert(0, src_root)
-
-    try:
-        # Imports remain the same, but functions are now sync
-        from input_reader import read_file_content as direct_read
-        from council_orchestrator import run_critique_council as direct_run_council
-        from output_formatter import format_critique_output as direct_format
-    except ImportError:
-        print("ImportError: Could not import components directly. Ensure PYTHONPATH is set or run from project root.")
-        sys.exit(1)
-
-    # Synchronous test function
-    def direct_critique_test(file_path: str) -> str:
-        print(f"Initiating direct critique test for: {file_path}")
-        # Use config from file if available, else dummy
-        config_path = os.path.join(project_root, 'config.json')
-        test_config = {}
-        if os.path.exists(config_path):
-             try:
-                 with open(config_path, 'r') as f:
-                      test_config = json.load(f)
-                 print("Loaded config from config.json for test.")
-             except Exception as cfg_e:
-                  print(f"Warning: Could not load config.json: {cfg_e}. Using dummy config.")
-                  test_config = {'api': {'gemini': {'retries': 1}}, 'reasoning_tree': {}, 'council_orchestrator': {}}
-        else:
-             print("Warning: config.json not found. Using dummy config.")
-             test_config = {'api': {'gemini': {'retries': 1}}, 'reasoning_tree': {}, 'council_orchestrator': {}}
-
-        # Add dummy resolved_key if needed for direct run (assuming no .env)
-        if 'resolved_key' not in test_config.get('api',{}):
-             test_config.setdefault('api', {})['resolved_key'] = 'DUMMY_KEY_FOR_TEST'
-
-
-        try:
-            print("Step 1: Reading input (direct)...")
-            content = direct_read(file_path)
-            print("Input read successfully (direct).")
-
-            print("Step 2: Running critique council (direct)...")
-            # Call sync function
-            critique_data = direct_run_council(content, test_config) # No await
-            print("Council finished (direct).")
-
-            print("Step 3: Formatting output (direct)...")
-            formatted_output = direct_format(critique_data)
-            print("Output formatted (direct).")
-
-            print("Direct critique test process completed.")
-            return formatted_output
-        except FileNotFoundError as e:
-            print(f"Error (direct): Input file not found at {file_path}")
-            raise e
-        except IOError as e:
-            print(f"Error (direct): Could not read input file at {file_path}")
-            raise e
-        except Exception as e:
-            print(f"An unexpected error occurred during direct critique test: {e}")
-            raise Exception(f"Direct critique test failed unexpectedly: {e}") from e
-
-    # Path relative to the 'critique_council' directory
-    test_file_rel = 'content.txt' # Use content.txt as default test
+    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+    # Use config from file if available, else dummy
+    config_path = os.path.join(project_root, 'config.json')
+    test_config = {}
+    if os.path.exists(config_path):
+         try:
+             with open(config_path, 'r') as f:
+                  test_config = json.load(f)
+             print("Loaded config from config.json for test.")
+         except Exception as cfg_e:
+              print(f"Warning: Could not load config.json: {cfg_e}. Using dummy config.")
+              test_config = {'api': {'gemini': {'retries': 1}}, 'reasoning_tree': {}, 'council_orchestrator': {}}
+    else:
+         print("Warning: config.json not found. Using dummy config.")
+         test_config = {'api': {'gemini': {'retries': 1}}, 'reasoning_tree': {}, 'council_orchestrator': {}}
+
+    # Add dummy resolved_key if needed for direct run (assuming no .env)
+    if 'resolved_key' not in test_config.get('api',{}):
+         test_config.setdefault('api', {})['resolved_key'] = 'DUMMY_KEY_FOR_TEST'
+
+    # Path relative to the project root, content.txt by default
+    test_file_rel = sys.argv[1] if len(sys.argv) > 1 else 'content.txt'
     print(f"--- Running Example Usage (Direct Execution Context) ---")
     test_file_abs = os.path.abspath(os.path.join(project_root, test_file_rel))
 
@@ -148,8 +129,7 @@ if __name__ == '__main__':
          sys.exit(1)
 
     try:
-        # Run the synchronous test function
-        final_critique = direct_critique_test(test_file_abs) # No asyncio.run
+        final_critique = critique_goal_document(test_file_abs, test_config)
         print("\n--- Final Critique Output (Direct Execution Context) ---")
         print(final_critique)
     except Exception as e:
@@ -5,91 +5,205 @@ Component responsible for formatting the final critique output into Markdown,
 including summaries, scores, and detailed agent trees.
 """
 
+import asyncio
+import concurrent.futures
 import logging
 import datetime
+import functools
+import io
 import json
 import os
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, TextIO, Tuple
 
 # Import provider factory for LLM clients
-from .providers import call_with_retry
+from .providers import call_with_retry, get_llm_cache, LLMCache, submit_llm
 
 # Import the peer review enhancement text
 from .reasoning_agent import PEER_REVIEW_ENHANCEMENT
 
 logger = logging.getLogger(__name__)
 
-# --- Helper function to format critique tree recursively ---
-def format_critique_node(node: Optional[Dict[str, Any]], depth: int = 0) -> List[str]:
-    """Recursively formats a critique node and its children into Markdown lines."""
-    lines = []
-    if not node or not isinstance(node, dict): return lines
+# Prompt template used by the Judge to summarize and score the critique
+_JUDGE_PROMPT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'prompts', 'judge_summary.txt')
 
-    # Indentation based on depth (using 2 spaces per level for Markdown lists)
+@functools.lru_cache(maxsize=1)
+def _load_judge_prompt() -> str:
+    """Reads the Judge prompt template, once per process."""
+    with open(_JUDGE_PROMPT_PATH, 'r', encoding='utf-8') as f:
+        return f.read()
+
+# Warm the cache at import time so the first report does not wait on the
+# disk; a missing prompt file is reported when the Judge runs
+try:
+    _load_judge_prompt()
+except OSError:
+    pass
+
+# --- Helper functions to format critique trees ---
+def _node_prefixes(depth: int) -> Tuple[str, ...]:
+    """
+    Builds the fixed text that precedes each field of a node at the given depth:
+    claim, severity, confidence, evidence header, evidence line, arbitration,
+    recommendation and concession.
+    """
+    # Using 2 spaces per level for Markdown lists
     indent = "  " * depth
     # Use '*' for the first level, '-' for subsequent levels for better list rendering
     list_marker = "*" if depth == 0 else "-"
+    return (
+        f"{indent}{list_marker} **Claim:** ",
+        f"\n{indent}  - **Severity:** ",
+        f"\n{indent}  - **Confidence (Adjusted):** ",
+        f"{indent}  - **Evidence:**\n",
+        f"{indent}    > ",
+        f"{indent}  - **Expert Arbitration:** ",
+        f"{indent}  - **Recommendation:** ",
+        f"{indent}  - **Concession:** ",
+    )
 
-    claim = node.get('claim', 'N/A')
-    severity = node.get('severity', 'N/A')
-    confidence = node.get('confidence', 0.0)
-    evidence = node.get('evidence')
-    arbitration = node.get('arbitration')
-    sub_critiques = node.get('sub_critiques', [])
-
-    # Format current node as a list item
-    lines.append(f"{indent}{list_marker} **Claim:** {claim}")
-    lines.append(f"{indent}  - **Severity:** {severity}")
-    lines.append(f"{indent}  - **Confidence (Adjusted):** {confidence:.0%}")
-    if evidence:
-        evidence_lines = evidence.strip().split('\n')
-        lines.append(f"{indent}  - **Evidence:**")
-        for line in evidence_lines: lines.append(f"{indent}    > {line}")
-    if arbitration:
-        lines.append(f"{indent}  - **Expert Arbitration:** {arbitration}")
-    # Add Recommendation if present
-    recommendation = node.get('recommendation')
-    if recommendation:
-        lines.append(f"{indent}  - **Recommendation:** {recommendation}")
-    # Add Concession if present and not "None"
-    concession = node.get('concession')
-    if concession and concession.strip().lower() != "none":
-        lines.append(f"{indent}  - **Concession:** {concession}")
-
-    # Recursively format children, increasing depth
-    if sub_critiques:
-        # Add a sub-list marker if needed (adjust indentation for nested list)
-        # lines.append(f"{indent}  - **Sub-Critiques:**") # Optional header for sub-critiques
-        for sub_node in sub_critiques:
-            lines.extend(format_critique_node(sub_node, depth + 1)) # Increase depth
-
-    return lines
+# Field prefixes per tree depth, precomputed for the depths critique trees reach
+_NODE_PREFIXES = tuple(_node_prefixes(depth) for depth in range(32))
+
+def render_critique_tree(root: Optional[Dict[str, Any]], buf: TextIO, depth: int = 0) -> bool:
+    """
+    Writes a critique node and its children to buf as nested Markdown list items.
+    The tree is walked depth-first with an explicit stack, so deep trees cannot
+    exhaust the recursion limit.
+
+    Returns:
+        True if any node was written, False if the tree had no valid nodes.
+    """
+    written = False
+    stack = [(root, depth)]
+    while stack:
+        node, depth = stack.pop()
+        if not node or not isinstance(node, dict): continue
+        written = True
+
+        (claim_prefix, severity_prefix, confidence_prefix, evidence_header, evidence_prefix,
+         arbitration_prefix, recommendation_prefix, concession_prefix) = (
+            _NODE_PREFIXES[depth] if depth < len(_NODE_PREFIXES) else _node_prefixes(depth))
+
+        claim = node.get('claim', 'N/A')
+        severity = node.get('severity', 'N/A')
+        confidence = node.get('confidence', 0.0)
+        evidence = node.get('evidence')
+        arbitration = node.get('arbitration')
+        sub_critiques = node.get('sub_critiques', [])
+
+        # Format current node as a list item
+        buf.write(f"{claim_prefix}{claim}{severity_prefix}{severity}{confidence_prefix}{confidence:.0%}\n")
+        if evidence:
+            # splitlines also drops the '\r' of Windows line endings
+            evidence_lines = evidence.strip().splitlines() or ['']
+            buf.write(evidence_header)
+            # Quoted lines are joined in one pass: each line break continues the quote
+            evidence_separator = f"\n{evidence_prefix}"
+            buf.write(f"{evidence_prefix}{evidence_separator.join(evidence_lines)}\n")
+        if arbitration:
+            buf.write(f"{arbitration_prefix}{arbitration}\n")
+        # Add Recommendation if present
+        recommendation = node.get('recommendation')
+        if recommendation:
+            buf.write(f"{recommendation_prefix}{recommendation}\n")
+        # Add Concession if present and not "None"
+        concession = node.get('concession')
+        if concession and concession.strip().lower() != "none":
+            buf.write(f"{concession_prefix}{concession}\n")
+
+        # Children come next, in order, one level deeper
+        if sub_critiques:
+            stack.extend((sub_node, depth + 1) for sub_node in reversed(sub_critiques))
+
+    return written
+
+def format_critique_node(node: Optional[Dict[str, Any]], depth: int = 0) -> str:
+    """Formats a critique node and its children into Markdown, one line per list item."""
+    buf = io.StringIO()
+    render_critique_tree(node, buf, depth)
+    return buf.getvalue()
 # ---------------------------------------------------------
 
 # --- Helper function to generate Judge summary and score ---
-def generate_judge_summary_and_score(original_content: str, adjusted_trees: List[Dict[str, Any]], arbiter_data: Dict[str, Any], config: Dict[str, Any], peer_review: bool = False) -> Tuple[str, Optional[int], str]:
-    """Calls LLM with Judge prompt to generate summary, score, and justification."""
+# Judge result used when no agent produced a critique to summarize
+_NO_CRITIQUES_JUDGE_RESULT = ("No critiques produced; judge summary skipped.", None, "N/A")
+
+def _dumps_compact(data: Any) -> str:
+    """
+    Serializes data to compact JSON for an LLM prompt. Without indentation the
+    json module uses its C encoder, and the prompt spends no tokens on whitespace.
+    """
+    return json.dumps(data, separators=(',', ':'))
+
+def _build_judge_request(original_content: str, critique_data: Dict[str, Any], peer_review: bool = False) -> Tuple[str, Dict[str, str]]:
+    """
+    Builds the Judge prompt template and the context to fill it with.
+    Raises OSError if the prompt file cannot be read.
+    """
+    judge_logger = logging.getLogger('JudgeSummary')
+    judge_logger.debug("Loading Judge prompt from: %s", _JUDGE_PROMPT_PATH)
+    judge_prompt_template = _load_judge_prompt()
+
+    context = {
+        "original_content": original_content,
+        "adjusted_critique_trees_json": _dumps_compact(critique_data.get('adjusted_critique_trees', [])),
+        "arbitration_data_json": _dumps_compact({
+            'adjustments': critique_data.get('arbitration_adjustments', []),
+            'arbiter_overall_score': critique_data.get('arbiter_overall_score'),
+            'arbiter_score_justification': critique_data.get('arbiter_score_justification')
+        })
+    }
+
+    # Apply enhancement if needed
+    final_judge_prompt = judge_prompt_template
+    if peer_review:
+        final_judge_prompt += PEER_REVIEW_ENHANCEMENT
+        judge_logger.info("Peer Review enhancement applied to judge prompt.")
+
+    return final_judge_prompt, context
+
+def _parse_judge_result(judge_result: Any, model_used: str) -> Tuple[str, Optional[int], str]:
+    """Extracts the summary, score and justification from the Judge's structured response."""
     judge_logger = logging.getLogger('JudgeSummary')
-    judge_logger.info(f"Attempting to generate Judge Summary and Score... (Peer Review: {peer_review})")
-    default_return = ("Error: Judge summary generation failed.", None, "N/A")
+    if isinstance(judge_result, dict) and all(k in judge_result for k in ['judge_summary_text', 'judge_overall_score', 'judge_score_justification']):
+        summary = judge_result['judge_summary_text'].strip()
+        score = int(judge_result['judge_overall_score'])
+        justification = judge_result['judge_score_justification'].strip()
+        judge_logger.info("Judge Summary and Score generated successfully using %s. Score=%s", model_used, score)
+        judge_logger.debug("Judge Score Justification: %s", justification)
+        return summary, score, justification
+    else:
+        judge_logger.warning("Unexpected Judge result structure received from %s: %s", model_used, judge_result)
+        return ("Error: Invalid Judge result structure.", None, "N/A")
+
+def generate_judge_summary_and_score(original_content: str, critique_data: Dict[str, Any], config: Dict[str, Any], peer_review: bool = False) -> Tuple[str, Optional[int], str]:
+    """
+    Calls LLM with Judge prompt to generate summary, score, and justification.
+    The adjusted critique trees and the Expert Arbiter results are taken from critique_data.
+    """
+    judge_logger = logging.getLogger('JudgeSummary')
+    judge_logger.info("Attempting to generate Judge Summary and Score... (Peer Review: %s)", peer_review)
     try:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        prompt_path = os.path.join(base_dir, '..', 'prompts', 'judge_summary.txt')
-        judge_logger.debug(f"Loading Judge prompt from: {prompt_path}")
-        with open(prompt_path, 'r', encoding='utf-8') as f:
-            judge_prompt_template = f.read()
-
-        context = {
-            "original_content": original_content,
-            "adjusted_critique_trees_json": json.dumps(adjusted_trees, indent=2),
-            "arbitration_data_json": json.dumps(arbiter_data, indent=2)
-        }
-
-        # Apply enhancement if needed
-        final_judge_prompt = judge_prompt_template
-        if peer_review:
-            final_judge_prompt += PEER_REVIEW_ENHANCEMENT
-            judge_logger.info("Peer Review enhancement applied to judge prompt.")
+        final_judge_prompt, context = _build_judge_request(original_content, critique_data, peer_review)
+
+        # Reuse an earlier response to the identical request, when caching is
+        # enabled and the call is deterministic
+        openai_config = config.get('api', {}).get('openai', {})
+        cache = get_llm_cache(config)
+        cache_key = None
+        # A null temperature leaves sampling to the provider's default
+        temperature = openai_config.get('temperature', 0.2)
+        if cache is not None and temperature is not None and temperature <= 0:
+            cache_key = LLMCache.make_key(
+                model=openai_config.get('model', 'o1'),
+                prompt=final_judge_prompt,
+                context=context,
+                peer_review=peer_review
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                judge_logger.info("Using cached Judge Summary and Score.")
+                return _parse_judge_result(cached['result'], cached['model'])
 
         # Use the provider factory to call the appropriate LLM based on config
         judge_result, model_used = call_with_retry(
@@ -99,124 +213,211 @@ def generate_judge_summary_and_score(original_content: str, adjusted_trees: List
             is_structured=True
         )
 
-        if isinstance(judge_result, dict) and all(k in judge_result for k in ['judge_summary_text', 'judge_overall_score', 'judge_score_justification']):
-            summary = judge_result['judge_summary_text'].strip()
-            score = int(judge_result['judge_overall_score'])
-            justification = judge_result['judge_score_justification'].strip()
-            judge_logger.info(f"Judge Summary and Score generated successfully using {model_used}. Score={score}")
-            judge_logger.debug(f"Judge Score Justification: {justification}")
-            return summary, score, justification
-        else:
-            judge_logger.warning(f"Unexpected Judge result structure received from {model_used}: {judge_result}")
-            return ("Error: Invalid Judge result structure.", None, "N/A")
+        parsed = _parse_judge_result(judge_result, model_used)
+        # Only well-formed results are worth replaying
+        if cache_key is not None and parsed[1] is not None:
+            cache.set(cache_key, {'result': judge_result, 'model': model_used})
+        return parsed
 
     except FileNotFoundError:
-        error_msg = f"Judge summary prompt file not found at {prompt_path}"
+        error_msg = f"Judge summary prompt file not found at {_JUDGE_PROMPT_PATH}"
         judge_logger.error(error_msg)
         return f"Error: {error_msg}", None, "N/A"
     except Exception as e:
         error_msg = f"Failed to generate Judge summary/score: {e}"
         judge_logger.error(error_msg, exc_info=True)
         return f"Error generating Judge summary: {e}", None, "N/A"
+
+async def generate_judge_summary_and_score_async(original_content: str, critique_data: Dict[str, Any], config: Dict[str, Any], peer_review: bool = False) -> Tuple[str, Optional[int], str]:
+    """
+    Awaitable variant of generate_judge_summary_and_score. The blocking provider
+    call runs on the shared provider worker pool, so Judge calls for several
+    reports can overlap.
+    """
+    return await asyncio.wrap_future(submit_llm(generate_judge_summary_and_score, original_content, critique_data, config, peer_review))
 # --------------------------------------------------
 
 
-def format_critique_output(critique_data: Dict[str, Any], original_content: str, config: Dict[str, Any], peer_review: bool = False) -> str:
+def _render_body(arbiter_adjustments: List[Dict[str, Any]], agent_plan: List[Tuple[str, str, Any]], has_critique_data: bool, has_critiques: bool = True) -> str:
     """
-    Formats the synthesized critique data into a detailed Markdown report string.
-    Accepts a peer_review flag to modify Judge persona behavior.
+    Formats the report sections that do not depend on the Judge: the Expert
+    Arbiter adjustments and the detailed agent critiques. The adjustment
+    summary is left out when there are neither adjustments nor critiques.
     """
-    output_lines = []
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    body = io.StringIO()
 
-    output_lines.append(f"# Critique Assessment Report")
-    output_lines.append(f"**Generated:** {now}")
-    output_lines.append("---")
+    # --- Arbiter Adjustments Summary ---
+    # Left out when there was nothing for the Expert Arbiter to adjust
+    if arbiter_adjustments or has_critiques:
+        body.write("## Expert Arbiter Adjustment Summary\n")
+        if arbiter_adjustments:
+            body.write(f"The Expert Arbiter provided {len(arbiter_adjustments)} specific comments/adjustments:\n")
+            for i, adj in enumerate(arbiter_adjustments):
+                target_id = adj.get('target_claim_id', 'N/A')
+                comment = adj.get('arbitration_comment', 'N/A')
+                delta = adj.get('confidence_delta', 0.0)
+                body.write(
+                    f"{i+1}. **Target Claim ID:** `{target_id}`\n"
+                    f"   - **Comment:** {comment}\n"
+                    f"   - **Confidence Delta:** {delta:+.2f}\n"
+                )
+        else:
+            body.write("The Expert Arbiter provided no specific adjustments.\n")
+        body.write("\n---\n")
 
-    # --- Get Data ---
-    adjusted_trees = critique_data.get('adjusted_critique_trees', [])
-    arbiter_data = {
-        'adjustments': critique_data.get('arbitration_adjustments', []),
-        'arbiter_overall_score': critique_data.get('arbiter_overall_score'),
-        'arbiter_score_justification': critique_data.get('arbiter_score_justification')
-    }
-    score_metrics = critique_data.get('score_metrics', {})
 
-    # --- Generate Judge Summary and Score ---
-    judge_summary, judge_score, judge_justification = generate_judge_summary_and_score(
-        original_content, adjusted_trees, arbiter_data, config, peer_review=peer_review
-    )
+    # --- Detailed Agent Critiques ---
+    body.write("## Detailed Agent Critiques\n")
+    if not has_critique_data:
+         body.write("No critique data available.\n")
+    else:
+        for agent_style, kind, payload in agent_plan:
+            body.write(f"### Agent: {agent_style}\n")
+            if kind == 'error':
+                body.write(f"- **Error during critique:** {payload}\n")
+            elif kind == 'tree':
+                # Write the full tree starting at depth 0
+                if not render_critique_tree(payload, body):
+                     body.write("- Critique terminated early or no valid points generated.\n")
+            else:
+                body.write("- No valid critique tree generated.\n")
+            body.write("\n---\n")
+
+    return body.getvalue()
+
+
+# --- Report layout ---
+_REPORT_HEADER_TEMPLATE = """# Critique Assessment Report
+**Generated:** {now}
+---
+"""
+
+_SCORES_TEMPLATE = """## Overall Judge Summary
+{judge_summary}
+
+---
+## Overall Scores & Metrics
+- **Final Judge Score:** {judge_score}/100
+{judge_justification}- **Expert Arbiter Score:** {arbiter_score}/100
+{arbiter_justification}- **High/Critical Severity Points (Post-Arbitration):** {high_sev}
+- **Medium Severity Points (Post-Arbitration):** {med_sev}
+- **Low Severity Points (Post-Arbitration):** {low_sev}
+
+---
+"""
+
+# Justification line under a score, included only when there is one
+_JUSTIFICATION_TEMPLATE = "  - *Justification:* {justification}\n"
 
-    # --- Judge Summary Section ---
-    output_lines.append("## Overall Judge Summary")
-    output_lines.append(judge_summary)
-    output_lines.append("")
-    output_lines.append("---")
+_REPORT_TRAILER = "\n--- End of Report ---"
 
-    # --- Scoring Summary Section ---
-    arbiter_score = arbiter_data.get('arbiter_overall_score', 'N/A')
+
+def _plan_agent_sections(adjusted_trees: List[Dict[str, Any]]) -> List[Tuple[str, str, Any]]:
+    """Decides what to write for each agent: (agent style, 'error' / 'tree' / 'empty', payload)."""
+    agent_plan = []
+    for agent_critique in adjusted_trees:
+        agent_style = agent_critique.get('agent_style', 'Unknown Agent')
+        if agent_style == 'ExpertArbiter': continue # Skip arbiter pseudo-agent
+        if agent_critique.get('error'):
+            agent_plan.append((agent_style, 'error', agent_critique['error']))
+        elif agent_critique.get('critique_tree'):
+            agent_plan.append((agent_style, 'tree', agent_critique['critique_tree']))
+        else:
+            agent_plan.append((agent_style, 'empty', None))
+    return agent_plan
+
+
+def _assemble_report(now: str, critique_data: Dict[str, Any], judge_result: Tuple[str, Optional[int], str], body: str) -> str:
+    """Writes the header, the Judge and score sections, the prerendered body and the trailer."""
+    judge_summary, judge_score, judge_justification = judge_result
+
+    # --- Get Data ---
+    arbiter_score = critique_data.get('arbiter_overall_score')
+    arbiter_justification = critique_data.get('arbiter_score_justification')
+    score_metrics = critique_data.get('score_metrics', {})
     high_sev = score_metrics.get('high_severity_points', 0)
     med_sev = score_metrics.get('medium_severity_points', 0)
     low_sev = score_metrics.get('low_severity_points', 0)
 
-    output_lines.append("## Overall Scores & Metrics")
-    output_lines.append(f"- **Final Judge Score:** {judge_score if judge_score is not None else 'N/A'}/100")
-    if judge_score is not None:
-         output_lines.append(f"  - *Justification:* {judge_justification}")
-    output_lines.append(f"- **Expert Arbiter Score:** {arbiter_score if arbiter_score is not None else 'N/A'}/100")
-    if arbiter_data.get('arbiter_score_justification'):
-         output_lines.append(f"  - *Justification:* {arbiter_data['arbiter_score_justification']}")
-    output_lines.append(f"- **High/Critical Severity Points (Post-Arbitration):** {high_sev}")
-    output_lines.append(f"- **Medium Severity Points (Post-Arbitration):** {med_sev}")
-    output_lines.append(f"- **Low Severity Points (Post-Arbitration):** {low_sev}")
-    output_lines.append("")
-    output_lines.append("---")
+    buf = io.StringIO()
+    buf.write(_REPORT_HEADER_TEMPLATE.format_map({'now': now}))
 
-    # --- Arbiter Adjustments Summary ---
-    output_lines.append("## Expert Arbiter Adjustment Summary")
-    arbiter_adjustments = arbiter_data.get('adjustments', [])
-    if arbiter_adjustments:
-        output_lines.append(f"The Expert Arbiter provided {len(arbiter_adjustments)} specific comments/adjustments:")
-        for i, adj in enumerate(arbiter_adjustments):
-            target_id = adj.get('target_claim_id', 'N/A')
-            comment = adj.get('arbitration_comment', 'N/A')
-            delta = adj.get('confidence_delta', 0.0)
-            output_lines.append(f"{i+1}. **Target Claim ID:** `{target_id}`")
-            output_lines.append(f"   - **Comment:** {comment}")
-            output_lines.append(f"   - **Confidence Delta:** {delta:+.2f}")
-    else:
-        output_lines.append("The Expert Arbiter provided no specific adjustments.")
-    output_lines.append("")
-    output_lines.append("---")
+    # --- Judge Summary and Scoring Summary Sections ---
+    buf.write(_SCORES_TEMPLATE.format_map({
+        'judge_summary': judge_summary,
+        'judge_score': judge_score if judge_score is not None else 'N/A',
+        'judge_justification': _JUSTIFICATION_TEMPLATE.format_map({'justification': judge_justification}) if judge_score is not None else '',
+        'arbiter_score': arbiter_score if arbiter_score is not None else 'N/A',
+        'arbiter_justification': _JUSTIFICATION_TEMPLATE.format_map({'justification': arbiter_justification}) if arbiter_justification else '',
+        'high_sev': high_sev,
+        'med_sev': med_sev,
+        'low_sev': low_sev,
+    }))
 
+    buf.write(body)
 
-    # --- Detailed Agent Critiques ---
-    output_lines.append("## Detailed Agent Critiques")
-    if not adjusted_trees:
-         output_lines.append("No critique data available.")
+    buf.write(_REPORT_TRAILER)
+    return buf.getvalue()
+
+
+def _start_report(critique_data: Dict[str, Any], original_content: str, config: Dict[str, Any], peer_review: bool, now: Optional[str]) -> Tuple[str, Optional[concurrent.futures.Future], str]:
+    """
+    Does the work shared by the sync and async formatters: submits the Judge
+    call, when there is anything to judge, and renders the sections that do
+    not depend on it while the call is in flight.
+
+    Returns:
+        The "Generated" timestamp, the future of the Judge result (None when
+        no agent produced a critique) and the rendered body.
+    """
+    if now is None:
+        now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    adjusted_trees = critique_data.get('adjusted_critique_trees', [])
+    arbiter_adjustments = critique_data.get('arbitration_adjustments', [])
+    agent_plan = _plan_agent_sections(adjusted_trees)
+
+    # Only agents that produced a critique tree give the Judge anything to summarize
+    has_critiques = any(kind == 'tree' for _, kind, _ in agent_plan)
+
+    # --- Generate Judge Summary and Score ---
+    if has_critiques:
+        # The Judge LLM call waits on the network in the background while
+        # the sections that do not depend on it are formatted here
+        judge_future = submit_llm(
+            generate_judge_summary_and_score,
+            original_content, critique_data, config, peer_review=peer_review
+        )
     else:
-        for agent_critique in adjusted_trees:
-            agent_style = agent_critique.get('agent_style', 'Unknown Agent')
-            if agent_style == 'ExpertArbiter': continue # Skip arbiter pseudo-agent
-
-            output_lines.append(f"### Agent: {agent_style}")
-            if 'error' in agent_critique and agent_critique['error']:
-                output_lines.append(f"- **Error during critique:** {agent_critique['error']}")
-            elif 'critique_tree' in agent_critique and agent_critique['critique_tree']:
-                # Format the full tree recursively starting at depth 0
-                tree_lines = format_critique_node(agent_critique['critique_tree'], depth=0)
-                if not tree_lines:
-                     output_lines.append("- Critique terminated early or no valid points generated.")
-                else:
-                     output_lines.extend(tree_lines) # Add formatted tree lines
-            else:
-                output_lines.append("- No valid critique tree generated.")
-            output_lines.append("")
-            output_lines.append("---")
+        # Skip the LLM round-trip when every agent failed or produced nothing
+        logger.info("No critiques produced; skipping the Judge summary.")
+        judge_future = None
+
+    body = _render_body(arbiter_adjustments, agent_plan, bool(adjusted_trees), has_critiques)
+    return now, judge_future, body
+
+
+def format_critique_output(critique_data: Dict[str, Any], original_content: str, config: Dict[str, Any], peer_review: bool = False, *, now: Optional[str] = None) -> str:
+    """
+    Formats the synthesized critique data into a detailed Markdown report string.
+    Accepts a peer_review flag to modify Judge persona behavior, and an optional
+    preformatted "Generated" timestamp, which defaults to the current time.
+    Callers producing many reports can format the timestamp once and pass it in.
+    """
+    now, judge_future, body = _start_report(critique_data, original_content, config, peer_review, now)
+    judge_result = judge_future.result() if judge_future is not None else _NO_CRITIQUES_JUDGE_RESULT
+    return _assemble_report(now, critique_data, judge_result, body)
 
 
-    output_lines.append("\n--- End of Report ---")
-    return "\n".join(output_lines)
+async def format_critique_output_async(critique_data: Dict[str, Any], original_content: str, config: Dict[str, Any], peer_review: bool = False, *, now: Optional[str] = None) -> str:
+    """
+    Awaitable variant of format_critique_output for callers formatting several
+    reports at once, e.g. with asyncio.gather(*(format_critique_output_async(d, c, config) for d, c in docs)).
+    The Judge calls run on the shared provider worker pool and overlap with each other.
+    """
+    now, judge_future, body = _start_report(critique_data, original_content, config, peer_review, now)
+    judge_result = await asyncio.wrap_future(judge_future) if judge_future is not None else _NO_CRITIQUES_JUDGE_RESULT
+    return _assemble_report(now, critique_data, judge_result, body)
 
 # Example usage - Needs update if run directly
 if __name__ == '__main__':
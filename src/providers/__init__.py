@@ -8,6 +8,8 @@ This package contains implementations for different AI model providers:
 - gemini_client.py: Google's Gemini API
 - model_config.py: Centralized configuration for all model providers
 - decorators.py: Useful decorators for error handling, retries, caching, and other cross-cutting concerns
+- llm_cache.py: Response cache for deterministic (temperature 0) LLM calls
+- rate_limiter.py: Shared client-side rate limits per provider and model
 
 These implementations are used by both:
 1) The AI clients interface in src/syncretic_catalyst/ai_clients.py
@@ -17,6 +19,10 @@ Each provider module now exposes a high-level run_*_client function that accepts
 message format and handles all the provider-specific details internally.
 """
 
+import asyncio
+import concurrent.futures
+import os
+
 # Import the main client modules to make them available through the package
 from . import anthropic_client
 from . import deepseek_client
@@ -45,6 +51,33 @@ from .decorators import (
     cache_result
 )
 
+# Response cache for repeated deterministic calls
+from .llm_cache import LLMCache, get_llm_cache
+
+# Client-side rate limits shared by concurrent calls
+from .rate_limiter import RateLimiter, get_rate_limiter
+
+# Worker threads shared by callers that run provider calls in the background.
+# Threads are only started when work is submitted.
+_SHARED_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.environ.get('CRITIQUE_LLM_POOL', 16)),
+    thread_name_prefix='llm'
+)
+
+def submit_llm(fn, *args, **kwargs):
+    """
+    Runs a blocking provider call on the shared worker pool.
+
+    Args:
+        fn: The callable to run, e.g. call_with_retry
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        A concurrent.futures.Future with the call's result
+    """
+    return _SHARED_POOL.submit(fn, *args, **kwargs)
+
 # For backwards compatibility with existing code:
 # Re-export the call_with_retry function that uses openai_client (default provider)
 def call_with_retry(
@@ -66,10 +99,39 @@ def call_with_retry(
     Returns:
         Tuple of (response, model_used)
     """
-    # Use openai_client by default
+    # Use openai_client by default; it applies the OpenAI rate limit to each attempt
     return openai_client.call_openai_with_retry(
         prompt_template=prompt_template,
         context=context,
         config=config,
         is_structured=is_structured
     )
+
+
+async def acall_with_retry(
+    prompt_template,
+    context,
+    config,
+    is_structured=False
+):
+    """
+    Awaitable version of call_with_retry for asyncio callers.
+    The blocking provider call runs on the shared worker pool, so concurrent
+    awaits overlap on the network up to the pool size.
+
+    Args:
+        prompt_template: The template string with placeholders
+        context: Dictionary with values for the placeholders
+        config: Configuration options
+        is_structured: Whether to expect structured (JSON) output
+
+    Returns:
+        Tuple of (response, model_used)
+    """
+    return await asyncio.wrap_future(submit_llm(
+        call_with_retry,
+        prompt_template=prompt_template,
+        context=context,
+        config=config,
+        is_structured=is_structured
+    ))
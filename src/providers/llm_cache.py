@@ -0,0 +1,193 @@
+"""
+Response cache for deterministic LLM calls.
+
+Re-running the pipeline on the same input at temperature 0 sends the provider
+byte-identical requests. This module lets callers reuse the earlier response
+instead of paying for another round-trip. Entries are keyed on a SHA-256 of
+the model, prompt and context, and kept either in memory or in a JSON file.
+
+Configured through the optional "cache" section of the application config:
+
+    "cache": {
+        "enabled": false,
+        "backend": "file",            # "memory" or "file"
+        "path": "data/llm_cache.json",
+        "ttl_seconds": 86400          # 0 or null keeps entries forever
+    }
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default location of the file backend, relative to the working directory
+DEFAULT_CACHE_PATH = os.path.join("data", "llm_cache.json")
+
+# Supported storage backends
+BACKENDS = ("memory", "file")
+
+# Instances shared by callers with the same settings, keyed by (backend, path, ttl)
+_shared_caches: Dict[Tuple[str, str, Optional[float]], "LLMCache"] = {}
+_shared_caches_lock = threading.Lock()
+
+
+class LLMCache:
+    """
+    Thread-safe key/value store for LLM responses with an optional time-to-live.
+
+    The file backend loads the whole file on first use and rewrites it
+    atomically after each new entry, so entries survive between runs.
+    """
+
+    def __init__(self, backend: str = "memory", path: str = DEFAULT_CACHE_PATH, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            backend: "memory" or "file"
+            path: JSON file used by the file backend
+            ttl_seconds: Maximum age of an entry in seconds; None or 0 for no expiry
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown LLM cache backend '{backend}'. Expected one of: {', '.join(BACKENDS)}")
+        self.backend = backend
+        self.path = path
+        self.ttl_seconds = ttl_seconds or None
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """
+        Build a cache key from the parts of a request.
+
+        Args:
+            **parts: JSON-serializable request fields, e.g. model, prompt and context
+
+        Returns:
+            SHA-256 hex digest of the parts serialized with sorted keys
+        """
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Return the entry table, reading the cache file on first use."""
+        if self._entries is None:
+            self._entries = {}
+            if self.backend == "file" and os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        entries = json.load(f)
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable LLM cache file {self.path}: {e}")
+                else:
+                    if isinstance(entries, dict):
+                        self._entries = entries
+                    else:
+                        logger.warning(f"Ignoring LLM cache file {self.path}: expected a JSON object")
+        return self._entries
+
+    def _is_fresh(self, entry: Any, now: float) -> bool:
+        """
+        Check whether a stored entry is well-formed and within its time-to-live.
+
+        Args:
+            entry: Entry from the table, as read from the cache file
+            now: Current time in seconds since the epoch
+
+        Returns:
+            True if the entry can be returned
+        """
+        if not isinstance(entry, dict) or "value" not in entry:
+            return False
+        stored_at = entry.get("stored_at")
+        if not isinstance(stored_at, (int, float)):
+            return False
+        return not self.ttl_seconds or now - stored_at < self.ttl_seconds
+
+    def _save(self) -> None:
+        """Write the entry table to the cache file, replacing it atomically."""
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # A temporary file of its own, so concurrent writers never share one
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            key: Key from make_key
+
+        Returns:
+            The cached value, or None if absent, expired or malformed
+        """
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is None or not self._is_fresh(entry, time.time()):
+                return None
+            return entry["value"]
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value.
+
+        Args:
+            key: Key from make_key
+            value: Value to cache
+        """
+        with self._lock:
+            entries = self._load()
+            now = time.time()
+            entries[key] = {"value": value, "stored_at": now}
+            # Expired and malformed entries are dropped when the cache is next written
+            for stale in [k for k, e in entries.items() if not self._is_fresh(e, now)]:
+                del entries[stale]
+            if self.backend == "file":
+                try:
+                    self._save()
+                except OSError as e:
+                    logger.warning(f"Could not write LLM cache file {self.path}: {e}")
+
+
+def get_llm_cache(config: Dict[str, Any]) -> Optional[LLMCache]:
+    """
+    Return the shared cache for the "cache" section of config.
+
+    Args:
+        config: Application configuration
+
+    Returns:
+        The LLMCache for these settings, or None if caching is not enabled
+    """
+    cache_config = config.get("cache") or {}
+    if not cache_config.get("enabled"):
+        return None
+
+    settings = (
+        cache_config.get("backend", "file"),
+        cache_config.get("path", DEFAULT_CACHE_PATH),
+        cache_config.get("ttl_seconds"),
+    )
+    with _shared_caches_lock:
+        cache = _shared_caches.get(settings)
+        if cache is None:
+            cache = _shared_caches[settings] = LLMCache(*settings)
+        return cache
@@ -4,6 +4,7 @@ Provides functions to call OpenAI models with retry logic and high-level interfa
 """
 
 import logging
+import functools
 import json
 import time
 import os
@@ -14,9 +15,30 @@ from .exceptions import ModelCallError, MaxRetriesExceededError
 # Import the model configuration and decorators
 from .model_config import get_openai_config
 from .decorators import with_retry, with_error_handling, cache_result
+from .rate_limiter import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: str) -> OpenAI:
+    """
+    Return the OpenAI client for an API key, created on first use.
+    The client is thread-safe, and sharing it lets calls reuse its pooled
+    keep-alive connections instead of opening a new one every time.
+    """
+    return OpenAI(api_key=api_key)
+
+def _send_request(create, limiter, **params):
+    """
+    Send one API request, waiting for the rate limiter first when there is one.
+    Each attempt of a retried call takes its own token, so retries are
+    spaced out like any other request.
+    """
+    if limiter is None:
+        return create(**params)
+    with limiter:
+        return create(**params)
+
 @with_error_handling
 @with_retry(max_attempts=3, delay_base=2.0)
 def call_openai_with_retry(
@@ -56,8 +78,9 @@ def call_openai_with_retry(
     if not api_key:
         raise ModelCallError("OpenAI API key not found in configuration or environment")
     
-    # Create OpenAI client
-    client = OpenAI(api_key=api_key)
+    # Get the shared OpenAI client and the rate limit for the model, if one is configured
+    client = _get_client(api_key)
+    limiter = get_rate_limiter('openai', default_model, config)
     
     # Format prompt with context
     formatted_prompt = prompt_template
@@ -135,7 +158,7 @@ def call_openai_with_retry(
     # Process O1 response or chat completion response based on model type
     if is_response_api_model:
         logger.debug(f"Using responses.create API for {default_model} model")
-        response = client.responses.create(**model_params)
+        response = _send_request(client.responses.create, limiter, **model_params)
         
         # Extract content from o1 response format which has a complex structure
         try:
@@ -224,7 +247,7 @@ def call_openai_with_retry(
             raise ModelCallError(f"Error processing {default_model} response: {e}")
     else:
         logger.debug(f"Using Chat Completions API endpoint with params")
-        response = client.chat.completions.create(**model_params)
+        response = _send_request(client.chat.completions.create, limiter, **model_params)
         
         # Extract content from standard completion response
         if hasattr(response, 'choices') and len(response.choices) > 0 and hasattr(response.choices[0], 'message'):
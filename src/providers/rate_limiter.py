@@ -0,0 +1,140 @@
+"""
+Client-side rate limiting for provider calls.
+
+When many agent calls run at once they can exceed a provider's rate limit,
+and each call then backs off on its own after a 429. A shared limiter per
+(provider, model) spaces the calls out before they are sent, so retries
+become the exception.
+
+Configured per provider in the optional "rate_limits" section of the API config:
+
+    "api": {
+        "rate_limits": {
+            "openai": {"rps": 2, "burst": 5, "max_concurrent": 8}
+        }
+    }
+
+Providers without an entry are not limited.
+"""
+
+import time
+import logging
+import threading
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Limiters shared by all callers, keyed by (provider, model, rps, burst, max_concurrent)
+_limiters: Dict[Tuple[Any, ...], "RateLimiter"] = {}
+_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket with an optional cap on calls in flight.
+
+    Used as a context manager around a provider call: entering waits for a
+    free slot and a token, leaving frees the slot.
+    """
+
+    def __init__(self, rps: Optional[float] = None, burst: Optional[int] = None, max_concurrent: Optional[int] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rps: Sustained calls per second; None for no rate limit
+            burst: Calls that may start back to back before rps applies (default 1)
+            max_concurrent: Maximum calls in flight at once; None for no cap
+        """
+        self.rps = float(rps) if rps else None
+        self.burst = max(1, int(burst or 1))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+        # Observability counters
+        self.calls = 0
+        self.delayed_calls = 0
+        self.wait_seconds = 0.0
+
+    def _reserve_token(self) -> float:
+        """
+        Take a token from the bucket.
+
+        Returns:
+            Seconds to wait before the call may start
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rps)
+        self._updated = now
+        self._tokens -= 1
+        # A negative balance reserves a future token; wait until it is refilled
+        return -self._tokens / self.rps if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Block until a call may start."""
+        start = time.monotonic()
+        if self._slots is not None:
+            self._slots.acquire()
+        with self._lock:
+            delay = self._reserve_token() if self.rps else 0.0
+        if delay > 0:
+            time.sleep(delay)
+        waited = time.monotonic() - start
+        with self._lock:
+            self.calls += 1
+            if waited > 0.001:
+                self.delayed_calls += 1
+                self.wait_seconds += waited
+
+    def release(self) -> None:
+        """Mark a call as finished."""
+        if self._slots is not None:
+            self._slots.release()
+
+    def __enter__(self) -> "RateLimiter":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the limiter's counters.
+
+        Returns:
+            Dictionary with calls, delayed_calls and wait_seconds
+        """
+        with self._lock:
+            return {
+                'calls': self.calls,
+                'delayed_calls': self.delayed_calls,
+                'wait_seconds': self.wait_seconds,
+            }
+
+
+def get_rate_limiter(provider: str, model: str, config: Dict[str, Any]) -> Optional[RateLimiter]:
+    """
+    Return the shared limiter for a provider and model.
+
+    Args:
+        provider: Provider name, e.g. "openai"
+        model: Model name the call will use
+        config: Application configuration
+
+    Returns:
+        The RateLimiter for these settings, or None if the provider is not limited
+    """
+    limits = config.get('api', {}).get('rate_limits', {}).get(provider)
+    if not limits:
+        return None
+
+    key = (provider, model, limits.get('rps'), limits.get('burst'), limits.get('max_concurrent'))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = RateLimiter(*key[2:])
+            logger.debug(f"Created rate limiter for {provider}/{model}: {limits}")
+        return limiter
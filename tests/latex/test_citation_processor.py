@@ -0,0 +1,142 @@
+"""
+Unit tests for the CitationProcessor.
+
+These tests pin the LaTeX produced for in-text citations to what the original
+one-substitution-per-pattern implementation produced.
+"""
+
+import unittest
+
+from src.latex.processors.citation_processor import CitationProcessor
+
+
+class TestReplaceCitations(unittest.TestCase):
+    """Tests for rewriting in-text citations as cite commands."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = CitationProcessor()
+
+    def test_apa_citation(self):
+        """(Author, Year) becomes a \\cite on the author's last name."""
+        self.assertEqual(
+            self.processor._replace_citations("Prior work (Smith, 2020) and (van Dyke, 2019b) disagree."),
+            "Prior work \\cite{smith2020} and \\cite{dyke2019b} disagree."
+        )
+
+    def test_author_year_citation(self):
+        """Author (Year) becomes \\citeauthor and \\citeyear."""
+        self.assertEqual(
+            self.processor._replace_citations("Kant (1781) replied to (Hume, 1739) in the first Critique."),
+            "\\citeauthor{kant1781} (\\citeyear{kant1781}) replied to \\cite{hume1739} in the first Critique."
+        )
+
+    def test_author_year_takes_the_preceding_run_of_words(self):
+        """The letters and whitespace before (Year) are all replaced, as they always were."""
+        self.assertEqual(
+            self.processor._replace_citations("This was first argued at length by the young Kant (1781)."),
+            "\\citeauthor{kant1781} (\\citeyear{kant1781})."
+        )
+        self.assertEqual(
+            self.processor._replace_citations("As Kant (1781) argued, and Hume (1739) denied."),
+            "\\citeauthor{kant1781} (\\citeyear{kant1781}) argued,"
+            "\\citeauthor{hume1739} (\\citeyear{hume1739}) denied."
+        )
+        self.assertEqual(
+            self.processor._replace_citations("Kant  (1781) and\nHume (1739)"),
+            "\\citeauthor{kant1781} (\\citeyear{kant1781})\\citeauthor{hume1739} (\\citeyear{hume1739})"
+        )
+
+    def test_apa_citation_with_long_or_padded_author(self):
+        """APA citations match whatever letters and spaces precede the comma."""
+        self.assertEqual(
+            self.processor._replace_citations("See (the classic study by van Dyke, 2019b) and ( Smith, 2020)."),
+            "See \\cite{dyke2019b} and \\cite{smith2020}."
+        )
+
+    def test_long_prose_without_citations(self):
+        """Long runs of words are left alone."""
+        content = "word " * 20000 + "(see above)"
+        self.assertEqual(self.processor._replace_citations(content), content)
+
+
+class TestExtractCitations(unittest.TestCase):
+    """Tests for collecting citations from the body and the References section."""
+
+    REFERENCES = (
+        "Kant, Immanuel. (1781). Critique of Pure Reason. Cambridge University Press.\n"
+        "Hume, David. (1739). A Treatise. Journal of Philosophy.\n"
+        "Popper K. (1959). Logic of Discovery\n"
+    )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = CitationProcessor()
+
+    def extract(self, content):
+        """Extract the citations of content with a fresh processor."""
+        processor = CitationProcessor()
+        processor._extract_citations(content)
+        return processor._citations
+
+    def test_references_section_entries(self):
+        """Entries after a References heading are parsed; only the body is scanned for in-text citations."""
+        citations = self.extract("Body cites Kant (1781) and (Rawls, 1971).\n\n## References\n\n" + self.REFERENCES)
+        self.assertEqual(citations, {
+            'kant1781': {
+                'author': 'Kant, Immanuel', 'year': '1781', 'title': 'Critique of Pure Reason',
+                'publisher': 'Cambridge University Press', 'type': 'book'
+            },
+            'hume1739': {
+                'author': 'Hume, David', 'year': '1739', 'title': 'A Treatise',
+                'publisher': 'Journal of Philosophy', 'type': 'article'
+            },
+            'k1959': {'author': 'Popper K', 'year': '1959', 'title': 'Logic of Discovery', 'type': 'misc'},
+            'rawls1971': {'author': 'Rawls', 'year': '1971', 'title': 'Reference by Rawls', 'type': 'misc'},
+        })
+
+    def test_entries_after_separator(self):
+        """A --- separator also starts the bibliography, without ending the body."""
+        citations = self.extract("Body text.\n---\nRawls, John. (1971). A Theory of Justice. Harvard Proceedings.\n")
+        self.assertEqual(citations['rawls1971'], {
+            'author': 'Rawls, John', 'year': '1971', 'title': 'A Theory of Justice',
+            'publisher': 'Harvard Proceedings', 'type': 'article'
+        })
+        self.assertEqual(citations['john1971']['title'], 'Reference by  John')
+
+    def test_heading_variants(self):
+        """Only headings of one to three hashes followed by whitespace start the bibliography."""
+        entry = "Rawls, John. (1971). A Theory of Justice. Harvard Proceedings."
+        for heading in ("# references", "### References and notes", "##\tReferences"):
+            self.assertIn('rawls1971', self.extract(f"{heading}\n{entry}"), heading)
+        for heading in ("#### References", "##References", " ## References", "--"):
+            self.assertNotIn('rawls1971', self.extract(f"{heading}\n{entry}"), heading)
+
+    def test_headings_mentioning_references_do_not_end_the_body(self):
+        """Only a heading that is just References ends the body scanned for in-text citations."""
+        content = "## References to Kant\nKant (1781) is cited.\n\n##  references \n\nHume (1739) is listed.\n"
+        citations = self.extract(content)
+        self.assertIn('kant1781', citations)
+        self.assertNotIn('hume1739', citations)
+
+    def test_later_headings_and_blank_lines_are_skipped(self):
+        """Further separators, headings and blank lines inside the bibliography are not entries."""
+        citations = self.extract("## References\n\n---\n   \n## References\n" + self.REFERENCES.rstrip("\n"))
+        self.assertEqual(sorted(citations), ['hume1739', 'k1959', 'kant1781'])
+
+    def test_heading_on_last_line(self):
+        """A References heading without following lines yields no entries."""
+        self.assertEqual(self.extract("Plain body.\n## References"), {})
+
+    def test_process_rewrites_body_and_keeps_references(self):
+        """process rewrites in-text citations and leaves reference lines as written."""
+        content = "Body cites Kant (1781).\n\n## References\n\n" + self.REFERENCES
+        processed = self.processor.process(content, {"generate_bibtex": False})
+        self.assertEqual(
+            processed,
+            "\\citeauthor{kant1781} (\\citeyear{kant1781}).\n\n## References\n\n" + self.REFERENCES
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
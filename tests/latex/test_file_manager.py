@@ -0,0 +1,208 @@
+"""
+Unit tests for the FileManager.
+
+These tests pin template rendering to what the original one-replace-per-key
+implementation produced, and cover the output directory and copying
+templates to it.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.latex.utils.file_manager import FileManager
+
+# Keys the LaTeX formatter passes to its templates
+TEMPLATE_KEYS = (
+    'title', 'author', 'date', 'abstract', 'content',
+    'original_content', 'analysis_content', 'review_content',
+)
+
+
+def sequential_reference(template_content, context):
+    """Render a template one key at a time, in the original order."""
+    rendered = template_content
+    for key, value in context.items():
+        rendered = rendered.replace(f"${key}$", str(value))
+    for key, value in context.items():
+        if_start, if_end = f"$if({key})$", f"$endif({key})$"
+        if_pos, endif_pos = rendered.find(if_start), rendered.find(if_end)
+        if if_start in rendered and endif_pos > if_pos:
+            block = rendered[if_pos + len(if_start):endif_pos] if value else ""
+            rendered = rendered[:if_pos] + block + rendered[endif_pos + len(if_end):]
+    return rendered
+
+
+class TestRenderTemplate(unittest.TestCase):
+    """Tests for rendering templates with a context."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_manager = FileManager({'output_dir': self.temp_dir})
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_placeholders(self):
+        """Every occurrence of a $key$ placeholder is replaced by its value."""
+        self.assertEqual(
+            self.file_manager.render_template("$title$ by $author$ ($title$), $missing$", {'title': 'On Doubt', 'author': 'R. D.'}),
+            "On Doubt by R. D. (On Doubt), $missing$"
+        )
+
+    def test_conditional_sections(self):
+        """Blocks for true values are kept and rendered; blocks for false values are dropped."""
+        template = "A$if(bib)$ [$title$] $endif(bib)$B$if(toc)$ toc $endif(toc)$C$if(other)$ kept $endif(other)$"
+        context = {'bib': True, 'toc': False, 'title': 'T'}
+        self.assertEqual(self.file_manager.render_template(template, context), "A [T] BC$if(other)$ kept $endif(other)$")
+        self.assertEqual(self.file_manager.render_template(template, context), sequential_reference(template, context))
+
+    def test_values_are_inserted_as_strings(self):
+        """Non-string values are rendered with str."""
+        self.assertEqual(self.file_manager.render_template("$a$/$b$/$c$", {'a': 0, 'b': None, 'c': 1.5}), "0/None/1.5")
+
+    def test_empty_context(self):
+        """Without a context the template is returned unchanged."""
+        self.assertEqual(self.file_manager.render_template("$title$ $if(x)$y$endif(x)$", {}), "$title$ $if(x)$y$endif(x)$")
+
+    def test_shipped_templates_match_sequential_reference(self):
+        """The shipped templates render as they did with the original implementation."""
+        template_dir = self.file_manager.template_dir
+        for template_name in sorted(os.listdir(template_dir)):
+            if not template_name.endswith('.tex'):
+                continue
+            template = self.file_manager.read_template(template_name)
+            for include_bibliography in (True, False):
+                context = {key: f"<{key} \\textbf{{value}}>" for key in TEMPLATE_KEYS}
+                context['include_bibliography'] = include_bibliography
+                self.assertEqual(
+                    self.file_manager.render_template(template, context),
+                    sequential_reference(template, context),
+                    template_name
+                )
+
+    def test_render_template_to_stream(self):
+        """Rendering to a stream writes the same text as render_template returns."""
+        template = "\\title{$title$}\n$if(abstract)$\\begin{abstract}$abstract$\\end{abstract}$endif(abstract)$\n"
+        context = {'title': 'T', 'abstract': 'A'}
+        sink = io.StringIO()
+        self.file_manager.render_template_to(template, context, sink)
+        self.assertEqual(sink.getvalue(), self.file_manager.render_template(template, context))
+
+    def test_render_to_file(self):
+        """A template from the template directory is rendered to an output file."""
+        template = self.file_manager.read_template('philosophical_paper.tex')
+        context = {key: key.upper() for key in TEMPLATE_KEYS}
+        output_path = self.file_manager.render_to_file('philosophical_paper.tex', context, 'out.tex')
+        self.assertEqual(output_path, os.path.join(self.temp_dir, 'out.tex'))
+        with open(output_path, encoding='utf-8', newline='') as f:
+            self.assertEqual(f.read(), sequential_reference(template, context))
+
+
+class TestOutputDirectory(unittest.TestCase):
+    """Tests for creating the output directory."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = os.path.join(self.temp_dir, 'output')
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_deleted_directory_is_recreated(self):
+        """A file manager recreates an output directory removed after an earlier one created it."""
+        FileManager({'output_dir': self.output_dir})
+        shutil.rmtree(self.output_dir)
+        file_manager = FileManager({'output_dir': self.output_dir})
+        output_path = file_manager.write_output_file('doc.tex', 'content')
+        with open(output_path) as f:
+            self.assertEqual(f.read(), 'content')
+
+
+class TestCopyTemplates(unittest.TestCase):
+    """Tests for copying templates to the output directory."""
+
+    def setUp(self):
+        """Set up test fixtures: a template directory with two templates."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.template_dir = os.path.join(self.temp_dir, 'templates')
+        self.output_dir = os.path.join(self.temp_dir, 'output')
+        os.makedirs(self.template_dir)
+        for name in ('preamble.tex', 'bibliography.bib'):
+            with open(os.path.join(self.template_dir, name), 'w') as f:
+                f.write(f"% {name}\n")
+        self.file_manager = FileManager({'template_dir': self.template_dir, 'output_dir': self.output_dir})
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_output(self, name):
+        """Read a file from the output directory."""
+        with open(os.path.join(self.output_dir, name)) as f:
+            return f.read()
+
+    def test_copies_in_order_and_skips_missing(self):
+        """Copied paths are returned in the requested order; missing templates are skipped."""
+        paths = self.file_manager.copy_templates_to_output(['bibliography.bib', 'missing.tex', 'preamble.tex'])
+        self.assertEqual(paths, [
+            os.path.join(self.output_dir, 'bibliography.bib'),
+            os.path.join(self.output_dir, 'preamble.tex'),
+        ])
+        self.assertEqual(self.read_output('preamble.tex'), "% preamble.tex\n")
+        self.assertEqual(self.read_output('bibliography.bib'), "% bibliography.bib\n")
+
+    def test_edited_template_is_copied_again(self):
+        """A template edited after it was copied replaces the earlier copy, whatever the timestamps."""
+        self.file_manager.copy_templates_to_output(['preamble.tex'])
+        template_path = os.path.join(self.template_dir, 'preamble.tex')
+        with open(template_path, 'w') as f:
+            f.write("% edited\n")
+        os.utime(template_path, (1_000_000_000, 1_000_000_000))
+        self.file_manager.copy_templates_to_output(['preamble.tex'])
+        self.assertEqual(self.read_output('preamble.tex'), "% edited\n")
+
+    def test_copy_from_another_template_directory_is_replaced(self):
+        """A newer file copied from a different template directory does not count as up to date."""
+        other_dir = os.path.join(self.temp_dir, 'custom')
+        os.makedirs(other_dir)
+        with open(os.path.join(other_dir, 'preamble.tex'), 'w') as f:
+            f.write("CUSTOM\n")
+        FileManager({'template_dir': other_dir, 'output_dir': self.output_dir}).copy_templates_to_output(['preamble.tex'])
+        self.file_manager.copy_templates_to_output(['preamble.tex'])
+        self.assertEqual(self.read_output('preamble.tex'), "% preamble.tex\n")
+
+    def test_generated_bibliography_is_replaced(self):
+        """A bibliography written to the output directory just before is replaced by the template."""
+        with open(os.path.join(self.output_dir, 'bibliography.bib'), 'w') as f:
+            f.write("% Bibliography file copied from template on 2026-01-01 00:00:00\n\n% bibliography.bib\n")
+        self.file_manager.copy_templates_to_output(['bibliography.bib'])
+        self.assertEqual(self.read_output('bibliography.bib'), "% bibliography.bib\n")
+
+    def test_unchanged_copy_is_left_alone(self):
+        """A destination that already holds the template's contents is not rewritten."""
+        self.file_manager.copy_templates_to_output(['preamble.tex'])
+        dest_path = os.path.join(self.output_dir, 'preamble.tex')
+        os.utime(dest_path, (1_000_000_000, 1_000_000_000))
+        self.file_manager.copy_templates_to_output(['preamble.tex'])
+        self.assertEqual(os.stat(dest_path).st_mtime, 1_000_000_000)
+
+    def test_read_template_sees_edits(self):
+        """read_template returns the current contents of an edited template."""
+        self.assertEqual(self.file_manager.read_template('preamble.tex'), "% preamble.tex\n")
+        template_path = os.path.join(self.template_dir, 'preamble.tex')
+        with open(template_path, 'w') as f:
+            f.write("% edited\n")
+        mtime = os.stat(template_path).st_mtime + 10
+        os.utime(template_path, (mtime, mtime))
+        self.assertEqual(self.file_manager.read_template('preamble.tex'), "% edited\n")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the JargonProcessor.
+
+These tests pin the output of the fused replacement passes to what the
+original one-pattern-at-a-time implementation produced.
+"""
+
+import re
+import unittest
+
+from src.latex.processors.jargon_processor import JargonProcessor
+
+
+def sequential_reference(content):
+    """Apply the high objectivity replacements one pattern at a time, in the original order."""
+    for pattern, replacement in JargonProcessor.SECTION_REPLACEMENTS.items():
+        content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
+    for pattern, replacement in JargonProcessor.JARGON_REPLACEMENTS.items():
+        content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
+    for pattern, replacement in JargonProcessor.PERSPECTIVE_REPLACEMENTS:
+        content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
+    return content
+
+
+class TestSectionTitles(unittest.TestCase):
+    """Tests for section title replacements overlapping jargon."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = JargonProcessor(objectivity_level="high")
+
+    def test_perspective_contributions_titles(self):
+        """Section titles are replaced before jargon that starts earlier in the text."""
+        expected = {
+            "Kantian Perspective-Specific Contributions": "Kantian Methodological Analysis Frameworks",
+            "Cartesian Perspective-Specific Contributions": "Cartesian Methodological Analysis Frameworks",
+            "Aristotelian Perspective-Specific Contributions": "Aristotelian Methodological Analysis Frameworks",
+        }
+        for title, replaced in expected.items():
+            self.assertEqual(self.processor.process(title), replaced)
+
+    def test_titles_match_sequential_reference(self):
+        """Fused passes match the sequential replacements on section headings."""
+        titles = [
+            "## Kantian Perspective-Specific Contributions",
+            "## Cartesian Perspective-Specific Contributions",
+            "## Aristotelian Perspective-Specific Contributions",
+            "## Kantian Analysis\nThe Kantian perspective holds that noumena are unknowable.",
+            "## Cartesian Analysis\nCartesian doubt, I believe, is a Cartesian approach.",
+            "## Popperian Analysis\nI recommend the Popperian perspective.",
+        ]
+        for title in titles:
+            self.assertEqual(self.processor.process(title), sequential_reference(title))
+
+
+class TestJargonReplacement(unittest.TestCase):
+    """Tests for jargon and perspective replacements."""
+
+    def test_jargon_and_perspective(self):
+        """Jargon and first-person language are rewritten in place."""
+        processor = JargonProcessor(objectivity_level="high")
+        content = "I am Dr. Smith, Ph.D. in Ontology, and I think teleology matters."
+        self.assertEqual(
+            processor.process(content),
+            "The following analysis is presented from the perspective of Smith, Ph.D. in existence theory, "
+            "and analysis indicates functional outcome matters."
+        )
+
+    def test_report_matches_sequential_reference(self):
+        """A full critique report is rewritten as the sequential replacements rewrite it."""
+        content = (
+            "# Philosophical Critique Report\n\n"
+            "## Aristotelian Analysis\n"
+            "The telos of the argument, its final cause, depends on phronesis and eudaimonia. Aristotle would\n"
+            "question the formal cause and the material cause; I observe that the efficient cause is unclear.\n\n"
+            "## Kantian Analysis\n"
+            "The Kantian perspective separates noumena from phenomena. A priori and a posteriori claims are\n"
+            "mixed, and the transcendental argument is apodeictic. Kant would object. In my view, the\n"
+            "epistemology is thin.\n\n"
+            "## Leibnizian Analysis\n"
+            "I think the principle of sufficient reason, the Leibnizian approach, supports the ontology.\n\n"
+            "## Russellian Analysis\n"
+            "I have found that the axiology is teological. I recommend the Russellian perspective. I note that\n"
+            "Russell would agree, in my opinion.\n\n"
+            "## Cartesian Perspective-Specific Contributions\n"
+            "Cartesian doubt and the CARTESIAN APPROACH are applied. Popper would ask for the Popperian analysis.\n"
+        )
+        processor = JargonProcessor(objectivity_level="high")
+        self.assertEqual(processor.process(content), sequential_reference(content))
+
+    def test_content_without_jargon_is_unchanged(self):
+        """Content without any replacement trigger is returned as is."""
+        processor = JargonProcessor(objectivity_level="high")
+        content = "A plain paragraph about measurements."
+        self.assertEqual(processor.process(content), content)
+
+    def test_low_objectivity_skips_perspective(self):
+        """Low objectivity leaves first-person language alone."""
+        processor = JargonProcessor(objectivity_level="low")
+        self.assertEqual(processor.process("I recommend teleology."), "I recommend functional outcome.")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,465 @@
+"""
+Unit tests for the LatexCompiler.
+
+These tests exercise the PDF cache bookkeeping directly and stand in for the
+LaTeX tools where they would run, so they do not need a LaTeX installation.
+"""
+
+import itertools
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.latex.utils import latex_compiler
+from src.latex.utils.latex_compiler import LatexCompiler
+
+
+def available_compiler(config):
+    """Create a compiler that takes pdflatex as found on the PATH, without probing for it."""
+    compiler = LatexCompiler(dict(config, latex_engine='pdflatex'))
+    compiler.latex_available = True
+    return compiler
+
+
+class FakeLatexProcess:
+    """Stand-in for a LaTeX engine process streaming the given console output."""
+
+    def __init__(self, lines=(), returncode=0):
+        self.stdout = iter(lines)
+        self.returncode = returncode
+        self.killed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def kill(self):
+        self.killed = True
+
+    def wait(self):
+        return self.returncode
+
+
+class TestCacheKey(unittest.TestCase):
+    """Tests for the PDF cache key."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tex_path = os.path.join(self.temp_dir, 'doc.tex')
+        with open(self.tex_path, 'w') as f:
+            f.write('\\documentclass{article}')
+        self.fmt_dir = os.path.join(self.temp_dir, 'formats')
+        os.makedirs(self.fmt_dir)
+        self.fmt_path = os.path.join(self.fmt_dir, 'preamble.fmt')
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_compiler(self, **config):
+        """Create a compiler caching into the temporary directory."""
+        config.setdefault('pdf_cache_dir', os.path.join(self.temp_dir, 'cache'))
+        return LatexCompiler(config)
+
+    def test_key_depends_on_source(self):
+        """Changing the source changes the key."""
+        compiler = self.make_compiler()
+        key = compiler._cache_key(self.tex_path)
+        with open(self.tex_path, 'a') as f:
+            f.write('%')
+        self.assertNotEqual(compiler._cache_key(self.tex_path), key)
+
+    def test_key_depends_on_precompiled_format_contents(self):
+        """Regenerating the precompiled format under the same name changes the key."""
+        compiler = self.make_compiler(precompiled_format=self.fmt_path)
+        with open(self.fmt_path, 'wb') as f:
+            f.write(b'format built from the old preamble')
+        key = compiler._cache_key(self.tex_path)
+        with open(self.fmt_path, 'wb') as f:
+            f.write(b'format built from the new preamble')
+        self.assertNotEqual(compiler._cache_key(self.tex_path), key)
+
+    def test_missing_precompiled_format_disables_cache(self):
+        """Without a readable format file the build is not cached."""
+        compiler = self.make_compiler(precompiled_format=self.fmt_path)
+        self.assertIsNone(compiler._cache_key(self.tex_path))
+
+
+class TestCacheStore(unittest.TestCase):
+    """Tests for storing and looking up cached PDFs."""
+
+    def setUp(self):
+        """Set up test fixtures: a compiled document with recorder output."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.doc_dir = os.path.join(self.temp_dir, 'doc')
+        os.makedirs(self.doc_dir)
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        for name, contents in (('doc.tex', '\\input{preamble}'), ('preamble.tex', '% preamble'), ('doc.pdf', '%PDF-1.5 compiled')):
+            with open(os.path.join(self.doc_dir, name), 'w') as f:
+                f.write(contents)
+        with open(os.path.join(self.doc_dir, 'doc.fls'), 'w') as f:
+            f.write(f"PWD {self.doc_dir}\nINPUT doc.tex\nINPUT preamble.tex\nINPUT /usr/share/texmf/article.cls\nOUTPUT doc.pdf\n")
+        self.compiler = LatexCompiler({'pdf_cache_dir': self.cache_dir})
+        self.key = self.compiler._cache_key(os.path.join(self.doc_dir, 'doc.tex'))
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def lookup(self):
+        """Look the document up in the cache, copying a hit to out.pdf."""
+        return self.compiler._cache_lookup(self.key, self.doc_dir, os.path.join(self.temp_dir, 'out.pdf'))
+
+    def test_store_then_lookup(self):
+        """A stored PDF is found again while its dependencies are unchanged."""
+        self.assertFalse(self.lookup())
+        self.compiler._cache_store(self.key, self.doc_dir, 'doc', os.path.join(self.doc_dir, 'doc.pdf'))
+        self.assertTrue(self.lookup())
+        with open(os.path.join(self.temp_dir, 'out.pdf')) as f:
+            self.assertEqual(f.read(), '%PDF-1.5 compiled')
+
+    def test_store_prunes_to_size_limit(self):
+        """Storing a PDF prunes older entries beyond pdf_cache_max_size_mb."""
+        os.makedirs(self.cache_dir)
+        stale_path = os.path.join(self.cache_dir, 'stale.pdf')
+        with open(stale_path, 'wb') as f:
+            f.write(b'x' * 1000)
+        os.utime(stale_path, (1_000_000_000, 1_000_000_000))
+        compiler = LatexCompiler({'pdf_cache_dir': self.cache_dir, 'pdf_cache_max_size_mb': 0.0005})
+        compiler._cache_store(self.key, self.doc_dir, 'doc', os.path.join(self.doc_dir, 'doc.pdf'))
+        self.assertFalse(os.path.exists(stale_path))
+        self.assertTrue(self.lookup())
+
+    def test_changed_dependency_misses(self):
+        """Changing a recorded input next to the document invalidates the cached PDF."""
+        self.compiler._cache_store(self.key, self.doc_dir, 'doc', os.path.join(self.doc_dir, 'doc.pdf'))
+        with open(os.path.join(self.doc_dir, 'preamble.tex'), 'w') as f:
+            f.write('% changed preamble')
+        self.assertFalse(self.lookup())
+
+    def test_concurrent_stores_of_the_same_build(self):
+        """Threads storing the same build concurrently leave complete files and no temporaries."""
+        pdf_path = os.path.join(self.doc_dir, 'doc.pdf')
+        # A large PDF keeps the writes long enough to overlap
+        with open(pdf_path, 'wb') as f:
+            f.write(b'%PDF-1.5 ' + b'x' * (4 << 20))
+        threads = [
+            threading.Thread(target=lambda: [self.compiler._cache_store(self.key, self.doc_dir, 'doc', pdf_path) for _ in range(5)])
+            for _ in range(8)
+        ]
+        with self.assertNoLogs('src.latex.utils.latex_compiler', level='WARNING'):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual([name for name in os.listdir(self.cache_dir) if name.endswith('.tmp')], [])
+        self.assertTrue(self.lookup())
+
+
+class TestCachePruning(unittest.TestCase):
+    """Tests for keeping the PDF cache directory within its size limit."""
+
+    def setUp(self):
+        """Set up test fixtures: a cache directory with entries of known age."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.compiler = LatexCompiler({'pdf_cache_dir': self.temp_dir})
+        for age, name in enumerate(('newest.pdf', 'middle.pdf', 'oldest.pdf', 'oldest.json')):
+            path = os.path.join(self.temp_dir, name)
+            with open(path, 'wb') as f:
+                f.write(b'x' * 1000)
+            mtime = 1_000_000_000 - age * 100
+            os.utime(path, (mtime, mtime))
+        with open(os.path.join(self.temp_dir, 'notes.txt'), 'w') as f:
+            f.write('not a cache entry')
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_prune_removes_oldest_first(self):
+        """Entries are removed oldest first until the cache fits."""
+        self.assertEqual(self.compiler.prune_pdf_cache(2500), 2)
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['middle.pdf', 'newest.pdf', 'notes.txt'])
+
+    def test_prune_within_limit_keeps_everything(self):
+        """Nothing is removed while the cache is within its limit."""
+        self.assertEqual(self.compiler.prune_pdf_cache(4000), 0)
+
+    def test_prune_clears_cache_by_default(self):
+        """Without a limit every cache entry is removed, other files are kept."""
+        self.assertEqual(self.compiler.prune_pdf_cache(), 4)
+        self.assertEqual(os.listdir(self.temp_dir), ['notes.txt'])
+
+    def test_missing_cache_directory(self):
+        """Pruning a cache that was never created does nothing."""
+        compiler = LatexCompiler({'pdf_cache_dir': os.path.join(self.temp_dir, 'missing')})
+        self.assertEqual(compiler.prune_pdf_cache(), 0)
+
+
+class TestPrecompilePreamble(unittest.TestCase):
+    """Tests for dumping a document's preamble into a format file."""
+
+    def setUp(self):
+        """Set up test fixtures: a document with the log of its last compile."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tex_path = os.path.join(self.temp_dir, 'doc.tex')
+        with open(self.tex_path, 'w') as f:
+            f.write('\\documentclass{article}\\begin{document}x\\end{document}')
+        with open(os.path.join(self.temp_dir, 'doc.log'), 'w') as f:
+            f.write('document log')
+        self.compiler = available_compiler({'pdf_cache': False})
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def fake_ini_run(self, cmd, cwd=None, **kwargs):
+        """Stand in for the engine: write the format and log named by -jobname."""
+        jobname = next(arg.split('=', 1)[1] for arg in cmd if arg.startswith('-jobname='))
+        for suffix in ('.fmt', '.log'):
+            with open(os.path.join(cwd, jobname + suffix), 'w') as f:
+                f.write('format build')
+        return SimpleNamespace(returncode=0, stdout='', stderr='')
+
+    def test_format_build_keeps_document_log(self):
+        """The format is built under its own job name, leaving the document's log alone."""
+        with mock.patch.object(latex_compiler.subprocess, 'run', side_effect=self.fake_ini_run) as run:
+            fmt_path = self.compiler.precompile_preamble(self.tex_path)
+        self.assertEqual(fmt_path, os.path.join(self.temp_dir, 'doc_fmt.fmt'))
+        self.assertIn('-jobname=doc_fmt', run.call_args.args[0])
+        with open(os.path.join(self.temp_dir, 'doc.log')) as f:
+            self.assertEqual(f.read(), 'document log')
+
+    def test_format_is_loaded_by_name(self):
+        """Compilations with the new format load it by its job name."""
+        with mock.patch.object(latex_compiler.subprocess, 'run', side_effect=self.fake_ini_run):
+            fmt_path = self.compiler.precompile_preamble(self.tex_path)
+        compiler = available_compiler({'precompiled_format': fmt_path})
+        self.assertEqual(compiler._format_args(), [f"-fmt={os.path.join(self.temp_dir, 'doc_fmt')}"])
+
+
+class TestEngineCache(unittest.TestCase):
+    """Tests for the on-disk cache of working LaTeX engines."""
+
+    def setUp(self):
+        """Set up test fixtures: an engine cache file in a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        patcher = mock.patch.multiple(
+            latex_compiler,
+            _CACHE_DIR=self.temp_dir,
+            _ENGINE_CACHE_FILE=os.path.join(self.temp_dir, 'latex_engine.json')
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_concurrent_writes_of_the_same_process(self):
+        """Threads writing the cache at once leave a complete file and no temporaries."""
+        data = {f'/usr/bin/engine{n}': {'size': n, 'mtime': 0.0, 'version': 'x' * 1000} for n in range(500)}
+        threads = [
+            threading.Thread(target=lambda: [latex_compiler._write_engine_cache(data) for _ in range(5)])
+            for _ in range(8)
+        ]
+        with self.assertNoLogs('src.latex.utils.latex_compiler', level='DEBUG'):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(os.listdir(self.temp_dir), ['latex_engine.json'])
+        self.assertEqual(latex_compiler._read_engine_cache(), data)
+
+
+class TestLatexmk(unittest.TestCase):
+    """Tests for compiling documents with latexmk."""
+
+    def setUp(self):
+        """Set up test fixtures: a document and a compiler that finds latexmk."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tex_path = os.path.join(self.temp_dir, 'doc.tex')
+        with open(self.tex_path, 'w') as f:
+            f.write('\\documentclass{article}\\begin{document}x\\end{document}')
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_compiler(self, **config):
+        """Create a compiler that uses latexmk without probing for it."""
+        compiler = available_compiler(dict(config, pdf_cache=False))
+        compiler.latexmk_available = True
+        return compiler
+
+    def fake_latexmk_run(self, cmd, cwd=None, **kwargs):
+        """Stand in for latexmk: write the PDF of the document."""
+        with open(os.path.join(cwd, 'doc.pdf'), 'w') as f:
+            f.write('%PDF-1.5')
+        return SimpleNamespace(returncode=0, stdout='', stderr='')
+
+    def test_single_latexmk_run(self):
+        """One latexmk run in the document directory replaces the separate LaTeX and BibTeX runs."""
+        compiler = self.make_compiler(latex_runs=3)
+        with mock.patch.object(latex_compiler.subprocess, 'run', side_effect=self.fake_latexmk_run) as run, \
+                mock.patch.object(latex_compiler.subprocess, 'Popen') as popen:
+            result = compiler.compile_document(self.tex_path)
+        self.assertEqual(result, (True, os.path.join(self.temp_dir, 'doc.pdf')))
+        popen.assert_not_called()
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(
+            run.call_args.args[0],
+            ['latexmk', '-pdf', '-interaction=nonstopmode', '-halt-on-error', '-recorder', 'doc.tex']
+        )
+        self.assertEqual(run.call_args.kwargs['cwd'], self.temp_dir)
+
+    def test_options_for_the_engine(self):
+        """Disabling BibTeX and extra engine arguments are passed on to latexmk."""
+        compiler = self.make_compiler(bibtex_run=False, latex_args=['-shell-escape'])
+        with mock.patch.object(latex_compiler.subprocess, 'run', side_effect=self.fake_latexmk_run) as run:
+            compiler.compile_document(self.tex_path)
+        cmd = run.call_args.args[0]
+        self.assertIn('-bibtex-', cmd)
+        self.assertIn('-latexoption=-shell-escape', cmd)
+        self.assertEqual(cmd[-1], 'doc.tex')
+
+    def test_failed_run(self):
+        """A failing latexmk run fails the compilation."""
+        compiler = self.make_compiler()
+        failed = SimpleNamespace(returncode=12, stdout='', stderr='Latexmk: Errors, so I did not complete making targets')
+        with mock.patch.object(latex_compiler.subprocess, 'run', return_value=failed):
+            self.assertEqual(compiler.compile_document(self.tex_path), (False, f"LaTeX compilation failed for {self.tex_path}"))
+
+    def test_disabled_latexmk_is_not_probed(self):
+        """With use_latexmk off, latexmk is neither looked for nor used."""
+        compiler = available_compiler({'use_latexmk': False})
+        with mock.patch.object(compiler, '_check_engine_available') as check:
+            self.assertFalse(compiler.latexmk_available)
+        check.assert_not_called()
+
+
+class TestLatexPasses(unittest.TestCase):
+    """Tests for stopping the LaTeX passes once their output converges."""
+
+    def setUp(self):
+        """Set up test fixtures: a document and a compiler running the engine directly."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.tex_path = os.path.join(self.temp_dir, 'doc.tex')
+        with open(self.tex_path, 'w') as f:
+            f.write('\\documentclass{article}\\begin{document}\\ref{x}\\end{document}')
+        self.compiler = available_compiler({'pdf_cache': False, 'bibtex_run': False, 'keep_intermediates': True, 'latex_runs': 4})
+        self.compiler.latexmk_available = False
+        # Contents of the .aux and .log file written by each pass
+        self.passes = []
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def fake_latex_popen(self, cmd, cwd=None, **kwargs):
+        """Stand in for the engine: write the next pass's .aux and .log, and the PDF."""
+        aux, log = self.passes.pop(0)
+        for suffix, contents in (('.aux', aux), ('.log', log), ('.pdf', '%PDF-1.5')):
+            with open(os.path.join(cwd, 'doc' + suffix), 'w') as f:
+                f.write(contents)
+        return FakeLatexProcess()
+
+    def compile(self, passes):
+        """Compile the document with the given pass outputs, returning the number of passes run."""
+        self.passes = list(passes)
+        with mock.patch.object(latex_compiler.subprocess, 'Popen', side_effect=self.fake_latex_popen) as popen:
+            success, _ = self.compiler.compile_document(self.tex_path)
+        self.assertTrue(success)
+        return popen.call_count
+
+    def test_stops_once_aux_files_converge(self):
+        """A pass that leaves the auxiliary files as they were ends the compilation."""
+        self.assertEqual(self.compile([('\\newlabel{x}{1}', 'ok')] * 4), 2)
+
+    def test_unchanged_aux_files_need_one_pass(self):
+        """Auxiliary files left by an earlier compile that the first pass reproduces need no second pass."""
+        with open(os.path.join(self.temp_dir, 'doc.aux'), 'w') as f:
+            f.write('\\newlabel{x}{1}')
+        self.assertEqual(self.compile([('\\newlabel{x}{1}', 'ok')] * 4), 1)
+
+    def test_rerun_warning_forces_another_pass(self):
+        """A rerun warning in the log asks for another pass even when the auxiliary files are unchanged."""
+        with open(os.path.join(self.temp_dir, 'doc.aux'), 'w') as f:
+            f.write('\\newlabel{x}{1}')
+        rerun_log = 'LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.'
+        self.assertEqual(self.compile([('\\newlabel{x}{1}', rerun_log)] + [('\\newlabel{x}{1}', 'ok')] * 3), 2)
+
+    def test_changing_aux_files_use_every_pass(self):
+        """Passes continue up to latex_runs while the auxiliary files keep changing."""
+        self.assertEqual(self.compile([(f'\\newlabel{{x}}{{{n}}}', 'ok') for n in range(4)]), 4)
+
+
+class TestStreamedLatexOutput(unittest.TestCase):
+    """Tests for scanning the engine's output while it runs."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.compiler = available_compiler({'pdf_cache': False})
+        self.lines_read = []
+
+    def console(self, lines, more=1000):
+        """Yield the given console lines, followed by more lines of output, recording what was read."""
+        for line in itertools.chain(lines, (f"[page {n}]\n" for n in range(more))):
+            self.lines_read.append(line)
+            yield line
+
+    def run_latex(self, process):
+        """Run the engine as the given fake process, returning the result and the logged errors."""
+        with mock.patch.object(latex_compiler.subprocess, 'Popen', return_value=process) as popen, \
+                self.assertLogs('src.latex.utils.latex_compiler', level='INFO') as logs:
+            result = self.compiler._run_latex('doc.tex')
+        self.assertEqual(popen.call_args.kwargs['stderr'], latex_compiler.subprocess.STDOUT)
+        return result, [record.getMessage() for record in logs.records if record.levelname == 'ERROR']
+
+    def test_stops_at_the_end_of_the_first_error(self):
+        """The engine is stopped once an error message reaches its input line."""
+        process = FakeLatexProcess(self.console([
+            "This is pdfTeX, Version 3.141592653\n",
+            "! Undefined control sequence.\n",
+            "<argument> \\foo\n",
+            "l.5 \\section{\\foo}\n",
+        ]))
+        result, errors = self.run_latex(process)
+        self.assertFalse(result)
+        self.assertTrue(process.killed)
+        self.assertEqual(len(self.lines_read), 4)
+        self.assertIn("Error output: ! Undefined control sequence.\n<argument> \\foo\nl.5 \\section{\\foo}", errors)
+
+    def test_long_error_messages_are_cut_short(self):
+        """Without an input line the error message is cut at its first lines."""
+        process = FakeLatexProcess(self.console(["! Emergency stop.\n"]))
+        result, errors = self.run_latex(process)
+        self.assertFalse(result)
+        self.assertTrue(process.killed)
+        self.assertEqual(len(self.lines_read), latex_compiler._MAX_ERROR_LINES)
+
+    def test_clean_output_is_read_to_the_end(self):
+        """Output without an error message is read to the end and the pass succeeds."""
+        process = FakeLatexProcess(self.console(["This is pdfTeX, Version 3.141592653\n"], more=50))
+        result, errors = self.run_latex(process)
+        self.assertTrue(result)
+        self.assertFalse(process.killed)
+        self.assertEqual(len(self.lines_read), 51)
+        self.assertEqual(errors, [])
+
+    def test_failed_exit_without_error_message(self):
+        """A non-zero exit status fails the pass even without an error message in the output."""
+        result, errors = self.run_latex(FakeLatexProcess(self.console([], more=3), returncode=1))
+        self.assertFalse(result)
+        self.assertEqual(errors, ["LaTeX compilation failed with return code 1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
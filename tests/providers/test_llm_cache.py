@@ -0,0 +1,149 @@
+"""
+Unit tests for the LLM response cache.
+
+This module contains tests for LLMCache and the shared caches returned by
+get_llm_cache.
+"""
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from src.providers import llm_cache
+from src.providers.llm_cache import LLMCache, get_llm_cache
+
+
+class TestLLMCache(unittest.TestCase):
+    """Tests for the LLMCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'cache', 'llm_cache.json')
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_make_key_is_order_independent(self):
+        """Keys depend on the request parts, not on their order."""
+        key = LLMCache.make_key(model='o1', prompt='p', context={'a': 1, 'b': 2})
+        self.assertEqual(key, LLMCache.make_key(context={'b': 2, 'a': 1}, prompt='p', model='o1'))
+        self.assertNotEqual(key, LLMCache.make_key(model='o3-mini', prompt='p', context={'a': 1, 'b': 2}))
+        self.assertEqual(len(key), 64)
+
+    def test_memory_backend(self):
+        """Values are returned until the cache is discarded, and no file is written."""
+        cache = LLMCache('memory', self.path)
+        self.assertIsNone(cache.get('k'))
+        cache.set('k', {'result': {'score': 50}, 'model': 'o1'})
+        self.assertEqual(cache.get('k'), {'result': {'score': 50}, 'model': 'o1'})
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_file_backend_persists(self):
+        """Entries written by one cache are read back by a new one."""
+        LLMCache('file', self.path).set('k', ['value'])
+        self.assertEqual(LLMCache('file', self.path).get('k'), ['value'])
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['llm_cache.json'])
+
+    def test_unreadable_file_is_ignored(self):
+        """A corrupt cache file behaves like an empty cache and is replaced on write."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        cache = LLMCache('file', self.path)
+        self.assertIsNone(cache.get('k'))
+        cache.set('k', 1)
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)['k']['value'], 1)
+
+    def test_non_object_file_is_ignored(self):
+        """A cache file that does not hold a JSON object behaves like an empty cache."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            json.dump([['k', 1]], f)
+        cache = LLMCache('file', self.path)
+        self.assertIsNone(cache.get('k'))
+        cache.set('k', 1)
+        self.assertEqual(LLMCache('file', self.path).get('k'), 1)
+
+    def test_malformed_entries_are_misses(self):
+        """Entries without a value or a numeric timestamp are misses and are dropped on the next write."""
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            json.dump({'no_time': {'value': 1}, 'bad_time': {'value': 1, 'stored_at': 'x'}, 'no_value': {'stored_at': 1}, 'scalar': 3}, f)
+        cache = LLMCache('file', self.path, ttl_seconds=10)
+        for key in ('no_time', 'bad_time', 'no_value', 'scalar'):
+            self.assertIsNone(cache.get(key), key)
+        cache.set('k', 1)
+        with open(self.path) as f:
+            self.assertEqual(sorted(json.load(f)), ['k'])
+
+    def test_concurrent_writers_share_a_file(self):
+        """Caches writing the same file concurrently leave a complete file and no temporaries."""
+        caches = [LLMCache('file', self.path) for _ in range(4)]
+
+        def write(cache, index):
+            for n in range(25):
+                cache.set(f'{index}-{n}', 'x' * 10000)
+
+        threads = [threading.Thread(target=write, args=(cache, index)) for index, cache in enumerate(caches)]
+        with self.assertNoLogs(llm_cache.logger, level='WARNING'):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['llm_cache.json'])
+        with open(self.path) as f:
+            self.assertIsInstance(json.load(f), dict)
+
+    def test_ttl_expiry(self):
+        """Entries older than the time-to-live are misses and are dropped on the next write."""
+        cache = LLMCache('file', self.path, ttl_seconds=10)
+        with mock.patch.object(llm_cache.time, 'time', return_value=1000.0):
+            cache.set('old', 1)
+        with mock.patch.object(llm_cache.time, 'time', return_value=1005.0):
+            self.assertEqual(cache.get('old'), 1)
+        with mock.patch.object(llm_cache.time, 'time', return_value=1010.0):
+            self.assertIsNone(cache.get('old'))
+            cache.set('new', 2)
+        with open(self.path) as f:
+            self.assertEqual(sorted(json.load(f)), ['new'])
+
+    def test_zero_ttl_keeps_entries(self):
+        """A time-to-live of 0 keeps entries forever."""
+        cache = LLMCache('memory', ttl_seconds=0)
+        with mock.patch.object(llm_cache.time, 'time', return_value=0.0):
+            cache.set('k', 1)
+        self.assertEqual(cache.get('k'), 1)
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected."""
+        with self.assertRaises(ValueError):
+            LLMCache('redis')
+
+
+class TestGetLLMCache(unittest.TestCase):
+    """Tests for the get_llm_cache function."""
+
+    def test_disabled_by_default(self):
+        """No cache is returned unless caching is enabled."""
+        self.assertIsNone(get_llm_cache({}))
+        self.assertIsNone(get_llm_cache({'cache': None}))
+        self.assertIsNone(get_llm_cache({'cache': {'enabled': False, 'backend': 'memory'}}))
+
+    def test_shared_per_settings(self):
+        """Callers with the same settings share one cache."""
+        config = {'cache': {'enabled': True, 'backend': 'memory', 'ttl_seconds': 60}}
+        cache = get_llm_cache(config)
+        self.assertIs(get_llm_cache(dict(config)), cache)
+        self.assertEqual((cache.backend, cache.ttl_seconds), ('memory', 60))
+        self.assertIsNot(get_llm_cache({'cache': {'enabled': True, 'backend': 'memory', 'ttl_seconds': 30}}), cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
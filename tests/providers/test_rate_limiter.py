@@ -0,0 +1,144 @@
+"""
+Unit tests for client-side rate limiting.
+
+This module contains tests for RateLimiter, the shared limiters returned by
+get_rate_limiter, and their use by the OpenAI client.
+"""
+
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from src.providers import openai_client, rate_limiter
+from src.providers.exceptions import ApiCallError
+from src.providers.rate_limiter import RateLimiter, get_rate_limiter
+
+
+class FakeClock:
+    """Stand-in for time.monotonic and time.sleep; sleeping advances the clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the RateLimiter class."""
+
+    def setUp(self):
+        """Set up test fixtures: a fake clock for the limiter module."""
+        self.clock = FakeClock()
+        patcher = mock.patch.multiple(rate_limiter.time, monotonic=self.clock.monotonic, sleep=self.clock.sleep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_rate(self):
+        """Calls within the burst start at once; later calls are spaced at the rate."""
+        limiter = RateLimiter(rps=2, burst=3)
+        for _ in range(5):
+            with limiter:
+                pass
+        self.assertEqual(self.clock.sleeps, [0.5, 0.5])
+        self.assertEqual(limiter.stats(), {'calls': 5, 'delayed_calls': 2, 'wait_seconds': 1.0})
+
+    def test_waiting_callers_reserve_successive_tokens(self):
+        """Callers that overdraw the bucket together wait for successive tokens."""
+        limiter = RateLimiter(rps=4)
+        with limiter._lock:
+            delays = [limiter._reserve_token() for _ in range(4)]
+        self.assertEqual(delays, [0.0, 0.25, 0.5, 0.75])
+
+    def test_bucket_refills_up_to_burst(self):
+        """Idle time refills the bucket, but never beyond the burst."""
+        limiter = RateLimiter(rps=1, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        self.clock.now += 100
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [1.0])
+
+    def test_no_rate(self):
+        """Without rps calls are never delayed."""
+        limiter = RateLimiter()
+        for _ in range(100):
+            limiter.acquire()
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertEqual(limiter.stats()['calls'], 100)
+
+    def test_max_concurrent(self):
+        """A call waits for a free slot when max_concurrent calls are in flight."""
+        limiter = RateLimiter(max_concurrent=1)
+        started = threading.Event()
+        limiter.acquire()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), started.set()))
+        thread.start()
+        self.assertFalse(started.wait(0.1))
+        limiter.release()
+        self.assertTrue(started.wait(5))
+        thread.join()
+        limiter.release()
+
+
+class TestGetRateLimiter(unittest.TestCase):
+    """Tests for the get_rate_limiter function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.config = {'api': {'rate_limits': {'openai': {'rps': 2, 'burst': 5, 'max_concurrent': 8}}}}
+
+    def test_unlimited_provider(self):
+        """Providers without rate limits get no limiter."""
+        self.assertIsNone(get_rate_limiter('openai', 'o1', {}))
+        self.assertIsNone(get_rate_limiter('anthropic', 'claude', self.config))
+
+    def test_shared_per_provider_and_model(self):
+        """Callers for the same provider and model share one limiter."""
+        limiter = get_rate_limiter('openai', 'o1', self.config)
+        self.assertEqual((limiter.rps, limiter.burst), (2.0, 5))
+        self.assertIs(get_rate_limiter('openai', 'o1', self.config), limiter)
+        self.assertIsNot(get_rate_limiter('openai', 'o3-mini', self.config), limiter)
+
+
+class TestOpenAIRateLimit(unittest.TestCase):
+    """Tests for rate limiting in call_openai_with_retry."""
+
+    def test_each_retry_attempt_takes_a_token(self):
+        """Every attempt of a retried call waits for the limiter."""
+        attempts = []
+
+        def create(**params):
+            attempts.append(params)
+            if len(attempts) < 3:
+                raise ApiCallError("429 Too Many Requests")
+            message = SimpleNamespace(content='{"score": 1}')
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+        config = {
+            'api': {
+                'openai': {'model': 'gpt-4o-rate-limit-test', 'resolved_key': 'test-key'},
+                'rate_limits': {'openai': {'max_concurrent': 1}},
+            }
+        }
+        with mock.patch.object(openai_client, '_get_client', return_value=client), \
+                mock.patch('src.providers.decorators.time.sleep'):
+            result = openai_client.call_openai_with_retry(prompt_template='p', context={}, config=config, is_structured=True)
+
+        self.assertEqual(result, ({'score': 1}, 'gpt-4o-rate-limit-test'))
+        self.assertEqual(len(attempts), 3)
+        limiter = get_rate_limiter('openai', 'gpt-4o-rate-limit-test', config)
+        self.assertEqual(limiter.stats()['calls'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,15 @@
 # tests/test_output_formatter.py
 
 import pytest
+import asyncio
 import os
 import sys
+import threading
+from unittest import mock
 
 # Adjust path to import from the new src directory
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src import output_formatter
 from src.output_formatter import format_critique_output
 
 def test_format_with_findings():
@@ -103,3 +107,115 @@ def test_format_missing_assessment_key():
     assert "- Assessment data unavailable." in output # Check default value
     assert "IDENTIFIED POINTS:" in output
     assert "=== END OF REPORT ===" in output
+
+
+# --- Reports built from the council's critique data, with the Judge mocked ---
+
+JUDGE_RESULT = {
+    'judge_summary_text': ' The argument holds with caveats. ',
+    'judge_overall_score': '81',
+    'judge_score_justification': ' Minor gaps remain. '
+}
+
+def make_critique_data():
+    """Critique data for one agent with a critique tree."""
+    return {
+        'adjusted_critique_trees': [{
+            'agent_style': 'Kantian',
+            'critique_tree': {
+                'claim': 'The premise is unsupported.', 'severity': 'High', 'confidence': 0.8,
+                'sub_critiques': [{'claim': 'No source is cited.', 'severity': 'Low', 'confidence': 0.5}]
+            }
+        }],
+        'arbitration_adjustments': [],
+        'arbiter_overall_score': 70,
+        'arbiter_score_justification': 'Sound overall.',
+        'score_metrics': {'high_severity_points': 1, 'low_severity_points': 1}
+    }
+
+def test_judge_call_overlaps_body_rendering():
+    """The Judge call is in flight while the rest of the report is formatted, and its result is reported."""
+    body_rendering = threading.Event()
+    render_body = output_formatter._render_body
+
+    def judge(prompt_template, context, config, is_structured=False):
+        # Only answers once the body is being rendered on the calling thread
+        assert body_rendering.wait(5)
+        return JUDGE_RESULT, 'judge-model'
+
+    def rendering_body(*args):
+        body_rendering.set()
+        return render_body(*args)
+
+    with mock.patch.object(output_formatter, 'call_with_retry', side_effect=judge) as call_llm, \
+            mock.patch.object(output_formatter, '_render_body', side_effect=rendering_body):
+        output = format_critique_output(make_critique_data(), 'Original text.', {}, now='2024-01-02 03:04:05')
+
+    assert call_llm.call_count == 1
+    assert call_llm.call_args.kwargs['context']['original_content'] == 'Original text.'
+    assert output.startswith("# Critique Assessment Report\n**Generated:** 2024-01-02 03:04:05\n")
+    assert "## Overall Judge Summary\nThe argument holds with caveats.\n" in output
+    assert "- **Final Judge Score:** 81/100\n  - *Justification:* Minor gaps remain.\n" in output
+    assert "- **Expert Arbiter Score:** 70/100\n  - *Justification:* Sound overall.\n" in output
+    assert "### Agent: Kantian\n* **Claim:** The premise is unsupported.\n" in output
+    assert "  - **Claim:** No source is cited.\n" in output
+    assert output.endswith("--- End of Report ---")
+
+
+def test_no_critiques_skip_the_judge():
+    """Without any critique tree the Judge is not called and a canned summary is reported."""
+    critique_data = {
+        'adjusted_critique_trees': [
+            {'agent_style': 'Kantian', 'error': 'Timed out'},
+            {'agent_style': 'Cartesian', 'critique_tree': {}},
+        ],
+        'arbitration_adjustments': []
+    }
+    with mock.patch.object(output_formatter, 'call_with_retry') as call_llm:
+        output = format_critique_output(critique_data, 'Original text.', {}, now='2024-01-02 03:04:05')
+
+    call_llm.assert_not_called()
+    assert "## Overall Judge Summary\nNo critiques produced; judge summary skipped.\n" in output
+    assert "- **Final Judge Score:** N/A/100\n- **Expert Arbiter Score:** N/A/100\n" in output
+    assert "## Expert Arbiter Adjustment Summary" not in output
+    assert "### Agent: Kantian\n- **Error during critique:** Timed out\n" in output
+    assert "### Agent: Cartesian\n- No valid critique tree generated.\n" in output
+
+def test_async_reports_match_and_overlap():
+    """Awaited reports match the synchronous ones, and their Judge calls run at the same time."""
+    in_flight = threading.Barrier(3, timeout=5)
+
+    def judge(prompt_template, context, config, is_structured=False):
+        # Only answers once every report's Judge call has started
+        in_flight.wait()
+        return JUDGE_RESULT, 'judge-model'
+
+    async def format_all(documents):
+        return await asyncio.gather(*(
+            output_formatter.format_critique_output_async(make_critique_data(), document, {}, now='2024-01-02 03:04:05')
+            for document in documents
+        ))
+
+    documents = ['First text.', 'Second text.', 'Third text.']
+    with mock.patch.object(output_formatter, 'call_with_retry', side_effect=judge) as call_llm:
+        outputs = asyncio.run(format_all(documents))
+    assert sorted(call.kwargs['context']['original_content'] for call in call_llm.call_args_list) == documents
+
+    with mock.patch.object(output_formatter, 'call_with_retry', return_value=(JUDGE_RESULT, 'judge-model')):
+        expected = format_critique_output(make_critique_data(), 'First text.', {}, now='2024-01-02 03:04:05')
+    assert outputs == [expected] * 3
+    assert "- **Final Judge Score:** 81/100\n" in expected
+
+def test_judge_cache_only_for_deterministic_calls():
+    """Judge responses are reused at temperature 0, and never when temperature is left to the provider."""
+    critique_data = make_critique_data()
+    for temperature, expected_calls in ((0, 1), (None, 2)):
+        config = {
+            'api': {'openai': {'model': 'o1', 'temperature': temperature}},
+            'cache': {'enabled': True, 'backend': 'memory'}
+        }
+        document = f'Text judged at temperature {temperature}.'
+        with mock.patch.object(output_formatter, 'call_with_retry', return_value=(JUDGE_RESULT, 'judge-model')) as call_llm:
+            results = [output_formatter.generate_judge_summary_and_score(document, critique_data, config) for _ in range(2)]
+        assert call_llm.call_count == expected_calls
+        assert results == [('The argument holds with caveats.', 81, 'Minor gaps remain.')] * 2